@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import itertools
 import random
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from desloppify.engine.planning.core import CONFIDENCE_ORDER
@@ -161,38 +163,93 @@ def render_show_results(
     print()
 
 
-def show_fix_dry_run_samples(entries: list[dict], results: list[dict]) -> None:
-    """Print sampled before/after context for fix --dry-run."""
-    random.seed(42)
-    print(colorize("\n  ── Sample changes (before → after) ──", "cyan"))
-    for result in random.sample(results, min(5, len(results))):
-        _print_fix_file_sample(result, entries)
-    removed_count = sum(len(r["removed"]) for r in results)
+def show_fix_dry_run_samples(
+    entries: list[dict], results: list[dict], removed_count: int | None = None
+) -> None:
+    """Print sampled before/after context for fix --dry-run.
+
+    ``removed_count`` may be passed when the caller already totalled
+    ``results``; it is recomputed otherwise.
+    """
+    sampled = results if len(results) <= 5 else random.Random(42).sample(results, 5)
+    removed_by_file = {result["file"]: set(result["removed"]) for result in sampled}
+    entries_by_file: dict[str, list[dict]] = defaultdict(list)
+    for entry in entries:
+        removed_names = removed_by_file.get(entry["file"])
+        if removed_names is not None and entry.get("name", "") in removed_names:
+            entries_by_file[entry["file"]].append(entry)
+    out = [colorize("\n  ── Sample changes (before → after) ──", "cyan")]
+    if sampled:
+        # File reads overlap on slow/network filesystems; printing stays ordered.
+        with ThreadPoolExecutor(max_workers=len(sampled)) as executor:
+            windows = list(
+                executor.map(
+                    lambda result: _load_fix_file_sample(
+                        result["file"], entries_by_file.get(result["file"], [])
+                    ),
+                    sampled,
+                )
+            )
+        for result, file_windows in zip(sampled, windows, strict=True):
+            out.extend(_format_fix_file_sample(result["file"], file_windows))
+    if removed_count is None:
+        removed_count = sum(len(r["removed"]) for r in results)
     if len(entries) > removed_count:
-        print(colorize(f"\n  Note: {len(entries) - removed_count} of {len(entries)} entries were skipped (complex patterns, rest elements, etc.)", "dim"))
-    print()
+        out.append(colorize(f"\n  Note: {len(entries) - removed_count} of {len(entries)} entries were skipped (complex patterns, rest elements, etc.)", "dim"))
+    out.append("")
+    print("\n".join(out))
 
 
-def _print_fix_file_sample(result: dict, entries: list[dict]) -> None:
-    filepath, removed_set = result["file"], set(result["removed"])
-    try:
-        path = Path(filepath) if Path(filepath).is_absolute() else Path(".") / filepath
-        lines = path.read_text().splitlines()
-    except (OSError, UnicodeDecodeError):
-        return
+def _read_raw_lines(path: Path, end: int) -> list[bytes]:
+    """Read the first *end* raw lines of a file without decoding or loading the rest."""
+    with path.open("rb") as handle:
+        return list(itertools.islice(handle, end))
 
-    file_entries = [entry for entry in entries if entry["file"] == filepath and entry.get("name", "") in removed_set]
-    shown = 0
+
+def _load_fix_file_sample(
+    filepath: str, file_entries: list[dict]
+) -> list[tuple[dict, int, int, list[str]]]:
+    """Read context windows for up to two fixed entries of one sampled file.
+
+    The file is read once as bytes up to the last needed line; only the
+    displayed lines are decoded.
+    """
+    path = Path(filepath) if Path(filepath).is_absolute() else Path(".") / filepath
+    targets: list[tuple[dict, int, int]] = []
     for entry in file_entries[:2]:
         line_idx = entry.get("line", entry.get("detail", {}).get("line", 0)) - 1
-        if line_idx < 0 or line_idx >= len(lines):
+        if line_idx >= 0:
+            targets.append((entry, line_idx, max(0, line_idx - 1)))
+    if not targets:
+        return []
+    try:
+        raw = _read_raw_lines(path, max(line_idx + 2 for _, line_idx, _ in targets))
+    except OSError:
+        return []
+    windows: list[tuple[dict, int, int, list[str]]] = []
+    for entry, line_idx, ctx_s in targets:
+        if line_idx >= len(raw):
             continue
-        if shown == 0:
-            print(colorize(f"\n  {rel(filepath)}:", "cyan"))
+        window = [
+            line.decode("utf-8", "replace").rstrip("\r\n")
+            for line in raw[ctx_s : line_idx + 2]
+        ]
+        windows.append((entry, line_idx, ctx_s, window))
+    return windows
+
+
+def _format_fix_file_sample(
+    filepath: str, windows: list[tuple[dict, int, int, list[str]]]
+) -> list[str]:
+    if not windows:
+        return []
+    out = [colorize(f"\n  {rel(filepath)}:", "cyan")]
+    arrow = colorize("  →", "red")
+    for entry, line_idx, ctx_s, window in windows:
         name = entry.get("name", entry.get("summary", "?"))
-        ctx_s, ctx_e = max(0, line_idx - 1), min(len(lines), line_idx + 2)
-        print(colorize(f"    {name} (line {line_idx + 1}):", "dim"))
-        for idx in range(ctx_s, ctx_e):
-            marker = colorize("  →", "red") if idx == line_idx else "   "
-            print(f"    {marker} {idx+1:4d}  {lines[idx][:90]}")
-        shown += 1
+        out.append(colorize(f"    {name} (line {line_idx + 1}):", "dim"))
+        out.extend(
+            f"    {arrow if idx == line_idx else '   '} {idx+1:4d}  {text[:90]}"
+            for idx, text in enumerate(window, start=ctx_s)
+        )
+    return out
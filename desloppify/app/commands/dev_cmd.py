@@ -4,11 +4,23 @@ from __future__ import annotations
 
 import ast
 import keyword
+import os
 import re
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
 
 from desloppify.app.commands.dev_scaffold_templates import build_scaffold_files
 from desloppify.utils import PROJECT_ROOT, colorize, safe_write_text
 
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python 3.10
+    tomllib = None  # type: ignore[assignment]
+
+_LANG_NAME_RE = re.compile(r"[a-z][a-z0-9_]*")
+_EXT_RE = re.compile(r"\.[a-z0-9]+")
+
 
 def cmd_dev(args) -> None:
     """Dispatch developer subcommands."""
@@ -24,7 +36,7 @@ def cmd_dev(args) -> None:
 
 def _normalize_lang_name(raw: str) -> str:
     name = raw.strip().lower().replace("-", "_")
-    if not re.fullmatch(r"[a-z][a-z0-9_]*", name):
+    if not _LANG_NAME_RE.fullmatch(name):
         raise ValueError("language name must match [a-z][a-z0-9_]*")
     if keyword.iskeyword(name):
         raise ValueError(f"language name cannot be a Python keyword: {name}")
@@ -32,25 +44,19 @@ def _normalize_lang_name(raw: str) -> str:
 
 
 def _normalize_extensions(values: list[str] | None) -> list[str]:
-    out: list[str] = []
+    out: dict[str, None] = {}
     for val in values or []:
         ext = val.strip()
         if not ext:
             continue
         if not ext.startswith("."):
             ext = "." + ext
-        if not re.fullmatch(r"\.[a-z0-9]+", ext):
+        if not _EXT_RE.fullmatch(ext):
             raise ValueError(f"invalid extension: {val!r}")
-        out.append(ext)
+        out[ext] = None
     if not out:
         raise ValueError("at least one --extension is required")
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for ext in out:
-        if ext not in seen:
-            seen.add(ext)
-            deduped.append(ext)
-    return deduped
+    return list(out)
 
 
 def _normalize_markers(values: list[str] | None) -> list[str]:
@@ -63,7 +69,16 @@ def _normalize_markers(values: list[str] | None) -> list[str]:
 
 
 def _class_name(lang_name: str) -> str:
-    return "".join(part.capitalize() for part in lang_name.split("_")) + "Config"
+    buf: list[str] = []
+    upper = True
+    for ch in lang_name:
+        if ch == "_":
+            upper = True
+            continue
+        buf.append(ch.upper() if upper else ch)
+        upper = False
+    buf.append("Config")
+    return "".join(buf)
 
 
 def _template_files(
@@ -86,17 +101,58 @@ def _render_array(items: list[str]) -> str:
     return ", ".join(repr(x) for x in items)
 
 
-def _append_toml_array_item(text: str, key: str, value: str) -> str:
-    pattern = re.compile(
+@lru_cache(maxsize=64)
+def _toml_array_re(key: str) -> re.Pattern[str]:
+    return re.compile(
         rf"(^\s*{re.escape(key)}\s*=\s*\[)(.*?)(\]\s*$)",
         re.MULTILINE | re.DOTALL,
     )
-    match = pattern.search(text)
+
+
+def _parse_toml_string_list(raw: str) -> list[str] | None:
+    """Parse a flat, comma-separated list of quoted strings.
+
+    Returns None when ``raw`` holds anything other than plain string literals
+    (escapes, bare values, comments) so callers can fall back to a full parse.
+    """
+    items: list[str] = []
+    quote: str | None = None
+    start = 0
+    expect_item = True
+    for idx, ch in enumerate(raw):
+        if quote is not None:
+            if ch == "\\":
+                return None
+            if ch == quote:
+                items.append(raw[start:idx])
+                quote = None
+            continue
+        if ch in "\"'":
+            if not expect_item:
+                return None
+            quote = ch
+            start = idx + 1
+            expect_item = False
+        elif ch == ",":
+            if expect_item:
+                return None
+            expect_item = True
+        elif not ch.isspace():
+            return None
+    if quote is not None:
+        return None
+    return items
+
+
+def _append_toml_array_item(text: str, key: str, value: str) -> str:
+    match = _toml_array_re(key).search(text)
     if not match:
         return text
 
     raw = match.group(2).strip()
-    parsed = ast.literal_eval("[" + raw + "]") if raw else []
+    parsed = _parse_toml_string_list(raw)
+    if parsed is None:
+        parsed = ast.literal_eval("[" + raw + "]")
     if not isinstance(parsed, list):
         return text
     if value in parsed:
@@ -107,18 +163,32 @@ def _append_toml_array_item(text: str, key: str, value: str) -> str:
     return text[: match.start()] + replacement + text[match.end() :]
 
 
+def _pytest_testpaths(text: str) -> list[str] | None:
+    """Return pytest ``testpaths`` from pyproject text, or None if unknown."""
+    if tomllib is None:
+        return None
+    try:
+        data = tomllib.loads(text)
+    except tomllib.TOMLDecodeError:
+        return None
+    testpaths = (
+        data.get("tool", {}).get("pytest", {}).get("ini_options", {}).get("testpaths")
+    )
+    return testpaths if isinstance(testpaths, list) else None
+
+
 def _wire_pyproject(lang_name: str) -> bool:
     pyproject_path = PROJECT_ROOT / "pyproject.toml"
     if not pyproject_path.is_file():
         return False
 
     original = pyproject_path.read_text()
-    updated = original
-    updated = _append_toml_array_item(
-        updated,
-        "testpaths",
-        f"desloppify/languages/{lang_name}/tests",
-    )
+    test_path = f"desloppify/languages/{lang_name}/tests"
+    testpaths = _pytest_testpaths(original)
+    if testpaths is not None and test_path in testpaths:
+        return False
+
+    updated = _append_toml_array_item(original, "testpaths", test_path)
 
     if updated != original:
         safe_write_text(pyproject_path, updated)
@@ -145,12 +215,17 @@ def _cmd_scaffold_lang(args) -> None:
         )
 
     files = _template_files(lang_name, extensions, markers, default_src)
+    by_dir: dict[Path, list[tuple[str, str]]] = defaultdict(list)
     for rel_path, content in files.items():
         target = lang_dir / rel_path
-        target.parent.mkdir(parents=True, exist_ok=True)
-        if target.exists() and not force:
-            continue
-        safe_write_text(target, content)
+        by_dir[target.parent].append((target.name, content))
+    for parent, entries in by_dir.items():
+        parent.mkdir(parents=True, exist_ok=True)
+        existing = set() if force else set(os.listdir(parent))
+        for name, content in entries:
+            if name in existing:
+                continue
+            safe_write_text(parent / name, content)
 
     wired = _wire_pyproject(lang_name) if wire_pyproject else False
 
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
 from desloppify import state as state_mod
-from desloppify.app.commands.helpers.lang import resolve_lang
 from desloppify.app.commands.helpers.query import write_query
 from desloppify.app.commands.helpers.runtime import command_runtime
 from desloppify.intelligence import narrative as narrative_mod
@@ -18,10 +19,18 @@ from .io import _load_state, _save_state
 from .options import _COMMAND_POST_FIX
 
 
+class _RelPathCache(dict):
+    """Lazily memoize rel() for the files touched by one fix run."""
+
+    def __missing__(self, filepath: str) -> str:
+        value = self[filepath] = rel(filepath)
+        return value
+
+
 def _detect(fixer, path: Path) -> list[dict]:
     print(colorize(f"\nDetecting {fixer.label}...", "dim"), file=sys.stderr)
     entries = fixer.detect(path)
-    file_count = len(set(e["file"] for e in entries))
+    file_count = len({e["file"] for e in entries})
     print(
         colorize(
             f"  Found {len(entries)} {fixer.label} across {file_count} files\n", "dim"
@@ -29,23 +38,30 @@ def _detect(fixer, path: Path) -> list[dict]:
         file=sys.stderr,
     )
     return entries
-def _print_fix_summary(fixer, results, total_items, total_lines, dry_run):
+
+
+def _print_fix_summary(
+    fixer, results, total_items, total_lines, dry_run, rel_paths=None
+):
+    if rel_paths is None:
+        rel_paths = _RelPathCache()
     verb = fixer.dry_verb if dry_run else fixer.verb
     lines_str = f" ({total_lines} lines)" if total_lines else ""
-    print(
+    out = [
         colorize(
             f"\n  {verb} {total_items} {fixer.label} across {len(results)} files{lines_str}\n",
             "bold",
         )
-    )
+    ]
     for r in results[:30]:
         syms = ", ".join(r["removed"][:5])
         if len(r["removed"]) > 5:
             syms += f" (+{len(r['removed']) - 5})"
         extra = f"  ({r['lines_removed']} lines)" if r.get("lines_removed") else ""
-        print(f"  {rel(r['file'])}{extra}  →  {syms}")
+        out.append(f"  {rel_paths[r['file']]}{extra}  →  {syms}")
     if len(results) > 30:
-        print(f"  ... and {len(results) - 30} more files")
+        out.append(f"  ... and {len(results) - 30} more files")
+    print("\n".join(out))
 
 def _apply_and_report(
     args,
@@ -57,12 +73,15 @@ def _apply_and_report(
     total_items,
     lang,
     skip_reasons=None,
+    rel_paths=None,
 ):
     sp, state = _load_state(args)
     prev_overall = state_mod.get_overall_score(state)
     prev_objective = state_mod.get_objective_score(state)
     prev_strict = state_mod.get_strict_score(state)
-    resolved_ids = _resolve_fixer_results(state, results, fixer.detector, fixer_name)
+    resolved_ids = _resolve_fixer_results(
+        state, results, fixer.detector, fixer_name, rel_paths=rel_paths
+    )
     _save_state(state, sp)
 
     new_overall = state_mod.get_overall_score(state)
@@ -93,11 +112,11 @@ def _apply_and_report(
 
     if skip_reasons is None:
         skip_reasons = {}
-    fix_lang = resolve_lang(args)
-    fix_lang_name = fix_lang.name if fix_lang else None
     narrative = narrative_mod.compute_narrative(
         state,
-        context=narrative_mod.NarrativeContext(lang=fix_lang_name, command="fix"),
+        context=narrative_mod.NarrativeContext(
+            lang=lang.name if lang else None, command="fix"
+        ),
     )
     typecheck_cmd = getattr(lang, "typecheck_cmd", "")
     if typecheck_cmd:
@@ -127,14 +146,12 @@ def _apply_and_report(
     _print_fix_retro(
         fixer_name, len(entries), total_items, len(resolved_ids), skip_reasons
     )
-def _report_dry_run(args, fixer_name, entries, results, total_items):
+def _report_dry_run(args, fixer_name, entries, results, total_items, lang_name=None):
     runtime = command_runtime(args)
-    fix_lang = resolve_lang(args)
-    fix_lang_name = fix_lang.name if fix_lang else None
     state = runtime.state
     narrative = narrative_mod.compute_narrative(
         state,
-        context=narrative_mod.NarrativeContext(lang=fix_lang_name, command="fix"),
+        context=narrative_mod.NarrativeContext(lang=lang_name, command="fix"),
     )
     write_query(
         {
@@ -162,45 +179,112 @@ def _report_dry_run(args, fixer_name, entries, results, total_items):
         ]:
             print(colorize(f"  - {q}", "dim"))
 
-def _resolve_fixer_results(state, results, detector, fixer_name):
+def _resolve_fixer_results(state, results, detector, fixer_name, rel_paths=None):
     resolved_ids = []
+    findings = state["findings"]
+    note = f"auto-fixed by desloppify fix {fixer_name}"
+    open_by_file = _index_open_findings(findings, detector)
+    if not open_by_file:
+        return resolved_ids
+    if rel_paths is None:
+        rel_paths = _RelPathCache()
     for r in results:
-        rfile = rel(r["file"])
+        rfile = rel_paths[r["file"]]
+        open_syms = open_by_file.get(rfile)
+        if not open_syms:
+            continue
+        # Popping from the per-file index makes repeated symbols free misses.
         for sym in r["removed"]:
-            fid = f"{detector}::{rfile}::{sym}"
-            if fid in state["findings"] and state["findings"][fid]["status"] == "open":
-                state["findings"][fid]["status"] = "fixed"
-                state["findings"][fid]["note"] = (
-                    f"auto-fixed by desloppify fix {fixer_name}"
-                )
-                resolved_ids.append(fid)
+            fid = open_syms.pop(sym, None)
+            if fid is None:
+                continue
+            findings[fid]["status"] = "fixed"
+            findings[fid]["note"] = note
+            resolved_ids.append(fid)
+            if not open_syms:
+                break
     return resolved_ids
 
-def _warn_uncommitted_changes():
+
+def _index_open_findings(findings: dict, detector: str) -> dict[str, dict[str, str]]:
+    """Map file -> {symbol: finding id} for open findings of one detector."""
+    prefix = f"{detector}::"
+    open_by_file: dict[str, dict[str, str]] = {}
+    for fid, finding in findings.items():
+        if finding["status"] != "open" or not fid.startswith(prefix):
+            continue
+        rfile, sep, sym = fid[len(prefix) :].partition("::")
+        if sep:
+            open_by_file.setdefault(rfile, {})[sym] = fid
+    return open_by_file
+
+
+_GIT_STATUS_TIMEOUT = 5  # seconds; a stalled git must not block `fix`
+
+
+def _has_uncommitted_changes() -> bool:
+    """Return True as soon as `git status --porcelain` emits any output.
+
+    Only the first byte is read, on a helper thread so the wait is bounded by
+    ``_GIT_STATUS_TIMEOUT``; git is stopped once the answer is known.
+    """
+    proc = subprocess.Popen(
+        ["git", "status", "--porcelain"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    first: list[bytes] = []
+    reader = threading.Thread(
+        target=lambda: first.append(proc.stdout.read(1)), daemon=True
+    )
     try:
-        r = subprocess.run(
-            ["git", "status", "--porcelain"], capture_output=True, text=True, timeout=5
-        )
-        if r.stdout.strip():
-            print(
-                colorize(
-                    "\n  ⚠ You have uncommitted changes. Consider running:", "yellow"
-                )
-            )
-            print(
-                colorize(
-                    "    git add -A && git commit -m 'pre-fix checkpoint' && git push",
-                    "yellow",
-                )
-            )
-            print(
-                colorize(
-                    "    This ensures you can revert if the fixer produces unexpected results.\n",
-                    "dim",
-                )
-            )
+        reader.start()
+        reader.join(_GIT_STATUS_TIMEOUT)
+        if reader.is_alive():
+            raise subprocess.TimeoutExpired(proc.args, _GIT_STATUS_TIMEOUT)
+    finally:
+        # SIGTERM first: git removes its lock files on a catchable signal.
+        proc.terminate()
+        try:
+            proc.wait(timeout=_GIT_STATUS_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        reader.join(_GIT_STATUS_TIMEOUT)
+        if not reader.is_alive():
+            proc.stdout.close()
+    return bool(first and first[0])
+
+
+def _check_uncommitted_changes() -> bool:
+    """Return True when the working tree is dirty (False if unknown or skipped)."""
+    if os.environ.get("DESLOPPIFY_SKIP_GIT_CHECK", "").lower() in ("1", "true", "yes"):
+        return False
+    try:
+        return _has_uncommitted_changes()
     except (subprocess.CalledProcessError, OSError, subprocess.TimeoutExpired):
-        return
+        return False
+
+
+def _print_uncommitted_warning() -> None:
+    print(colorize("\n  ⚠ You have uncommitted changes. Consider running:", "yellow"))
+    print(
+        colorize(
+            "    git add -A && git commit -m 'pre-fix checkpoint' && git push",
+            "yellow",
+        )
+    )
+    print(
+        colorize(
+            "    This ensures you can revert if the fixer produces unexpected results.\n",
+            "dim",
+        )
+    )
+
+
+def _warn_uncommitted_changes():
+    if _check_uncommitted_changes():
+        _print_uncommitted_warning()
 
 def _cascade_unused_import_cleanup(
     path: Path,
@@ -210,11 +294,11 @@ def _cascade_unused_import_cleanup(
     *,
     lang=None,
 ):
-    if not lang or "unused-imports" not in getattr(lang, "fixers", {}):
+    fixer = getattr(lang, "fixers", {}).get("unused-imports") if lang else None
+    if fixer is None:
         print(colorize("  Cascade: no unused-imports fixer for this language", "dim"))
         return
 
-    fixer = lang.fixers["unused-imports"]
     print(colorize("\n  Running cascading import cleanup...", "dim"), file=sys.stderr)
     entries = fixer.detect(path)
     if not entries:
@@ -230,8 +314,11 @@ def _cascade_unused_import_cleanup(
     if not results:
         print(colorize("  Cascade: no orphaned imports found", "dim"))
         return
-    n_removed = sum(len(r["removed"]) for r in results)
-    n_lines = sum(r["lines_removed"] for r in results)
+    n_removed = 0
+    n_lines = 0
+    for r in results:
+        n_removed += len(r["removed"])
+        n_lines += r["lines_removed"]
     print(
         colorize(
             f"  Cascade: removed {n_removed} now-orphaned imports "
@@ -257,6 +344,13 @@ _SKIP_REASON_LABELS = {
     "out_of_range": "line out of range (stale data?)",
     "other": "other patterns (needs manual review)",
 }
+# Line templates are built once; colour is applied at print time because
+# colorize() depends on whether stdout is a TTY.
+_SKIP_REASON_LINES = {
+    reason: "    {:4d}  " + label.replace("{", "{{").replace("}", "}}")
+    for reason, label in _SKIP_REASON_LABELS.items()
+}
+
 
 def _print_fix_retro(
     fixer_name: str,
@@ -266,22 +360,24 @@ def _print_fix_retro(
     skip_reasons: dict[str, int] | None = None,
 ):
     skipped = detected - fixed
-    print(colorize("\n  ── Post-fix check ──", "dim"))
-    print(
+    out = [
+        colorize("\n  ── Post-fix check ──", "dim"),
         colorize(
             f"  Fixed {fixed}/{detected} ({skipped} skipped, {resolved} findings resolved)",
             "dim",
-        )
-    )
+        ),
+    ]
     if skip_reasons and skipped > 0:
-        print(colorize(f"\n  Skip reasons ({skipped} total):", "dim"))
+        out.append(colorize(f"\n  Skip reasons ({skipped} total):", "dim"))
         for reason, count in sorted(skip_reasons.items(), key=lambda x: -x[1]):
-            print(
-                colorize(
-                    f"    {count:4d}  {_SKIP_REASON_LABELS.get(reason, reason)}", "dim"
-                )
+            template = _SKIP_REASON_LINES.get(reason)
+            line = (
+                template.format(count)
+                if template is not None
+                else f"    {count:4d}  {reason}"
             )
-        print()
+            out.append(colorize(line, "dim"))
+        out.append("")
     checklist = [
         "Run your language typecheck/build command — does it still build?",
         "Spot-check a few changed files — do the edits look correct?",
@@ -295,6 +391,8 @@ def _print_fix_retro(
         "Are there cascading effects? (e.g., removing vars may orphan imports)",
         "`git diff --stat` — review before committing. Anything surprising?",
     ]
-    print(colorize("  Checklist:", "dim"))
-    for i, item in enumerate(checklist, 1):
-        print(colorize(f"  {i}. {item}", "dim"))
+    out.append(colorize("  Checklist:", "dim"))
+    out.extend(
+        colorize(f"  {i}. {item}", "dim") for i, item in enumerate(checklist, 1)
+    )
+    print("\n".join(out))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from desloppify.app.commands._show_terminal import show_fix_dry_run_samples
@@ -10,10 +11,12 @@ from desloppify.utils import colorize
 
 from .apply_flow import (
     _apply_and_report,
+    _check_uncommitted_changes,
     _detect,
     _print_fix_summary,
+    _print_uncommitted_warning,
+    _RelPathCache,
     _report_dry_run,
-    _warn_uncommitted_changes,
 )
 from .options import _load_fixer
 from .review_flow import _cmd_fix_review
@@ -31,9 +34,15 @@ def cmd_fix(args) -> None:
 
     lang, fixer = _load_fixer(args, fixer_name)
 
-    if not dry_run:
-        _warn_uncommitted_changes()
-    entries = _detect(fixer, path)
+    if dry_run:
+        entries = _detect(fixer, path)
+    else:
+        # The git status check is subprocess-bound; overlap it with detection.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            dirty = executor.submit(_check_uncommitted_changes)
+            entries = _detect(fixer, path)
+        if dirty.result():
+            _print_uncommitted_warning()
     if not entries:
         print(colorize(f"No {fixer.label} found.", "green"))
         return
@@ -45,12 +54,18 @@ def cmd_fix(args) -> None:
     else:
         results = raw
         skip_reasons = {}
-    total_items = sum(len(r["removed"]) for r in results)
-    total_lines = sum(r.get("lines_removed", 0) for r in results)
-    _print_fix_summary(fixer, results, total_items, total_lines, dry_run)
+    total_items = 0
+    total_lines = 0
+    for r in results:
+        total_items += len(r["removed"])
+        total_lines += r.get("lines_removed", 0)
+    rel_paths = _RelPathCache()
+    _print_fix_summary(
+        fixer, results, total_items, total_lines, dry_run, rel_paths=rel_paths
+    )
 
     if dry_run and results:
-        show_fix_dry_run_samples(entries, results)
+        show_fix_dry_run_samples(entries, results, removed_count=total_items)
 
     if not dry_run:
         _apply_and_report(
@@ -63,7 +78,15 @@ def cmd_fix(args) -> None:
             total_items,
             lang,
             skip_reasons,
+            rel_paths=rel_paths,
         )
     else:
-        _report_dry_run(args, fixer_name, entries, results, total_items)
+        _report_dry_run(
+            args,
+            fixer_name,
+            entries,
+            results,
+            total_items,
+            lang_name=lang.name if lang else None,
+        )
     print()
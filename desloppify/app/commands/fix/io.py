@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 from desloppify import state as state_mod
-from desloppify.app.commands.helpers.state import state_path
+from desloppify.app.commands.helpers.runtime import load_command_state
 
 
 def _load_state(args) -> tuple[str, dict]:
-    sp = state_path(args)
-    return sp, state_mod.load_state(sp)
+    return load_command_state(args)
 
 
 def _save_state(state: dict, state_path_value: str) -> None:
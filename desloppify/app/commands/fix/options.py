@@ -18,15 +18,16 @@ def _load_fixer(args, fixer_name: str) -> tuple[LangConfig, FixerConfig]:
     if not lang:
         print(colorize("Could not detect language. Use --lang to specify.", "red"))
         sys.exit(1)
-    if not lang.fixers:
+    fixers = lang.fixers
+    if not fixers:
         print(colorize(f"No auto-fixers available for {lang.name}.", "red"))
         sys.exit(1)
-    if fixer_name not in lang.fixers:
-        available = ", ".join(sorted(lang.fixers.keys()))
+    fc = fixers.get(fixer_name)
+    if fc is None:
+        available = ", ".join(sorted(fixers.keys()))
         print(colorize(f"Unknown fixer: {fixer_name}", "red"))
         print(colorize(f"  Available: {available}", "dim"))
         sys.exit(1)
-    fc = lang.fixers[fixer_name]
     if fixer_name in _COMMAND_POST_FIX and not fc.post_fix:
         fc = dataclasses.replace(fc, post_fix=_COMMAND_POST_FIX[fixer_name])
     return lang, fc
@@ -110,8 +110,28 @@ def auto_detect_lang_name(args) -> str | None:
     return detected
 
 
+_RESOLVED_LANG_ATTR = "_resolved_lang"
+
+
 def resolve_lang(args) -> LangConfig | None:
-    """Resolve language config from args, with auto-detection fallback."""
+    """Resolve language config from args, with auto-detection fallback.
+
+    The result is memoised on *args* keyed by ``(lang, path)``, so repeated
+    calls within one invocation skip auto-detection and plugin instantiation.
+    """
+    key = (getattr(args, "lang", None), getattr(args, "path", None))
+    cached = getattr(args, _RESOLVED_LANG_ATTR, None)
+    if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == key:
+        return cached[1]
+    lang = _resolve_lang_uncached(args)
+    try:
+        setattr(args, _RESOLVED_LANG_ATTR, (key, lang))
+    except AttributeError:
+        pass
+    return lang
+
+
+def _resolve_lang_uncached(args) -> LangConfig | None:
     lang_name = getattr(args, "lang", None)
     if lang_name is None:
         lang_name = auto_detect_lang_name(args)
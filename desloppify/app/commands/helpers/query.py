@@ -8,9 +8,9 @@ from desloppify.utils import PROJECT_ROOT
 QUERY_FILE = PROJECT_ROOT / ".desloppify" / "query.json"
 
 
-def write_query(data: dict) -> None:
+def write_query(data: dict) -> str | None:
     """Write structured query output to .desloppify/query.json."""
-    _core_write_query(data, query_file=QUERY_FILE)
+    return _core_write_query(data, query_file=QUERY_FILE)
 
 
 __all__ = ["QUERY_FILE", "write_query"]
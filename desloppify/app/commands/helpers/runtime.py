@@ -35,4 +35,30 @@ def command_runtime(args) -> CommandRuntime:
     return CommandRuntime(config=config, state=state, state_path=sp)
 
 
-__all__ = ["CommandRuntime", "command_runtime"]
+def preloaded_state(args) -> tuple[Path | None, dict] | None:
+    """Return ``(state_path, state)`` already loaded by the CLI, if any.
+
+    Lets handlers that mutate and save state reuse the dispatcher's parse
+    instead of reading the state file a second time.
+    """
+    runtime = getattr(args, "runtime", None)
+    if isinstance(runtime, CommandRuntime):
+        return runtime.state_path, runtime.state
+    return None
+
+
+def load_command_state(args) -> tuple[Path | None, dict]:
+    """Return ``(state_path, state)``, loading the state file only if not preloaded."""
+    preloaded = preloaded_state(args)
+    if preloaded is not None:
+        return preloaded
+    sp = state_path(args)
+    return sp, state_mod.load_state(sp)
+
+
+__all__ = [
+    "CommandRuntime",
+    "command_runtime",
+    "load_command_state",
+    "preloaded_state",
+]
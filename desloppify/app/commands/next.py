@@ -122,7 +122,7 @@ def _get_items(args, state: dict, config: dict) -> None:
     payload["subjective_measures"] = [
         row for row in payload["scorecard_dimensions"] if row.get("subjective")
     ]
-    write_query(payload)
+    rendered = write_query(payload)
 
     output_file = getattr(args, "output", None)
     if output_file:
@@ -132,6 +132,7 @@ def _get_items(args, state: dict, config: dict) -> None:
             len(items),
             safe_write_text_fn=utils_mod.safe_write_text,
             colorize_fn=colorize,
+            rendered=rendered,
         ):
             return
         raise SystemExit(1)
@@ -78,10 +78,17 @@ def write_output_file(
     *,
     safe_write_text_fn,
     colorize_fn,
+    rendered: str | None = None,
 ) -> bool:
-    """Persist payload to file and print success/failure hints."""
+    """Persist payload to file and print success/failure hints.
+
+    ``rendered`` is the already-serialized payload (e.g. from ``write_query``);
+    when given it is written as-is instead of re-encoding ``payload``.
+    """
     try:
-        safe_write_text_fn(output_file, json.dumps(payload, indent=2) + "\n")
+        if rendered is None:
+            rendered = json.dumps(payload, indent=2) + "\n"
+        safe_write_text_fn(output_file, rendered)
         print(colorize_fn(f"Wrote {item_count} items to {output_file}", "green"))
     except OSError as exc:
         payload["output_error"] = str(exc)
@@ -8,8 +8,10 @@ import sys
 from desloppify import state as state_mod
 from desloppify.app.commands.helpers.lang import resolve_lang
 from desloppify.app.commands.helpers.query import write_query
-from desloppify.app.commands.helpers.runtime import command_runtime
-from desloppify.app.commands.helpers.state import state_path
+from desloppify.app.commands.helpers.runtime import (
+    command_runtime,
+    load_command_state,
+)
 from desloppify.core import config as config_mod
 from desloppify.engine.work_queue_internal.core import ATTEST_EXAMPLE
 from desloppify.intelligence import narrative as narrative_mod
@@ -39,8 +41,7 @@ def cmd_resolve(args: argparse.Namespace) -> None:
     attestation = getattr(args, "attest", None)
     _validate_resolve_inputs(args, attestation)
 
-    sp = state_path(args)
-    state = state_mod.load_state(sp)
+    sp, state = load_command_state(args)
     _enforce_batch_wontfix_confirmation(
         state,
         args,
@@ -118,8 +119,7 @@ def cmd_ignore_pattern(args: argparse.Namespace) -> None:
         _show_attestation_requirement("Ignore", attestation, ATTEST_EXAMPLE)
         sys.exit(1)
 
-    sp = state_path(args)
-    state = state_mod.load_state(sp)
+    sp, state = load_command_state(args)
 
     config = command_runtime(args).config
     config_mod.add_ignore_pattern(config, args.pattern)
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 from pathlib import Path
 
 from desloppify import languages as lang_api
 from desloppify import state as state_mod
-from desloppify.utils import DEFAULT_EXCLUSIONS, colorize, read_file_text
+from desloppify.utils import (
+    DEFAULT_EXCLUSIONS,
+    colorize,
+    count_files_lines,
+    read_file_text,
+    safe_write_text,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -72,24 +80,102 @@ def _audit_excluded_dirs(
     return stale_findings
 
 
-def _collect_codebase_metrics(lang, path: Path) -> dict | None:
-    """Collect LOC/file/directory counts for the configured language."""
+def _loc_cache_file(state_path: Path | None, lang_name: str) -> Path:
+    """Per-language LOC cache beside the state file, never inside it."""
+    state_dir = state_path.parent if state_path else state_mod.STATE_DIR
+    return state_dir / f"loc_cache-{lang_name}.json"
+
+
+def _load_loc_cache(cache_file: Path) -> dict[str, list[int]]:
+    """Load a LOC cache written by ``_save_loc_cache``; empty when absent or bad."""
+    try:
+        data = json.loads(cache_file.read_text())
+    except (OSError, ValueError) as exc:
+        logger.debug("Ignoring LOC cache %s: %s", cache_file, exc)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_loc_cache(cache_file: Path, loc_cache: dict[str, list[int]]) -> None:
+    """Best-effort write; a missing cache only costs re-reading files next scan."""
+    try:
+        safe_write_text(cache_file, json.dumps(loc_cache, separators=(",", ":")))
+    except OSError as exc:
+        logger.debug("Could not write LOC cache %s: %s", cache_file, exc)
+
+
+def _stat_signature(filepath: str) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for *filepath*, or None when unreadable."""
+    try:
+        st = os.stat(filepath)
+    except OSError as exc:
+        logger.debug(
+            "Skipping unreadable file %s while collecting scan metrics: %s",
+            filepath,
+            exc,
+        )
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _collect_codebase_metrics(
+    lang, path: Path, loc_cache: dict[str, list[int]] | None = None
+) -> dict | None:
+    """Collect LOC/file/directory counts for the configured language.
+
+    When *loc_cache* is given (``{file: [mtime_ns, size, loc]}``, kept in its
+    own file beside the state), files whose stat signature is unchanged reuse
+    the cached LOC, so an unchanged tree costs one ``stat`` per file. Entries
+    under *path* that are no longer scanned are dropped; entries for other scan
+    paths are kept. Only changed files are read, via ``count_files_lines``.
+    """
     if not lang or not lang.file_finder:
         return None
     files = lang.file_finder(path)
+    previous = loc_cache if loc_cache is not None else {}
+
+    entries: list[list[int] | None] = []
+    misses: list[tuple[int, str, tuple[int, int]]] = []
+    for filepath in files:
+        signature = _stat_signature(filepath)
+        cached = previous.get(filepath)
+        if signature is None:
+            entries.append(None)
+        elif (
+            isinstance(cached, list)
+            and len(cached) == 3
+            and cached[0] == signature[0]
+            and cached[1] == signature[1]
+        ):
+            entries.append(cached)
+        else:
+            misses.append((len(entries), filepath, signature))
+            entries.append(None)
+
+    if misses:
+        counts = count_files_lines([Path(filepath) for _, filepath, _ in misses])
+        for (idx, _, signature), loc in zip(misses, counts, strict=True):
+            if loc is not None:
+                entries[idx] = [signature[0], signature[1], loc]
+
+    refreshed: dict[str, list[int]] = {}
     total_loc = 0
     dirs = set()
-    for filepath in files:
-        try:
-            total_loc += len(Path(filepath).read_text().splitlines())
-            dirs.add(str(Path(filepath).parent))
-        except (OSError, UnicodeDecodeError) as exc:
-            total_loc += 0
-            logger.debug(
-                "Skipping unreadable file %s while collecting scan metrics: %s",
-                filepath,
-                exc,
-            )
+    for filepath, entry in zip(files, entries, strict=True):
+        if entry is None:
+            continue
+        refreshed[filepath] = entry
+        total_loc += entry[2]
+        dirs.add(os.path.dirname(filepath))
+    if loc_cache is not None:
+        scan_root = os.path.join(os.path.abspath(path), "")
+        for filepath in [
+            f
+            for f in loc_cache
+            if f not in refreshed and os.path.abspath(f).startswith(scan_root)
+        ]:
+            del loc_cache[filepath]
+        loc_cache.update(refreshed)
     return {
         "total_files": len(files),
         "total_loc": total_loc,
@@ -125,7 +125,7 @@ def show_dimension_deltas(
     if not moved:
         return
 
-    print(colorize_fn("  Moved:", "dim"))
+    out = [colorize_fn("  Moved:", "dim")]
     for name, old, new, delta, old_s, new_s, s_delta in sorted(
         moved, key=lambda item: item[3]
     ):
@@ -138,13 +138,14 @@ def show_dimension_deltas(
                 f"  strict: {old_s:.1f}→{new_s:.1f}% ({s_sign}{s_delta:.1f}%)",
                 "dim",
             )
-        print(
+        out.append(
             colorize_fn(
                 f"    {name:<22} {old:.1f}% → {new:.1f}%  ({sign}{delta:.1f}%)", color
             )
             + strict_str
         )
-    print()
+    out.append("")
+    print("\n".join(out))
 
 
 def show_low_dimension_hints(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from itertools import compress
 from typing import Callable, Protocol
 
 
@@ -19,6 +21,14 @@ class _RegistryMod(Protocol):
     def display_order(self) -> list[str]: ...
 
 
+def _fold_labels(counts: Counter, label_of: dict[str, str]) -> Counter:
+    """Re-key detector counts by display label, summing merged detectors."""
+    folded: Counter = Counter()
+    for detector, count in counts.items():
+        folded[label_of.get(detector, detector)] += count
+    return folded
+
+
 def show_detector_progress(
     state: dict,
     *,
@@ -32,16 +42,15 @@ def show_detector_progress(
     if not findings:
         return
 
-    by_det: dict[str, dict] = {}
-    for finding in findings.values():
-        detector = finding.get("detector", "unknown")
-        if detector in narrative_mod.STRUCTURAL_MERGE:
-            detector = "structural"
-        if detector not in by_det:
-            by_det[detector] = {"open": 0, "total": 0}
-        by_det[detector]["total"] += 1
-        if finding["status"] == "open":
-            by_det[detector]["open"] += 1
+    # Column-wise aggregation: a detector column plus an open mask, counted in
+    # C via Counter/compress. Structural merging then folds the handful of
+    # distinct detector keys rather than relabelling every finding.
+    rows = findings.values()
+    detectors = [finding.get("detector", "unknown") for finding in rows]
+    open_mask = [finding["status"] == "open" for finding in rows]
+    label_of = dict.fromkeys(narrative_mod.STRUCTURAL_MERGE, "structural")
+    totals = _fold_labels(Counter(detectors), label_of)
+    open_counts = _fold_labels(Counter(compress(detectors, open_mask)), label_of)
 
     detector_order = [
         registry_mod.DETECTORS[d].display
@@ -49,14 +58,16 @@ def show_detector_progress(
         if d in registry_mod.DETECTORS
     ]
     order_map = {display: i for i, display in enumerate(detector_order)}
-    sorted_dets = sorted(by_det.items(), key=lambda item: order_map.get(item[0], 99))
+    sorted_dets = sorted(totals, key=lambda detector: order_map.get(detector, 99))
 
-    print(colorize_fn("  Detector progress (open findings by detector):", "dim"))
-    print(colorize_fn("  " + "─" * 50, "dim"))
+    out = [
+        colorize_fn("  Detector progress (open findings by detector):", "dim"),
+        colorize_fn("  " + "─" * 50, "dim"),
+    ]
     bar_len = 15
-    for detector, data in sorted_dets:
-        total = data["total"]
-        open_count = data["open"]
+    for detector in sorted_dets:
+        total = totals[detector]
+        open_count = open_counts[detector]
         addressed = total - open_count
         pct = round(addressed / total * 100) if total else 100
 
@@ -78,11 +89,12 @@ def show_detector_progress(
             if open_count > 0
             else colorize_fn("  ✓", "green")
         )
-        print(
+        out.append(
             f"  {det_label} {bar} {pct:3d}%  {open_str}  {colorize_fn(f'/ {total}', 'dim')}"
         )
 
-    print()
+    out.append("")
+    print("\n".join(out))
 
 
 __all__ = ["show_detector_progress"]
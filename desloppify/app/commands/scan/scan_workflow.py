@@ -15,12 +15,18 @@ from desloppify.app.commands.scan.scan_helpers import (
     _audit_excluded_dirs,
     _collect_codebase_metrics,
     _effective_include_slow,
+    _load_loc_cache,
+    _loc_cache_file,
     _resolve_scan_profile,
+    _save_loc_cache,
     _warn_explicit_lang_with_no_files,
 )
 from desloppify.engine.planning import core as plan_mod
 from desloppify.engine.planning.scan import PlanScanOptions
 from desloppify.engine.work_queue_internal import issues as issues_mod
+from desloppify.intelligence.review.dimensions.metadata import (
+    resettable_default_dimensions,
+)
 from desloppify.languages.framework.runtime import LangRunOverrides, make_lang_run
 from desloppify.utils import colorize
 
@@ -31,10 +37,6 @@ _STRUCTURAL_LOC_GROWTH_THRESHOLD = 50
 
 def _subjective_reset_dimensions(*, lang_name: str | None = None) -> tuple[str, ...]:
     """Resolve subjective dimensions that should reset on scan baseline reset."""
-    from desloppify.intelligence.review.dimensions.metadata import (
-        resettable_default_dimensions,
-    )
-
     return resettable_default_dimensions(lang_name=lang_name)
 
 
@@ -333,6 +335,21 @@ def _augment_with_stale_wontfix_findings(
     return augmented, monitored
 
 
+def _collect_codebase_metrics_with_loc_cache(runtime: ScanRuntime) -> dict | None:
+    """Collect codebase metrics, reusing per-file LOC from the on-disk cache."""
+    # Older versions kept this cache inside the scoring state.
+    runtime.state.pop("loc_cache", None)
+    if not runtime.lang:
+        return _collect_codebase_metrics(runtime.lang, runtime.path)
+    cache_file = _loc_cache_file(runtime.state_path, runtime.lang.name)
+    loc_cache = _load_loc_cache(cache_file)
+    previous = dict(loc_cache)
+    metrics = _collect_codebase_metrics(runtime.lang, runtime.path, loc_cache=loc_cache)
+    if loc_cache != previous:
+        _save_loc_cache(cache_file, loc_cache)
+    return metrics
+
+
 def run_scan_generation(runtime: ScanRuntime) -> tuple[list[dict], dict, dict | None]:
     """Run detector pipeline and return findings, potentials, and codebase metrics."""
     utils_mod.enable_file_cache()
@@ -349,7 +366,7 @@ def run_scan_generation(runtime: ScanRuntime) -> tuple[list[dict], dict, dict |
     finally:
         utils_mod.disable_file_cache()
 
-    codebase_metrics = _collect_codebase_metrics(runtime.lang, runtime.path)
+    codebase_metrics = _collect_codebase_metrics_with_loc_cache(runtime)
     _warn_explicit_lang_with_no_files(
         runtime.args, runtime.lang, runtime.path, codebase_metrics
     )
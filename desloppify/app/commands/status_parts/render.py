@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import heapq
 
 from desloppify import state as state_mod
 from desloppify.app.commands.helpers.query import write_query
@@ -26,7 +26,7 @@ from desloppify.scoring import (
     compute_score_impact,
     merge_potentials,
 )
-from desloppify.utils import colorize, get_area, print_table
+from desloppify.utils import colorize, format_table, get_area, print_table
 
 
 def show_tier_progress_table(by_tier: dict) -> None:
@@ -361,49 +361,51 @@ def show_agent_plan(narrative: dict) -> None:
 
 def show_structural_areas(state: dict):
     """Show structural debt grouped by area when T3/T4 debt is significant."""
-    findings = state_mod.path_scoped_findings(
+    findings = state_mod.iter_path_scoped_findings(
         state.get("findings", {}), state.get("scan_path")
     )
 
-    structural = [
-        f
-        for f in findings.values()
-        if f["tier"] in (3, 4) and f["status"] in ("open", "wontfix")
-    ]
-
-    if len(structural) < 5:
-        return
-
-    areas: dict[str, list] = defaultdict(list)
-    for f in structural:
+    # One pass over findings: per-area [items, t3, t4, open, wontfix, weight].
+    areas: dict[str, list[int]] = {}
+    structural_count = 0
+    for f in findings:
+        tier = f["tier"]
+        status = f["status"]
+        if tier not in (3, 4) or status not in ("open", "wontfix"):
+            continue
+        structural_count += 1
         area = get_area(str(f.get("file", "")))
-        areas[area].append(f)
+        counts = areas.get(area)
+        if counts is None:
+            counts = areas[area] = [0, 0, 0, 0, 0, 0]
+        counts[0] += 1
+        counts[1 if tier == 3 else 2] += 1
+        counts[3 if status == "open" else 4] += 1
+        counts[5] += tier
+
+    if structural_count < 5:
+        return
 
     if len(areas) < 2:
         return
 
-    sorted_areas = sorted(areas.items(), key=lambda x: -sum(f["tier"] for f in x[1]))
+    top_areas = heapq.nlargest(15, areas.items(), key=lambda x: x[1][5])
 
-    print(colorize("\n  ── Structural Debt by Area ──", "bold"))
-    print(
+    out = [
+        colorize("\n  ── Structural Debt by Area ──", "bold"),
         colorize(
             "  Create a task doc for each area → farm to sub-agents for decomposition",
             "dim",
-        )
-    )
-    print()
+        ),
+        "",
+    ]
 
     rows = []
-    for area, area_findings in sorted_areas[:15]:
-        t3 = sum(1 for f in area_findings if f["tier"] == 3)
-        t4 = sum(1 for f in area_findings if f["tier"] == 4)
-        open_count = sum(1 for f in area_findings if f["status"] == "open")
-        debt_count = sum(1 for f in area_findings if f["status"] == "wontfix")
-        weight = sum(f["tier"] for f in area_findings)
+    for area, (items, t3, t4, open_count, debt_count, weight) in top_areas:
         rows.append(
             [
                 area,
-                str(len(area_findings)),
+                str(items),
                 f"T3:{t3} T4:{t4}",
                 str(open_count),
                 str(debt_count),
@@ -411,25 +413,32 @@ def show_structural_areas(state: dict):
             ]
         )
 
-    print_table(
-        ["Area", "Items", "Tiers", "Open", "Debt", "Weight"], rows, [42, 6, 10, 5, 5, 7]
+    out.extend(
+        format_table(
+            ["Area", "Items", "Tiers", "Open", "Debt", "Weight"],
+            rows,
+            [42, 6, 10, 5, 5, 7],
+        )
     )
 
-    remaining = len(sorted_areas) - 15
+    remaining = len(areas) - 15
     if remaining > 0:
-        print(colorize(f"\n  ... and {remaining} more areas", "dim"))
+        out.append(colorize(f"\n  ... and {remaining} more areas", "dim"))
 
-    print(colorize("\n  Workflow:", "dim"))
-    print(colorize("    1. desloppify show <area> --status wontfix --top 50", "dim"))
-    print(
+    out.append(colorize("\n  Workflow:", "dim"))
+    out.append(
+        colorize("    1. desloppify show <area> --status wontfix --top 50", "dim")
+    )
+    out.append(
         colorize(
             "    2. Create tasks/<date>-<area-name>.md with decomposition plan", "dim"
         )
     )
-    print(
+    out.append(
         colorize("    3. Farm each task doc to a sub-agent for implementation", "dim")
     )
-    print()
+    out.append("")
+    print("\n".join(out))
 
 
 def show_review_summary(state: dict):
@@ -46,11 +46,11 @@ def _zone_show(args):
         files, lang.zone_rules, rel_fn=rel, overrides=overrides or None
     )
 
-    # Group files by zone
+    # Group relative paths by zone; rel() runs once per file (sort key + display).
     by_zone: dict[str, list[str]] = {}
-    for f in sorted(files, key=lambda f: rel(f)):
-        zone = zone_map.get(f)
-        by_zone.setdefault(zone.value, []).append(f)
+    pairs = zip(map(rel, files), files, strict=True)
+    for rp, f in sorted(pairs, key=lambda item: item[0]):
+        by_zone.setdefault(zone_map.get(f).value, []).append(rp)
 
     total = len(files)
     print(colorize(f"\nZone classifications ({total} files)\n", "bold"))
@@ -60,8 +60,7 @@ def _zone_show(args):
         if not zone_files:
             continue
         print(colorize(f"  {zone_val} ({len(zone_files)} files)", "bold"))
-        for f in zone_files:
-            rp = rel(f)
+        for rp in zone_files:
             is_override = rp in overrides
             suffix = colorize(" (override)", "cyan") if is_override else ""
             print(f"    {rp}{suffix}")
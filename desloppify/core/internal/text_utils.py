@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import logging
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 PROJECT_ROOT = Path(os.environ.get("DESLOPPIFY_ROOT", Path.cwd())).resolve()
 
+logger = logging.getLogger(__name__)
+
+# Below this many files a thread pool costs more than the reads it overlaps.
+_PARALLEL_MIN_FILES = 32
+
 
 def read_code_snippet(
     filepath: str,
@@ -44,8 +53,64 @@ def read_code_snippet(
     return "\n".join(parts)
 
 
+def count_lines(data: bytes) -> int:
+    """Count lines in raw file bytes the way ``str.splitlines()`` would for LF/CRLF text.
+
+    Avoids decoding and building a line list when only the count is needed.
+    """
+    if not data:
+        return 0
+    return data.count(b"\n") + (0 if data.endswith(b"\n") else 1)
+
+
+# Line boundaries ``str.splitlines()`` honours beyond LF and CRLF (ASCII subset).
+_EXTRA_LINE_BREAKS = re.compile(rb"[\x0b\x0c\x1c-\x1e]|\r(?!\n)")
+
+
+def count_lines_is_exact(data: bytes) -> bool:
+    """True when ``count_lines(data)`` equals the decoded ``splitlines()`` count."""
+    return data.isascii() and not _EXTRA_LINE_BREAKS.search(data)
+
+
+def count_file_lines(path: Path) -> int:
+    """Return ``len(path.read_text().splitlines())`` without decoding when possible.
+
+    ASCII files using only LF/CRLF endings are counted straight from the bytes;
+    anything else falls back to the decoded count so results (and decode errors)
+    stay identical.
+    """
+    data = path.read_bytes()
+    if count_lines_is_exact(data):
+        return count_lines(data)
+    return len(path.read_text().splitlines())
+
+
+def _count_file_lines_or_none(path: Path) -> int | None:
+    try:
+        return count_file_lines(path)
+    except (OSError, UnicodeDecodeError) as exc:
+        logger.debug("Skipping unreadable file %s while counting lines: %s", path, exc)
+        return None
+
+
+def count_files_lines(paths: list[Path]) -> list[int | None]:
+    """Line counts for *paths* in order, None for unreadable files.
+
+    Larger batches are read on a thread pool, since the work is I/O-bound.
+    """
+    if len(paths) < _PARALLEL_MIN_FILES:
+        return [_count_file_lines_or_none(p) for p in paths]
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_count_file_lines_or_none, paths, chunksize=16))
+
+
+@lru_cache(maxsize=8192)
 def get_area(filepath: str) -> str:
-    """Derive an area name from a file path (generic: first 2 path components)."""
+    """Derive an area name from a file path (generic: first 2 path components).
+
+    Memoised: it is a pure function of the path, and findings repeat paths heavily.
+    """
     text = (filepath or "").strip()
     if not text:
         return "(unknown)"
@@ -14,22 +14,27 @@ from desloppify.utils import safe_write_text
 logger = logging.getLogger(__name__)
 
 
-def write_query(data: dict, *, query_file: Path) -> None:
-    """Write structured query payloads with config context and graceful fallback."""
+def write_query(data: dict, *, query_file: Path) -> str | None:
+    """Write structured query payloads with config context and graceful fallback.
+
+    Returns the rendered JSON text on success so callers can reuse it, or None
+    when the write failed.
+    """
     if "config" not in data:
         try:
             data["config"] = config_for_query(load_config())
         except (OSError, ValueError, json.JSONDecodeError) as exc:
             data["config_error"] = str(exc)
             logger.debug("Skipping config injection into query payload: %s", exc)
+    rendered = json.dumps(data, indent=2, default=json_default) + "\n"
     try:
-        safe_write_text(
-            query_file, json.dumps(data, indent=2, default=json_default) + "\n"
-        )
+        safe_write_text(query_file, rendered)
         print("  → query.json updated", file=sys.stderr)
     except OSError as exc:
         data["query_write_error"] = str(exc)
         print(f"  ⚠ Could not write query.json: {exc}", file=sys.stderr)
+        return None
+    return rendered
 
 
 __all__ = ["write_query"]
@@ -1,14 +1,29 @@
 """Complexity signal detection: configurable per-language complexity signals."""
 
+import io
 import logging
 import re
+from collections.abc import Callable
 from pathlib import Path
 
-from desloppify.utils import PROJECT_ROOT
+from desloppify.utils import PROJECT_ROOT, count_lines, count_lines_is_exact
 
 logger = logging.getLogger(__name__)
 
 
+def _pattern_counter(pattern: str) -> Callable[[str], int]:
+    """Return a match counter for *pattern*, compiled once.
+
+    Pure literals are counted with ``str.count``; only patterns that use
+    ``^``/``$`` pay for ``re.MULTILINE``.
+    """
+    if re.escape(pattern) == pattern:
+        return lambda content: content.count(pattern)
+    flags = re.MULTILINE if ("^" in pattern or "$" in pattern) else 0
+    regex = re.compile(pattern, flags)
+    return lambda content: len(regex.findall(content))
+
+
 def detect_complexity(
     path: Path, signals, file_finder, threshold: int = 15, min_loc: int = 50
 ) -> tuple[list[dict], int]:
@@ -25,6 +40,14 @@ def detect_complexity(
         (entries, total_files_checked)
     """
     files = file_finder(path)
+    # Compile each pattern once per call rather than per file.
+    compiled = [
+        (
+            sig,
+            _pattern_counter(sig.pattern) if sig.pattern and not sig.compute else None,
+        )
+        for sig in signals
+    ]
     entries = []
     for filepath in files:
         try:
@@ -33,7 +56,15 @@ def detect_complexity(
                 if Path(filepath).is_absolute()
                 else PROJECT_ROOT / filepath
             )
-            content = p.read_text()
+            data = p.read_bytes()
+            # Cheap pre-filter on raw bytes: most files are below min_loc and
+            # never need decoding. Files whose byte count could differ from
+            # splitlines() (other line breaks, non-ASCII) take the exact path.
+            if count_lines(data) < min_loc and count_lines_is_exact(data):
+                continue
+            # Decode exactly as Path.read_text() would (locale encoding,
+            # universal newlines).
+            content = io.TextIOWrapper(io.BytesIO(data)).read()
             lines = content.splitlines()
             loc = len(lines)
             if loc < min_loc:
@@ -42,7 +73,7 @@ def detect_complexity(
             file_signals = []
             score = 0
 
-            for sig in signals:
+            for sig, counter in compiled:
                 if sig.compute:
                     result = sig.compute(content, lines)
                     if result:
@@ -52,8 +83,8 @@ def detect_complexity(
                             max(0, count - sig.threshold) if sig.threshold else count
                         )
                         score += excess * sig.weight
-                elif sig.pattern:
-                    count = len(re.findall(sig.pattern, content, re.MULTILINE))
+                elif counter is not None:
+                    count = counter(content)
                     if count > sig.threshold:
                         file_signals.append(f"{count} {sig.name}")
                         score += (count - sig.threshold) * sig.weight
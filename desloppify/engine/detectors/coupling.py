@@ -21,6 +21,126 @@ def _norm_prefix(prefix: str) -> str:
     return p if p.endswith("/") else p + "/"
 
 
+def _first_segment(path: str, start: int) -> str:
+    """Return the path segment beginning at *start*, up to the next slash."""
+    end = path.find("/", start)
+    return path[start:] if end < 0 else path[start:end]
+
+
+def _collect_coupling_violations(
+    filepath: str,
+    entry: dict,
+    shared_prefix_norm: str,
+    tools_prefix_norm: str,
+    entries: list[dict],
+) -> int:
+    """Append shared→tools edges of one shared file; return edges checked."""
+    tools_len = len(tools_prefix_norm)
+    total_edges = 0
+    for target in entry["imports"]:
+        target_norm = _norm_path(target)
+        if target_norm.startswith(tools_prefix_norm):
+            total_edges += 1
+            tool = _first_segment(target_norm, tools_len)
+            entries.append(
+                {
+                    "file": filepath,
+                    "target": rel(target),
+                    "tool": tool,
+                    "direction": "shared→tools",
+                }
+            )
+        elif target_norm.startswith(shared_prefix_norm):
+            total_edges += 1  # Count shared→shared edges too for the universe
+    return total_edges
+
+
+def _collect_boundary_candidate(
+    filepath: str,
+    filepath_norm: str,
+    entry: dict,
+    ui_prefix_norm: str,
+    tools_prefix_norm: str,
+    skip_basenames: set[str],
+    entries: list[dict],
+) -> None:
+    """Append one shared file if all of its importers come from a single tool."""
+    if Path(filepath).name in skip_basenames:
+        return
+    if ui_prefix_norm in filepath_norm:
+        return
+    if entry["importer_count"] == 0:
+        return
+
+    tools_len = len(tools_prefix_norm)
+    tool_areas = set()
+    has_non_tool_importer = False
+    for imp in entry["importers"]:
+        imp_norm = _norm_path(imp)
+        if imp_norm.startswith(tools_prefix_norm):
+            tool_areas.add(_first_segment(imp_norm, tools_len))
+        else:
+            has_non_tool_importer = True
+
+    if len(tool_areas) == 1 and not has_non_tool_importer:
+        try:
+            loc = len(Path(filepath).read_text().splitlines())
+        except (OSError, UnicodeDecodeError):
+            loc = 0
+        entries.append(
+            {
+                "file": filepath,
+                "sole_tool": f"src/tools/{list(tool_areas)[0]}",
+                "importer_count": entry["importer_count"],
+                "loc": loc,
+            }
+        )
+
+
+def _collect_cross_tool_imports(
+    filepath: str,
+    filepath_norm: str,
+    entry: dict,
+    tools_prefix_norm: str,
+    entries: list[dict],
+) -> int:
+    """Append tools/A→tools/B edges of one tool file; return edges checked."""
+    tools_len = len(tools_prefix_norm)
+    if filepath_norm.find("/", tools_len) < 0:
+        return 0
+    source_tool = _first_segment(filepath_norm, tools_len)
+    total_edges = 0
+    for target in entry["imports"]:
+        target_norm = _norm_path(target)
+        if not target_norm.startswith(tools_prefix_norm):
+            continue
+        target_tool = _first_segment(target_norm, tools_len)
+        total_edges += 1  # Same-tool edges pass the check but still count
+        if source_tool != target_tool:
+            entries.append(
+                {
+                    "file": filepath,
+                    "target": rel(target),
+                    "source_tool": source_tool,
+                    "target_tool": target_tool,
+                    "direction": "tools→tools",
+                }
+            )
+    return total_edges
+
+
+def _sort_violations(entries: list[dict]) -> list[dict]:
+    return sorted(entries, key=lambda e: (e["file"], e["target"]))
+
+
+def _sort_boundary(entries: list[dict]) -> list[dict]:
+    return sorted(entries, key=lambda e: -e["loc"])
+
+
+def _sort_cross_tool(entries: list[dict]) -> list[dict]:
+    return sorted(entries, key=lambda e: (e["source_tool"], e["file"]))
+
+
 def detect_coupling_violations(
     path: Path, graph: dict, shared_prefix: str = "", tools_prefix: str = ""
 ) -> tuple[list[dict], int]:
@@ -39,26 +159,12 @@ def detect_coupling_violations(
     total_edges = 0
     entries = []
     for filepath, entry in graph.items():
-        filepath_norm = _norm_path(filepath)
-        if not filepath_norm.startswith(shared_prefix_norm):
+        if not _norm_path(filepath).startswith(shared_prefix_norm):
             continue
-        for target in entry["imports"]:
-            target_norm = _norm_path(target)
-            if target_norm.startswith(tools_prefix_norm):
-                total_edges += 1
-                remainder = target_norm[len(tools_prefix_norm) :]
-                tool = remainder.split("/")[0] if "/" in remainder else remainder
-                entries.append(
-                    {
-                        "file": filepath,
-                        "target": rel(target),
-                        "tool": tool,
-                        "direction": "shared→tools",
-                    }
-                )
-            elif target_norm.startswith(shared_prefix_norm):
-                total_edges += 1  # Count shared→shared edges too for the universe
-    return sorted(entries, key=lambda e: (e["file"], e["target"])), total_edges
+        total_edges += _collect_coupling_violations(
+            filepath, entry, shared_prefix_norm, tools_prefix_norm, entries
+        )
+    return _sort_violations(entries), total_edges
 
 
 def detect_boundary_candidates(
@@ -89,40 +195,16 @@ def detect_boundary_candidates(
         if not filepath_norm.startswith(shared_prefix_norm):
             continue
         total_shared += 1
-        basename = Path(filepath).name
-        if basename in skip_basenames:
-            continue
-        if ui_prefix_norm in filepath_norm:
-            continue
-        if entry["importer_count"] == 0:
-            continue
-
-        tool_areas = set()
-        has_non_tool_importer = False
-        for imp in entry["importers"]:
-            imp_norm = _norm_path(imp)
-            if imp_norm.startswith(tools_prefix_norm):
-                remainder = imp_norm[len(tools_prefix_norm) :]
-                tool = remainder.split("/")[0]
-                tool_areas.add(tool)
-            else:
-                has_non_tool_importer = True
-
-        if len(tool_areas) == 1 and not has_non_tool_importer:
-            try:
-                loc = len(Path(filepath).read_text().splitlines())
-            except (OSError, UnicodeDecodeError):
-                loc = 0
-            entries.append(
-                {
-                    "file": filepath,
-                    "sole_tool": f"src/tools/{list(tool_areas)[0]}",
-                    "importer_count": entry["importer_count"],
-                    "loc": loc,
-                }
-            )
-
-    return sorted(entries, key=lambda e: -e["loc"]), total_shared
+        _collect_boundary_candidate(
+            filepath,
+            filepath_norm,
+            entry,
+            ui_prefix_norm,
+            tools_prefix_norm,
+            skip_basenames,
+            entries,
+        )
+    return _sort_boundary(entries), total_shared
 
 
 def detect_cross_tool_imports(
@@ -144,26 +226,57 @@ def detect_cross_tool_imports(
         filepath_norm = _norm_path(filepath)
         if not filepath_norm.startswith(tools_prefix_norm):
             continue
-        remainder = filepath_norm[len(tools_prefix_norm) :]
-        if "/" not in remainder:
-            continue
-        source_tool = remainder.split("/")[0]
-        for target in entry["imports"]:
-            target_norm = _norm_path(target)
-            if not target_norm.startswith(tools_prefix_norm):
-                continue
-            target_tool = target_norm[len(tools_prefix_norm) :].split("/")[0]
-            if source_tool != target_tool:
-                total_edges += 1
-                entries.append(
-                    {
-                        "file": filepath,
-                        "target": rel(target),
-                        "source_tool": source_tool,
-                        "target_tool": target_tool,
-                        "direction": "tools→tools",
-                    }
-                )
-            else:
-                total_edges += 1  # Same-tool edge (passes check)
-    return sorted(entries, key=lambda e: (e["source_tool"], e["file"])), total_edges
+        total_edges += _collect_cross_tool_imports(
+            filepath, filepath_norm, entry, tools_prefix_norm, entries
+        )
+    return _sort_cross_tool(entries), total_edges
+
+
+def detect_all_coupling(
+    path: Path,
+    graph: dict,
+    shared_prefix: str = "",
+    tools_prefix: str = "",
+    skip_basenames: set[str] | None = None,
+) -> dict[str, tuple[list[dict], int]]:
+    """Run all three coupling detectors in one pass over *graph*.
+
+    Returns ``{"violations": ..., "boundary": ..., "cross_tool": ...}``, each
+    value identical to what the corresponding ``detect_*`` function returns.
+    """
+    shared_prefix_norm = _norm_prefix(shared_prefix)
+    tools_prefix_norm = _norm_prefix(tools_prefix)
+    ui_prefix_norm = shared_prefix_norm + "components/ui/"
+    skip_basenames = skip_basenames or set()
+
+    violations: list[dict] = []
+    boundary: list[dict] = []
+    cross_tool: list[dict] = []
+    violation_edges = 0
+    total_shared = 0
+    cross_edges = 0
+    for filepath, entry in graph.items():
+        filepath_norm = _norm_path(filepath)
+        if filepath_norm.startswith(shared_prefix_norm):
+            violation_edges += _collect_coupling_violations(
+                filepath, entry, shared_prefix_norm, tools_prefix_norm, violations
+            )
+            total_shared += 1
+            _collect_boundary_candidate(
+                filepath,
+                filepath_norm,
+                entry,
+                ui_prefix_norm,
+                tools_prefix_norm,
+                skip_basenames,
+                boundary,
+            )
+        if filepath_norm.startswith(tools_prefix_norm):
+            cross_edges += _collect_cross_tool_imports(
+                filepath, filepath_norm, entry, tools_prefix_norm, cross_tool
+            )
+    return {
+        "violations": (_sort_violations(violations), violation_edges),
+        "boundary": (_sort_boundary(boundary), total_shared),
+        "cross_tool": (_sort_cross_tool(cross_tool), cross_edges),
+    }
@@ -4,10 +4,13 @@ Output is clustered: N similar functions produce 1 entry (not N^2/2 pairwise ent
 Each entry contains a representative pair for display plus the full cluster membership.
 """
 
+import bisect
 import difflib
+import math
 import os
 import sys
 import time
+from collections import Counter
 
 
 def _build_clusters(
@@ -83,6 +86,87 @@ def _collect_exact_duplicate_pairs(
     return exact_pairs
 
 
+def _multiset_overlap(left: Counter, right: Counter) -> int:
+    """Size of the multiset intersection of two line counters."""
+    if len(right) < len(left):
+        left, right = right, left
+    total = 0
+    for line, count in left.items():
+        other = right.get(line)
+        if other:
+            total += count if count < other else other
+    return total
+
+
+def _shared_line_counts(
+    line_counts: list[Counter], window_ends: list[int], threshold: float
+) -> list[dict[int, int]]:
+    """Multiset line-intersection sizes for in-window pairs that can match.
+
+    *line_counts* and *window_ends* are indexed by position in the LOC-sorted
+    candidate list; position ``q`` is in ``p``'s window when
+    ``p < q < window_ends[p]``. The intersection size is exactly what
+    ``SequenceMatcher.quick_ratio()`` bounds the ratio with.
+
+    Candidates come from prefix filtering: a pair needs an overlap of at least
+    ``threshold * (len_a + len_b) / 2`` lines, hence at least
+    ``alpha = ceil(threshold * len / (2 - threshold))`` for either side. With
+    line occurrences ordered rarest-first, two functions reaching ``alpha``
+    must share a token within their first ``len - alpha + 1`` occurrences, so
+    only those prefixes are indexed. Ubiquitous lines (``}``, ``return``)
+    sort last and rarely enter a prefix. Pairs skipped here could not pass
+    the ratio bound, so results are exact.
+    """
+    n = len(line_counts)
+    if threshold <= 0:
+        # Even disjoint pairs qualify; score every in-window pair.
+        return [
+            {
+                other: _multiset_overlap(line_counts[pos], line_counts[other])
+                for other in range(pos + 1, window_ends[pos])
+            }
+            for pos in range(n)
+        ]
+    if threshold > 1:
+        return [{} for _ in range(n)]
+
+    # Each occurrence of a line is its own token, so multisets behave as sets.
+    tokens = [
+        [(line, k) for line, count in counts.items() for k in range(count)]
+        for counts in line_counts
+    ]
+    frequency = Counter(token for toks in tokens for token in toks)
+
+    postings: dict[tuple[str, int], list[int]] = {}
+    prefixes: list[list[tuple[str, int]]] = []
+    for pos, toks in enumerate(tokens):
+        size = len(toks)
+        alpha = max(1, math.ceil(threshold * size / (2 - threshold) - 1e-9))
+        toks.sort(key=lambda token: (frequency[token], token))
+        prefix = toks[: max(0, size - alpha + 1)]
+        prefixes.append(prefix)
+        for token in prefix:
+            postings.setdefault(token, []).append(pos)
+
+    shared_by_pos: list[dict[int, int]] = []
+    for pos, prefix in enumerate(prefixes):
+        end = window_ends[pos]
+        candidates: set[int] = set()
+        for token in prefix:
+            positions = postings[token]
+            lo = bisect.bisect_right(positions, pos)
+            hi = bisect.bisect_left(positions, end, lo)
+            candidates.update(positions[lo:hi])
+        counts = line_counts[pos]
+        shared_by_pos.append(
+            {
+                other: _multiset_overlap(counts, line_counts[other])
+                for other in candidates
+            }
+        )
+    return shared_by_pos
+
+
 def _collect_near_duplicate_pairs(
     functions,
     threshold: float,
@@ -91,15 +175,43 @@ def _collect_near_duplicate_pairs(
     debug: bool,
     debug_every: int,
 ) -> list[tuple[int, int, float, str]]:
-    """Collect near-duplicate pairs using SequenceMatcher with pruning."""
+    """Collect near-duplicate pairs using SequenceMatcher with pruning.
+
+    Candidate pairs are blocked through a shared-line index, so the matcher
+    only runs on pairs whose line-multiset bound can reach *threshold*.
+    """
     large_idx = [(idx, fn) for idx, fn in enumerate(functions) if fn.loc >= 15]
     large_idx.sort(key=lambda item: item[1].loc)
-    normalized_lines = [fn.normalized.splitlines() for fn in functions]
+    # Interned so equal lines share one object: line-keyed lookups (counters,
+    # postings, the matcher's b2j index) then hit on identity, not memcmp.
+    normalized_lines = [
+        list(map(sys.intern, fn.normalized.splitlines())) for fn in functions
+    ]
     normalized_line_counts = [len(lines) for lines in normalized_lines]
+    # Integer group ids: one per body hash (exact-duplicate skip) and one per
+    # normalized body (identical matcher input, so ratios can be shared).
+    hash_groups: dict[str, int] = {}
+    hash_gid = [
+        hash_groups.setdefault(fn.body_hash, len(hash_groups)) for fn in functions
+    ]
+    body_groups: dict[str, int] = {}
+    body_gid = [
+        body_groups.setdefault(fn.normalized, len(body_groups)) for fn in functions
+    ]
+
+    locs = [fn.loc for _, fn in large_idx]
+    window_ends = [
+        max(pos + 1, bisect.bisect_right(locs, loc * 1.5))
+        for pos, loc in enumerate(locs)
+    ]
+    shared_by_pos = _shared_line_counts(
+        [Counter(normalized_lines[idx]) for idx, _ in large_idx],
+        window_ends,
+        threshold,
+    )
 
     near_pairs: list[tuple[int, int, float, str]] = []
     near_candidates = 0
-    near_ratio_calls = 0
     near_pruned_by_length = 0
     near_start = time.perf_counter()
 
@@ -110,55 +222,70 @@ def _collect_near_duplicate_pairs(
             file=sys.stderr,
         )
 
+    # Pass 1: cheap gates only, recording survivors in visit order.
+    survivors: list[tuple[int, int, tuple[str, str]]] = []
     for i_pos in range(len(large_idx)):
         idx_a, fn_a = large_idx[i_pos]
-        for j_pos in range(i_pos + 1, len(large_idx)):
+        near_candidates += window_ends[i_pos] - i_pos - 1
+        shared = shared_by_pos[i_pos]
+        for j_pos in sorted(shared):
             idx_b, fn_b = large_idx[j_pos]
-            if fn_b.loc > fn_a.loc * 1.5:
-                break
-            near_candidates += 1
 
-            pair_key = _pair_key(fn_a, fn_b)
-            if pair_key in seen_pairs or fn_a.body_hash == fn_b.body_hash:
-                continue
-
-            # ratio = 2*M/(len_a+len_b), with M <= min(len_a, len_b)
+            # Cheapest rejection first: ratio = 2*M/(len_a+len_b), with M at
+            # most the multiset line intersection; no strings are built here.
             len_a = normalized_line_counts[idx_a]
             len_b = normalized_line_counts[idx_b]
             if not len_a or not len_b:
                 near_pruned_by_length += 1
                 continue
-            max_possible = (2 * min(len_a, len_b)) / (len_a + len_b)
-            if max_possible < threshold:
+            if 2.0 * shared[j_pos] / (len_a + len_b) < threshold:
                 near_pruned_by_length += 1
                 continue
 
-            matcher = difflib.SequenceMatcher(
-                None,
-                normalized_lines[idx_a],
-                normalized_lines[idx_b],
-                autojunk=False,
-            )
-            if matcher.real_quick_ratio() < threshold:
+            if hash_gid[idx_a] == hash_gid[idx_b]:
                 continue
-            if matcher.quick_ratio() < threshold:
+            pair_key = _pair_key(fn_a, fn_b)
+            if pair_key in seen_pairs:
                 continue
-
-            near_ratio_calls += 1
-            ratio = matcher.ratio()
-            if ratio >= threshold:
-                seen_pairs.add(pair_key)
-                near_pairs.append((idx_a, idx_b, ratio, "near-duplicate"))
+            survivors.append((idx_a, idx_b, pair_key))
 
         if debug and i_pos and i_pos % debug_every == 0:
             elapsed = time.perf_counter() - near_start
             print(
                 f"[dupes] progress i={i_pos}/{len(large_idx)} "
-                f"candidate_pairs={near_candidates} ratio_calls={near_ratio_calls} "
-                f"matches={len(near_pairs)} elapsed={elapsed:.2f}s",
+                f"candidate_pairs={near_candidates} survivors={len(survivors)} "
+                f"elapsed={elapsed:.2f}s",
                 file=sys.stderr,
             )
 
+    # Pass 2: score survivors grouped by right operand. SequenceMatcher caches
+    # its b2j index for seq2, so each right operand's index is built once.
+    # Operand order is kept as (a, b) because ratio() is not symmetric, and
+    # ratios are keyed by normalized-body group so copies are scored once.
+    by_right: dict[int, dict[int, int]] = {}
+    for idx_a, idx_b, _ in survivors:
+        by_right.setdefault(body_gid[idx_b], {}).setdefault(body_gid[idx_a], idx_a)
+    right_rep = {body_gid[idx_b]: idx_b for _, idx_b, _ in survivors}
+    ratios: dict[tuple[int, int], float] = {}
+    if by_right:
+        matcher = difflib.SequenceMatcher(None, autojunk=False)
+        for gid_b, lefts in by_right.items():
+            matcher.set_seq2(normalized_lines[right_rep[gid_b]])
+            for gid_a, idx_a in lefts.items():
+                matcher.set_seq1(normalized_lines[idx_a])
+                ratios[(gid_a, gid_b)] = matcher.ratio()
+    near_ratio_calls = len(ratios)
+
+    # Pass 3: accept in the original visit order, so seen-pair dedupe and the
+    # downstream representative-pair choice are unchanged.
+    for idx_a, idx_b, pair_key in survivors:
+        if pair_key in seen_pairs:
+            continue
+        ratio = ratios[(body_gid[idx_a], body_gid[idx_b])]
+        if ratio >= threshold:
+            seen_pairs.add(pair_key)
+            near_pairs.append((idx_a, idx_b, ratio, "near-duplicate"))
+
     if debug:
         elapsed = time.perf_counter() - near_start
         print(
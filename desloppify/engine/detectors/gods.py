@@ -1,20 +1,29 @@
 """God class/component detection via configurable rule-based analysis."""
 
+import heapq
 
-def detect_gods(classes, rules, min_reasons: int = 2) -> tuple[list[dict], int]:
+
+def detect_gods(
+    classes, rules, min_reasons: int = 2, top_n: int | None = None
+) -> tuple[list[dict], int]:
     """Find god classes/components — entities with too many responsibilities.
 
     Args:
         classes: list of ClassInfo objects (from extractors).
         rules: list of GodRule objects defining thresholds.
         min_reasons: minimum rule violations to flag as god.
+        top_n: Keep only the *top_n* largest entries (all when None).
 
     Returns (entries, total_classes_checked).
     """
     entries = []
+    rule_count = len(rules)
     for cls in classes:
         reasons = []
-        for rule in rules:
+        for idx, rule in enumerate(rules):
+            # Stop once the remaining rules can no longer reach min_reasons.
+            if len(reasons) + rule_count - idx < min_reasons:
+                break
             value = rule.extract(cls)
             if value >= rule.threshold:
                 reasons.append(f"{value} {rule.description}")
@@ -30,4 +39,6 @@ def detect_gods(classes, rules, min_reasons: int = 2) -> tuple[list[dict], int]:
                     "detail": {**cls.metrics, "name": cls.name},
                 }
             )
+    if top_n is not None:
+        return heapq.nlargest(top_n, entries, key=lambda e: e["loc"]), len(classes)
     return sorted(entries, key=lambda e: -e["loc"]), len(classes)
@@ -59,72 +59,85 @@ def detect_cycles(
 
     Returns (entries, total_files). Each entry: {"files": [abs_paths], "length": int}
     """
+    # Dense integer ids: index/lowlink live in flat lists and on-stack flags in
+    # a bytearray, so the DFS never hashes path strings. Adjacency keeps each
+    # node's import iteration order, so SCCs are discovered in the same order.
+    nodes = list(graph)
+    ids = {node: i for i, node in enumerate(nodes)}
+    adjacency: list[list[int]] = []
+    for entry in graph.values():
+        imports = entry.get("imports", set())
+        if skip_deferred:
+            imports = imports - entry.get("deferred_imports", set())
+        # One id lookup per edge; imports outside the graph map to None.
+        adjacency.append([i for i in map(ids.get, imports) if i is not None])
+
+    count = len(nodes)
+    index = [-1] * count
+    lowlink = [0] * count
+    on_stack = bytearray(count)
     index_counter = 0
-    scc_stack: list[str] = []
-    lowlinks: dict[str, int] = {}
-    index: dict[str, int] = {}
-    on_stack: dict[str, bool] = {}
+    scc_stack: list[int] = []
     sccs: list[list[str]] = []
 
-    def _get_edges(v: str) -> list[str]:
-        node = graph.get(v, {})
-        imports = node.get("imports", set())
-        if skip_deferred:
-            imports = imports - node.get("deferred_imports", set())
-        return [w for w in imports if w in graph]
-
-    for root in graph:
-        if root in index:
+    for root in range(count):
+        if index[root] >= 0:
             continue
 
-        # Iterative Tarjan's using an explicit call stack.
-        # Each frame is (node, edge_iterator, is_root_call).
-        # When we first visit a node we assign index/lowlink and push to SCC stack.
-        # When we finish iterating edges we check for SCC root.
-        call_stack: list[tuple[str, list[str], int]] = []
-        index[root] = lowlinks[root] = index_counter
+        # Iterative Tarjan: parallel stacks of (node, next edge position).
+        index[root] = lowlink[root] = index_counter
         index_counter += 1
         scc_stack.append(root)
-        on_stack[root] = True
-        edges = _get_edges(root)
-        call_stack.append((root, edges, 0))
-
-        while call_stack:
-            v, edges, ei = call_stack[-1]
-
-            if ei < len(edges):
+        on_stack[root] = 1
+        work_nodes = [root]
+        work_edges = [0]
+
+        while work_nodes:
+            v = work_nodes[-1]
+            edges = adjacency[v]
+            ei = work_edges[-1]
+            n_edges = len(edges)
+            child = -1
+            while ei < n_edges:
                 w = edges[ei]
-                call_stack[-1] = (v, edges, ei + 1)
-
-                if w not in index:
-                    # "Recurse" into w
-                    index[w] = lowlinks[w] = index_counter
-                    index_counter += 1
-                    scc_stack.append(w)
-                    on_stack[w] = True
-                    w_edges = _get_edges(w)
-                    call_stack.append((w, w_edges, 0))
-                elif on_stack.get(w, False):
-                    lowlinks[v] = min(lowlinks[v], index[w])
-            else:
-                # Done with all edges for v — check for SCC root
-                if lowlinks[v] == index[v]:
-                    component: list[str] = []
-                    while True:
-                        w = scc_stack.pop()
-                        on_stack[w] = False
-                        component.append(w)
-                        if w == v:
-                            break
-                    if len(component) > 1:
-                        component.sort()
-                        sccs.append(component)
-
-                call_stack.pop()
-                # Propagate lowlink to parent
-                if call_stack:
-                    parent = call_stack[-1][0]
-                    lowlinks[parent] = min(lowlinks[parent], lowlinks[v])
+                ei += 1
+                if index[w] < 0:
+                    child = w
+                    break
+                if on_stack[w] and index[w] < lowlink[v]:
+                    lowlink[v] = index[w]
+
+            if child >= 0:
+                # "Recurse" into child
+                work_edges[-1] = ei
+                index[child] = lowlink[child] = index_counter
+                index_counter += 1
+                scc_stack.append(child)
+                on_stack[child] = 1
+                work_nodes.append(child)
+                work_edges.append(0)
+                continue
+
+            # Done with all edges for v — check for SCC root
+            if lowlink[v] == index[v]:
+                component: list[str] = []
+                while True:
+                    w = scc_stack.pop()
+                    on_stack[w] = 0
+                    component.append(nodes[w])
+                    if w == v:
+                        break
+                if len(component) > 1:
+                    component.sort()
+                    sccs.append(component)
+
+            work_nodes.pop()
+            work_edges.pop()
+            # Propagate lowlink to parent
+            if work_nodes:
+                parent = work_nodes[-1]
+                if lowlink[v] < lowlink[parent]:
+                    lowlink[parent] = lowlink[v]
 
     return [
         {"files": scc, "length": len(scc)}
@@ -1,42 +1,45 @@
 """Large file detection (LOC threshold)."""
 
-import logging
+import heapq
+import os
 from pathlib import Path
 
-from desloppify.utils import PROJECT_ROOT
-
-logger = logging.getLogger(__name__)
+from desloppify.utils import PROJECT_ROOT, count_files_lines
 
 
 def detect_large_files(
-    path: Path, file_finder, threshold: int = 500
+    path: Path, file_finder, threshold: int = 500, top_n: int | None = None
 ) -> tuple[list[dict], int]:
     """Find files exceeding a line count threshold.
 
     Args:
         file_finder: callable(path) -> list[str]. Required.
         threshold: LOC threshold.
+        top_n: Keep only the *top_n* largest entries (all when None).
 
     Returns:
         (entries, total_files_checked)
     """
     files = file_finder(path)
-    entries = []
+    candidates = []
+    paths = []
     for filepath in files:
+        p = Path(filepath)
+        if not p.is_absolute():
+            p = PROJECT_ROOT / p
+        # A file never has more lines than bytes, so small files cannot exceed
+        # the threshold and are settled by a stat instead of a read.
         try:
-            p = (
-                Path(filepath)
-                if Path(filepath).is_absolute()
-                else PROJECT_ROOT / filepath
-            )
-            loc = len(p.read_text().splitlines())
-            if loc > threshold:
-                entries.append({"file": filepath, "loc": loc})
-        except (OSError, UnicodeDecodeError) as exc:
-            logger.debug(
-                "Skipping unreadable file in large-file detector: %s (%s)",
-                filepath,
-                exc,
-            )
+            if os.stat(p).st_size <= threshold:
+                continue
+        except OSError:
             continue
+        candidates.append(filepath)
+        paths.append(p)
+    entries = []
+    for filepath, loc in zip(candidates, count_files_lines(paths), strict=True):
+        if loc is not None and loc > threshold:
+            entries.append({"file": filepath, "loc": loc})
+    if top_n is not None:
+        return heapq.nlargest(top_n, entries, key=lambda e: e["loc"]), len(files)
     return sorted(entries, key=lambda e: -e["loc"]), len(files)
@@ -1,26 +1,33 @@
 """Naming consistency analysis: flag directories with mixed filename conventions."""
 
-from collections import defaultdict
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
 from desloppify.utils import rel
 
 
+@lru_cache(maxsize=4096)
 def _classify_convention(filename: str) -> str | None:
-    """Classify a filename (without extension) into a naming convention."""
+    """Classify a filename (without extension) into a naming convention.
+
+    Memoised: it is a pure function of the name, and names recur across directories.
+    """
     stem = filename.rsplit(".", 1)[0] if "." in filename else filename
     if not stem:
         return None
 
-    if "-" in stem and stem == stem.lower():
-        return "kebab-case"
-    if stem[0].isupper() and "-" not in stem:
+    all_lower = stem == stem.lower()
+    if "-" in stem:
+        # Every other convention excludes dashes.
+        return "kebab-case" if all_lower else None
+    if stem[0].isupper():
         return "PascalCase"
-    if stem[0].islower() and any(c.isupper() for c in stem) and "-" not in stem:
+    if stem[0].islower() and any(c.isupper() for c in stem):
         return "camelCase"
-    if "_" in stem and stem == stem.lower():
+    if "_" in stem and all_lower:
         return "snake_case"
-    if stem.islower() and "-" not in stem:
+    if stem.islower():
         return "flat_lower"
     return None
 
@@ -46,48 +53,62 @@ def detect_naming_inconsistencies(
     all_skip_dirs = skip_dirs or set()
     files = file_finder(path)
 
-    dir_files: dict[str, dict[str, list[str]]] = defaultdict(lambda: defaultdict(list))
+    counts: Counter[tuple[str, str]] = Counter()
+    # Only the first 10 files per (directory, convention) are ever reported.
+    samples: dict[tuple[str, str], list[str]] = {}
+    skipped_dirs: dict[str, bool] = {}
 
     for filepath in files:
         p = Path(filepath)
-        dirname = str(p.parent)
-        rdir = rel(dirname)
         filename = p.name
 
         if filename in all_skip_names:
             continue
-        if rdir in all_skip_dirs:
-            continue
+        dirname = str(p.parent)
+        if all_skip_dirs:
+            skip = skipped_dirs.get(dirname)
+            if skip is None:
+                skip = skipped_dirs[dirname] = rel(dirname) in all_skip_dirs
+            if skip:
+                continue
 
         convention = _classify_convention(filename)
         if convention:
-            dir_files[dirname][convention].append(filename)
+            key = (dirname, convention)
+            counts[key] += 1
+            sample = samples.setdefault(key, [])
+            if len(sample) < 10:
+                sample.append(filename)
+
+    dir_counts: dict[str, dict[str, int]] = {}
+    for (dirname, convention), count in counts.items():
+        dir_counts.setdefault(dirname, {})[convention] = count
 
     entries = []
-    for dirname, conventions in dir_files.items():
+    for dirname, conventions in dir_counts.items():
         if len(conventions) < 2:
             continue
 
-        sorted_conventions = sorted(conventions.items(), key=lambda x: -len(x[1]))
-        majority_name, majority_files = sorted_conventions[0]
-        total = sum(len(fs) for fs in conventions.values())
+        sorted_conventions = sorted(conventions.items(), key=lambda x: -x[1])
+        majority_name, majority_count = sorted_conventions[0]
+        total = sum(conventions.values())
 
-        for conv_name, conv_files in sorted_conventions[1:]:
-            if len(conv_files) < 5:
+        for conv_name, conv_count in sorted_conventions[1:]:
+            if conv_count < 5:
                 continue
-            if len(conv_files) / total < 0.15:
+            if conv_count / total < 0.15:
                 continue
 
             entries.append(
                 {
                     "directory": rel(dirname),
                     "majority": majority_name,
-                    "majority_count": len(majority_files),
+                    "majority_count": majority_count,
                     "minority": conv_name,
-                    "minority_count": len(conv_files),
+                    "minority_count": conv_count,
                     "total_files": total,
-                    "outliers": sorted(conv_files[:10]),
+                    "outliers": sorted(samples[(dirname, conv_name)]),
                 }
             )
 
-    return sorted(entries, key=lambda e: -e["minority_count"]), len(dir_files)
+    return sorted(entries, key=lambda e: -e["minority_count"]), len(dir_counts)
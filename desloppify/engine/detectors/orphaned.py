@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import heapq
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
-from desloppify.utils import rel
+from desloppify.utils import count_files_lines, rel
 
 
 @dataclass
@@ -19,29 +20,48 @@ class OrphanedDetectionOptions:
     alias_resolver: Callable[[str], str] | None = None
 
 
-def _is_dynamically_imported(
-    filepath: str,
+def _dynamic_target_index(
     dynamic_targets: set[str],
     alias_resolver: Callable[[str], str] | None = None,
-) -> bool:
-    """Check if a file is referenced by any dynamic/side-effect import."""
-    r = rel(filepath)
-    stem = Path(filepath).stem
-    name_no_ext = str(Path(r).with_suffix(""))
-
+) -> tuple[set[str], set[str]]:
+    """Resolve dynamic targets once: ``(resolved, last segment of slashed targets)``."""
+    resolved_targets = set()
+    tails = set()
     for target in dynamic_targets:
         resolved = alias_resolver(target) if alias_resolver else target
         resolved = resolved.lstrip("./")
-        if resolved == name_no_ext or resolved == r:
-            return True
-        if name_no_ext.endswith("/" + resolved) or name_no_ext.endswith(resolved):
-            return True
-        if resolved.endswith("/" + stem) or resolved == stem:
-            return True
-        if resolved.endswith("/" + Path(filepath).name):
-            return True
+        resolved_targets.add(resolved)
+        if "/" in resolved:
+            tails.add(resolved.rsplit("/", 1)[1])
+    return resolved_targets, tails
 
-    return False
+
+def _matches_dynamic_target(
+    r: str, p: Path, resolved_targets: set[str], tails: set[str]
+) -> bool:
+    """Check a file (relative path *r*, path *p*) against ``_dynamic_target_index``."""
+    if not resolved_targets:
+        return False
+    if r in resolved_targets or p.stem in resolved_targets:
+        return True
+    if p.stem in tails or p.name in tails:
+        return True
+    # A target matches when it is any string suffix of the extensionless path.
+    name_no_ext = str(Path(r).with_suffix(""))
+    return any(name_no_ext[i:] in resolved_targets for i in range(len(name_no_ext) + 1))
+
+
+def _is_dynamically_imported(
+    filepath: str,
+    dynamic_targets: set[str],
+    alias_resolver: Callable[[str], str] | None = None,
+) -> bool:
+    """Check if a file is referenced by any dynamic/side-effect import."""
+    return _matches_dynamic_target(
+        rel(filepath),
+        Path(filepath),
+        *_dynamic_target_index(dynamic_targets, alias_resolver),
+    )
 
 
 def detect_orphaned_files(
@@ -49,6 +69,7 @@ def detect_orphaned_files(
     graph: dict,
     extensions: list[str],
     options: OrphanedDetectionOptions | None = None,
+    top_n: int | None = None,
 ) -> tuple[list[dict], int]:
     """Find files with zero importers that aren't known entry points.
 
@@ -61,6 +82,7 @@ def detect_orphaned_files(
             - ``dynamic_import_finder``: ``(path, extensions) -> set[str]``
             - ``alias_resolver``: ``(target) -> resolved_target``
             If omitted, dynamic import checking is skipped.
+        top_n: Keep only the *top_n* largest entries (all when None).
     """
     resolved_options = options or OrphanedDetectionOptions()
     all_entry_patterns = resolved_options.extra_entry_patterns or []
@@ -71,33 +93,36 @@ def detect_orphaned_files(
     dynamic_targets = (
         dynamic_import_finder(path, extensions) if dynamic_import_finder else set()
     )
+    dynamic_index = (
+        _dynamic_target_index(dynamic_targets, alias_resolver)
+        if dynamic_targets
+        else None
+    )
 
     total_files = len(graph)
-    entries = []
+    candidates = []
     for filepath, entry in graph.items():
         if entry["importer_count"] > 0:
             continue
 
         r = rel(filepath)
 
-        if any(p in r for p in all_entry_patterns):
+        if any(pattern in r for pattern in all_entry_patterns):
             continue
 
-        basename = Path(filepath).name
-        if basename in all_barrel_names:
+        p = Path(filepath)
+        if p.name in all_barrel_names:
             continue
 
-        if dynamic_targets and _is_dynamically_imported(
-            filepath, dynamic_targets, alias_resolver
-        ):
+        if dynamic_index and _matches_dynamic_target(r, p, *dynamic_index):
             continue
 
-        try:
-            loc = len(Path(filepath).read_text().splitlines())
-        except (OSError, UnicodeDecodeError):
-            loc = 0
+        candidates.append((filepath, p, entry))
 
-        if loc < 10:
+    locs = count_files_lines([p for _, p, _ in candidates])
+    entries = []
+    for (filepath, _, entry), loc in zip(candidates, locs, strict=True):
+        if loc is None or loc < 10:
             continue
 
         entries.append(
@@ -108,4 +133,6 @@ def detect_orphaned_files(
             }
         )
 
+    if top_n is not None:
+        return heapq.nlargest(top_n, entries, key=lambda e: e["loc"]), total_files
     return sorted(entries, key=lambda e: -e["loc"]), total_files
@@ -1,9 +1,10 @@
 """Single-use abstraction detection (imported by exactly 1 file = inline candidate)."""
 
+import heapq
 import logging
 from pathlib import Path
 
-from desloppify.utils import rel
+from desloppify.utils import count_files_lines, rel
 
 logger = logging.getLogger(__name__)
 _LANG_PLUGIN_ENTRYPOINTS = frozenset(
@@ -43,17 +44,18 @@ def detect_single_use_abstractions(
     path: Path,
     graph: dict,
     barrel_names: set[str],
+    top_n: int | None = None,
 ) -> tuple[list[dict], int]:
     """Find exported symbols imported by exactly 1 file — candidates for inlining.
 
     Args:
         barrel_names: set of barrel filenames to skip. Required.
+        top_n: Keep only the *top_n* largest entries (all when None).
 
     Returns:
         (entries, total_candidate_files) — candidates are files with exactly 1 importer.
     """
-    entries = []
-    total_candidates = 0
+    candidates = []
     for filepath, entry in graph.items():
         if entry["importer_count"] != 1:
             continue
@@ -69,24 +71,29 @@ def detect_single_use_abstractions(
             importer = list(entry["importers"])[0]
             if _is_test_importer(importer):
                 continue
-            total_candidates += 1
-            loc = len(p.read_text().splitlines())
-            if loc < 20 or loc > 300:
-                continue
-            entries.append(
-                {
-                    "file": filepath,
-                    "loc": loc,
-                    "sole_importer": rel(importer),
-                    "reason": f"Only imported by {rel(importer)} — consider inlining",
-                    "import_count": entry.get("import_count", 0),
-                }
-            )
-        except (OSError, UnicodeDecodeError) as exc:
+        except OSError as exc:
             logger.debug(
                 "Skipping unreadable file in single-use detector: %s (%s)",
                 filepath,
                 exc,
             )
             continue
-    return sorted(entries, key=lambda e: -e["loc"]), total_candidates
+        candidates.append((filepath, p, importer, entry))
+
+    locs = count_files_lines([p for _, p, _, _ in candidates])
+    entries = []
+    for (filepath, _, importer, entry), loc in zip(candidates, locs, strict=True):
+        if loc is None or loc < 20 or loc > 300:
+            continue
+        entries.append(
+            {
+                "file": filepath,
+                "loc": loc,
+                "sole_importer": rel(importer),
+                "reason": f"Only imported by {rel(importer)} — consider inlining",
+                "import_count": entry.get("import_count", 0),
+            }
+        )
+    if top_n is not None:
+        return heapq.nlargest(top_n, entries, key=lambda e: e["loc"]), len(candidates)
+    return sorted(entries, key=lambda e: -e["loc"]), len(candidates)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import fnmatch
 import importlib
+from collections.abc import Iterator
 
 from desloppify.engine.state_internal.schema import (
     Finding,
@@ -32,6 +33,22 @@ def path_scoped_findings(
     }
 
 
+def iter_path_scoped_findings(
+    findings: dict[str, Finding],
+    scan_path: str | None,
+) -> Iterator[Finding]:
+    """Yield findings within the given scan path without building a new dict."""
+    if not scan_path or scan_path == ".":
+        yield from findings.values()
+        return
+
+    prefix = scan_path.rstrip("/") + "/"
+    for finding in findings.values():
+        file = finding.get("file", "")
+        if file.startswith(prefix) or file == scan_path or file == ".":
+            yield finding
+
+
 def is_ignored(finding_id: str, file: str, ignore_patterns: list[str]) -> bool:
     """Check if a finding matches any ignore pattern (glob, ID prefix, or file path)."""
     return matched_ignore_pattern(finding_id, file, ignore_patterns) is not None
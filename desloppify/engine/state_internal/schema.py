@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Literal, NotRequired, TypedDict, cast
@@ -187,6 +188,11 @@ def ensure_state_defaults(state: dict) -> StateModel:
         finding.setdefault("status", "open")
         if finding["status"] not in _ALLOWED_FINDING_STATUSES:
             finding["status"] = "open"
+        # Detector/status values repeat across thousands of findings; interning
+        # lets the per-detector aggregations compare them by identity.
+        if type(finding["detector"]) is str:
+            finding["detector"] = sys.intern(finding["detector"])
+        finding["status"] = sys.intern(finding["status"])
         finding.setdefault("note", None)
         finding.setdefault("first_seen", state.get("created") or utc_now())
         finding.setdefault("last_seen", finding["first_seen"])
@@ -6,7 +6,7 @@ from pathlib import Path
 
 from desloppify.engine.state_internal.schema import Finding
 from desloppify.state import make_finding
-from desloppify.utils import PROJECT_ROOT, resolve_path
+from desloppify.utils import PROJECT_ROOT, count_files_lines, resolve_path
 
 
 def add_structural_signal(structural: dict, file: str, signal: str, detail: dict):
@@ -35,16 +35,18 @@ def merge_structural_signals(
     """
     results = []
     suppressed = 0
-    for filepath, data in structural.items():
-        if "loc" not in data["detail"]:
-            try:
-                p = (
-                    Path(filepath) if Path(filepath).is_absolute() else PROJECT_ROOT / filepath
-                )
-                data["detail"]["loc"] = len(p.read_text().splitlines())
-            except (OSError, UnicodeDecodeError):
-                data["detail"]["loc"] = 0
+    missing_loc = [
+        (data["detail"], Path(filepath))
+        for filepath, data in structural.items()
+        if "loc" not in data["detail"]
+    ]
+    loc_counts = count_files_lines(
+        [p if p.is_absolute() else PROJECT_ROOT / p for _, p in missing_loc]
+    )
+    for (detail, _), loc in zip(missing_loc, loc_counts, strict=True):
+        detail["loc"] = 0 if loc is None else loc
 
+    for filepath, data in structural.items():
         # Suppress complexity-only findings below the elevated threshold.
         signals = data["signals"]
         is_complexity_only = all(s.startswith("complexity") for s in signals)
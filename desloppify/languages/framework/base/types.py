@@ -24,7 +24,7 @@ class DetectorPhase:
     slow: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FixResult:
     """Return type for fixer wrappers that need to carry metadata."""
 
@@ -24,6 +24,8 @@ if TYPE_CHECKING:
 
     from desloppify.engine.detectors.base import ComplexitySignal
 
+_SEVERITY_COLORS = {"high": "red", "medium": "yellow", "low": "dim"}
+
 
 def _bind_callsite_module(fn: Callable[..., Any]) -> Callable[..., Any]:
     """Attribute generated command functions to the language commands module."""
@@ -99,9 +101,10 @@ def make_cmd_single_use(
     """Factory: detect single-use abstractions."""
 
     def cmd_single_use(args: argparse.Namespace) -> None:
-        graph = build_dep_graph(Path(args.path))
+        path = Path(args.path)
+        graph = build_dep_graph(path)
         entries, _ = single_use_detector.detect_single_use_abstractions(
-            Path(args.path), graph, barrel_names=barrel_names
+            path, graph, barrel_names=barrel_names
         )
         display_entries(
             args,
@@ -153,10 +156,11 @@ def make_cmd_naming(
 ) -> Callable[[argparse.Namespace], None]:
     """Factory: detect naming inconsistencies."""
 
+    kwargs = dict(file_finder=file_finder, skip_names=skip_names)
+    if skip_dirs:
+        kwargs["skip_dirs"] = skip_dirs
+
     def cmd_naming(args: argparse.Namespace) -> None:
-        kwargs = dict(file_finder=file_finder, skip_names=skip_names)
-        if skip_dirs:
-            kwargs["skip_dirs"] = skip_dirs
         entries, _ = naming_detector.detect_naming_inconsistencies(
             Path(args.path), **kwargs
         )
@@ -251,9 +255,7 @@ def make_cmd_smells(
         )
         rows = []
         for e in entries[: getattr(args, "top", 20)]:
-            sev_color = {"high": "red", "medium": "yellow", "low": "dim"}.get(
-                e["severity"], "dim"
-            )
+            sev_color = _SEVERITY_COLORS.get(e["severity"], "dim")
             rows.append(
                 [
                     colorize(e["severity"].upper(), sev_color),
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib
 import logging
+import os
 from pathlib import Path
 
 from desloppify.languages.framework import registry_state
@@ -32,9 +33,15 @@ def load_all() -> None:
     base_package = __package__.rsplit(".", 1)[0]
     failures: dict[str, BaseException] = {}
 
+    # One directory listing serves both discovery passes below.
+    with os.scandir(lang_dir) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
     # Discover single-file plugins by naming convention (e.g. plugin_rust.py).
-    for f in sorted(lang_dir.glob("plugin_*.py")):
-        module_name = f".{f.stem}"
+    for entry in entries:
+        if not (entry.name.startswith("plugin_") and entry.name.endswith(".py")):
+            continue
+        module_name = f".{entry.name[:-3]}"
         try:
             importlib.import_module(module_name, base_package)
         except (
@@ -49,14 +56,14 @@ def load_all() -> None:
             failures[module_name] = ex
 
     # Discover packages (e.g. lang/typescript/)
-    for d in sorted(lang_dir.iterdir()):
+    for entry in entries:
         if (
-            d.is_dir()
-            and (d / "__init__.py").exists()
-            and not d.name.startswith("_")
-            and d.name != "framework"
+            not entry.name.startswith("_")
+            and entry.name != "framework"
+            and entry.is_dir()
+            and os.path.exists(os.path.join(entry.path, "__init__.py"))
         ):
-            module_name = f".{d.name}"
+            module_name = f".{entry.name}"
             try:
                 importlib.import_module(module_name, base_package)
             except (
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from pathlib import Path
 
 from desloppify.core.enums import Tier
@@ -198,12 +197,12 @@ def make_smell_findings(entries: list[dict], stderr_fn) -> list[Finding]:
     """
     results = []
     for e in entries:
-        by_file: dict[str, list] = defaultdict(list)
+        by_file: dict[str, list] = {}
         for m in e["matches"]:
-            by_file[m["file"]].append(m)
+            by_file.setdefault(m["file"], []).append(m)
+        conf = "medium" if e["severity"] != "low" else "low"
+        tier = SMELL_TIER_MAP.get(e["severity"], 3)
         for file, matches in by_file.items():
-            conf = "medium" if e["severity"] != "low" else "low"
-            tier = SMELL_TIER_MAP.get(e["severity"], 3)
             results.append(
                 make_finding(
                     "smells",
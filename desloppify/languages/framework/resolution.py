@@ -22,12 +22,18 @@ def make_lang_config(name: str, cfg_cls: type) -> LangConfig:
     return cfg
 
 
+def _registered_names() -> list[str]:
+    # Sorted on demand: the registry is small and is mutated directly (tests,
+    # plugin reloads), so a cached ordering could silently go stale.
+    return sorted(registry_state._registry)
+
+
 def get_lang(name: str) -> LangConfig:
     """Get a language config by name."""
     if name not in registry_state._registry:
         load_all()
     if name not in registry_state._registry:
-        available = ", ".join(sorted(registry_state._registry.keys()))
+        available = ", ".join(_registered_names())
         raise ValueError(f"Unknown language: {name!r}. Available: {available}")
     return make_lang_config(name, registry_state._registry[name])
 
@@ -74,4 +80,4 @@ def auto_detect_lang(project_root: Path) -> str | None:
 def available_langs() -> list[str]:
     """Return list of registered language names."""
     load_all()
-    return sorted(registry_state._registry.keys())
+    return _registered_names()
@@ -2,27 +2,49 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from desloppify.languages.framework.policy import REQUIRED_DIRS, REQUIRED_FILES
 
 
+def _list_dir(path: Path | str) -> dict[str, os.DirEntry[str]]:
+    """Map entry names to ``os.DirEntry`` objects; empty when *path* can't be listed."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def _entry_is_file(entries: dict[str, os.DirEntry[str]], name: str) -> bool:
+    entry = entries.get(name)
+    return entry is not None and entry.is_file()
+
+
 def validate_lang_structure(lang_dir: Path, name: str) -> None:
     """Validate that a language plugin has all required files and directories."""
     errors: list[str] = []
+    # Runs for every registered plugin on startup: list each directory once
+    # instead of stat'ing every required path separately.
+    entries = _list_dir(lang_dir)
 
     for filename in REQUIRED_FILES:
-        if not (lang_dir / filename).is_file():
+        if not _entry_is_file(entries, filename):
             errors.append(f"missing required file: {filename}")
 
     for dirname in REQUIRED_DIRS:
-        target = lang_dir / dirname
-        if not target.is_dir():
+        target = entries.get(dirname)
+        if target is None or not target.is_dir():
             errors.append(f"missing required directory: {dirname}/")
             continue
-        if not (target / "__init__.py").is_file():
+        target_entries = _list_dir(target.path)
+        if not _entry_is_file(target_entries, "__init__.py"):
             errors.append(f"missing {dirname}/__init__.py")
-        if dirname == "tests" and not any(target.glob("test_*.py")):
+        if dirname == "tests" and not any(
+            entry_name.startswith("test_") and entry_name.endswith(".py")
+            for entry_name in target_entries
+        ):
             errors.append("tests directory must contain at least one test_*.py file")
 
     if errors:
@@ -37,35 +37,36 @@ def compute_max_params(content: str, lines: list[str]) -> tuple[int, str] | None
     return None
 
 
-def _detect_indent_unit(lines: list[str]) -> int:
-    """Detect indentation unit from file content using GCD of indentations."""
+def _code_indents(lines: list[str]) -> set[int]:
+    """Distinct indentation widths of non-blank, non-comment lines."""
     indents = set()
     for line in lines:
         stripped = line.lstrip()
-        if stripped and not stripped.startswith("#"):
-            indent = len(line) - len(stripped)
-            if 0 < indent <= 16:
-                indents.add(indent)
-    if not indents:
-        return 4
+        if stripped and stripped[0] != "#":
+            indents.add(len(line) - len(stripped))
+    return indents
+
+
+def _indent_unit(indents: set[int]) -> int:
+    """Detect indentation unit as the GCD of the (small) indentation widths."""
     unit = 0
     for i in indents:
-        unit = gcd(unit, i)
-    return max(unit, 1)
+        if 0 < i <= 16:
+            unit = gcd(unit, i)
+    return unit if unit else 4
+
+
+def _detect_indent_unit(lines: list[str]) -> int:
+    """Detect indentation unit from file content using GCD of indentations."""
+    return _indent_unit(_code_indents(lines))
 
 
 def compute_nesting_depth(content: str, lines: list[str]) -> tuple[int, str] | None:
     """Find maximum nesting depth by indentation. Returns (depth, label) or None."""
-    indent_unit = _detect_indent_unit(lines)
-    max_depth = 0
-    for line in lines:
-        stripped = line.lstrip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        indent = len(line) - len(stripped)
-        depth = indent // indent_unit
-        if depth > max_depth:
-            max_depth = depth
+    # One pass collects the distinct indents; depth is monotonic in indent, so
+    # the deepest line is simply the widest indent.
+    indents = _code_indents(lines)
+    max_depth = max(indents, default=0) // _indent_unit(indents)
     if max_depth > 4:
         return max_depth, f"nesting depth {max_depth}"
     return None
@@ -76,8 +77,9 @@ def compute_long_functions(content: str, lines: list[str]) -> tuple[int, str] |
     results = []
     fn_re = re.compile(r"^(\s*)def\s+(\w+)")
 
+    n_lines = len(lines)
     i = 0
-    while i < len(lines):
+    while i < n_lines:
         m = fn_re.match(lines[i])
         if not m:
             i += 1
@@ -88,12 +90,10 @@ def compute_long_functions(content: str, lines: list[str]) -> tuple[int, str] |
         fn_start = i
 
         j = i + 1
-        while j < len(lines):
-            if lines[j].strip() == "":
-                j += 1
-                continue
-            line_indent = len(lines[j]) - len(lines[j].lstrip())
-            if line_indent <= fn_indent and lines[j].strip():
+        while j < n_lines:
+            line = lines[j]
+            stripped = line.lstrip()
+            if stripped and len(line) - len(stripped) <= fn_indent:
                 break
             j += 1
 
@@ -113,6 +113,15 @@ class TestComputeNestingDepth:
         # Max depth is 1 (inside function body), which is <= 4 threshold
         assert compute_nesting_depth(content, lines) is None
 
+    def test_wide_indents_use_unit_from_narrow_ones(self):
+        # Indents beyond 16 columns don't vote on the unit but still count
+        # towards depth; commented-out deep lines are ignored.
+        lines = ["def foo():", "  x = 1", " " * 24 + "y = 2", " " * 40 + "# deep"]
+        assert compute_nesting_depth("\n".join(lines), lines) == (
+            12,
+            "nesting depth 12",
+        )
+
 
 # ── compute_long_functions ────────────────────────────────
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache, partial
 from pathlib import Path
 
 from desloppify.engine.policy.zones import COMMON_ZONE_RULES, Zone, ZoneRule
@@ -99,47 +101,91 @@ TS_ZONE_RULES = [
 ] + COMMON_ZONE_RULES
 
 
+# resolved scan root -> (file signature, {smell id: matches})
+_SMELL_INDEX_CACHE: dict[str, tuple[tuple, dict[str, list[dict]]]] = {}
+_SMELL_INDEX_MAX_ROOTS = 8
+
+
+def _smell_matches_by_id(path: Path) -> dict[str, list[dict]]:
+    """Run smell detection once per unchanged tree and index matches by smell id.
+
+    Entries are kept per scan root, and each one is checked against the
+    root's source file mtimes and sizes. A fixer that rewrites files
+    therefore invalidates it for the next detection pass.
+    """
+    signature = []
+    for filepath in find_ts_files(path):
+        try:
+            st = os.stat(smells_detector_mod.PROJECT_ROOT / filepath)
+        except OSError:
+            signature.append((filepath, None, None))
+            continue
+        signature.append((filepath, st.st_mtime_ns, st.st_size))
+    root = str(Path(path).resolve())
+    signature = tuple(signature)
+    cached = _SMELL_INDEX_CACHE.get(root)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    indexed = {
+        e["id"]: e.get("matches", [])
+        for e in smells_detector_mod.detect_smells(path)[0]
+    }
+    _SMELL_INDEX_CACHE.pop(root, None)
+    if len(_SMELL_INDEX_CACHE) >= _SMELL_INDEX_MAX_ROOTS:
+        _SMELL_INDEX_CACHE.pop(next(iter(_SMELL_INDEX_CACHE)))
+    _SMELL_INDEX_CACHE[root] = (signature, indexed)
+    return indexed
+
+
 def _get_ts_fixers() -> dict[str, FixerConfig]:
-    """Build the TypeScript fixer registry (lazy-loaded).
+    """Return the TypeScript fixer registry.
 
-    Detection and fix functions use lazy imports so detector modules
-    aren't loaded until the fix command actually runs.
+    The registry is built once per process; each config instance gets its
+    own shallow copy so callers can't mutate the shared table.
     """
+    return dict(_build_ts_fixers())
 
-    def _det_unused(cat):
-        def f(path):
-            return unused_detector_mod.detect_unused(path, category=cat)[0]
 
-        return f
+def _detect_unused_imports(path: Path) -> list[dict]:
+    return unused_detector_mod.detect_unused(path, category="imports")[0]
 
-    def _det_logs(path):
-        return logs_detector_mod.detect_logs(path)[0]
 
-    def _det_exports(path):
-        return exports_detector_mod.detect_dead_exports(path)[0]
+def _detect_unused_vars(path: Path) -> list[dict]:
+    return unused_detector_mod.detect_unused(path, category="vars")[0]
 
-    def _det_smell(smell_id):
-        def f(path):
-            return next(
-                (
-                    e.get("matches", [])
-                    for e in smells_detector_mod.detect_smells(path)[0]
-                    if e["id"] == smell_id
-                ),
-                [],
-            )
 
-        return f
+def _detect_debug_logs(path: Path) -> list[dict]:
+    return logs_detector_mod.detect_logs(path)[0]
+
+
+def _detect_dead_exports(path: Path) -> list[dict]:
+    return exports_detector_mod.detect_dead_exports(path)[0]
+
+
+def _detect_smell(smell_id: str, path: Path) -> list[dict]:
+    return _smell_matches_by_id(path).get(smell_id, [])
+
 
-    def _fix_vars(entries, *, dry_run=False):
-        results, skip_reasons = ts_fixers_mod.fix_unused_vars(entries, dry_run=dry_run)
-        return FixResult(entries=results, skip_reasons=skip_reasons)
+def _fix_unused_vars(entries, *, dry_run=False):
+    results, skip_reasons = ts_fixers_mod.fix_unused_vars(entries, dry_run=dry_run)
+    return FixResult(entries=results, skip_reasons=skip_reasons)
 
-    def _fix_logs(entries, *, dry_run=False):
-        results = ts_fixers_mod.fix_debug_logs(entries, dry_run=dry_run)
-        for r in results:
-            r["removed"] = r.get("tags", r.get("removed", []))
-        return results
+
+def _fix_debug_logs(entries, *, dry_run=False):
+    results = ts_fixers_mod.fix_debug_logs(entries, dry_run=dry_run)
+    for r in results:
+        r["removed"] = r.get("tags", r.get("removed", []))
+    return results
+
+
+@lru_cache(maxsize=1)
+def _build_ts_fixers() -> dict[str, FixerConfig]:
+    """Build the TypeScript fixer registry (lazy-loaded).
+
+    Detection and fix functions resolve their module attributes at call
+    time, so detector work doesn't run until the fix command actually runs.
+    """
 
     def _lazy_fix(name):
         def f(entries, **kw):
@@ -151,29 +197,29 @@ def _get_ts_fixers() -> dict[str, FixerConfig]:
     return {
         "unused-imports": FixerConfig(
             "unused imports",
-            _det_unused("imports"),
+            _detect_unused_imports,
             _lazy_fix("fix_unused_imports"),
             "unused",
             R,
             DV,
         ),
         "debug-logs": FixerConfig(
-            "tagged debug logs", _det_logs, _fix_logs, "logs", R, DV
+            "tagged debug logs", _detect_debug_logs, _fix_debug_logs, "logs", R, DV
         ),
         "dead-exports": FixerConfig(
             "dead exports",
-            _det_exports,
+            _detect_dead_exports,
             _lazy_fix("fix_dead_exports"),
             "exports",
             "De-exported",
             "Would de-export",
         ),
         "unused-vars": FixerConfig(
-            "unused vars", _det_unused("vars"), _fix_vars, "unused", R, DV
+            "unused vars", _detect_unused_vars, _fix_unused_vars, "unused", R, DV
         ),
         "unused-params": FixerConfig(
             "unused params",
-            _det_unused("vars"),
+            _detect_unused_vars,
             _lazy_fix("fix_unused_params"),
             "unused",
             "Prefixed",
@@ -181,7 +227,7 @@ def _get_ts_fixers() -> dict[str, FixerConfig]:
         ),
         "dead-useeffect": FixerConfig(
             "dead useEffect calls",
-            _det_smell("dead_useeffect"),
+            partial(_detect_smell, "dead_useeffect"),
             _lazy_fix("fix_dead_useeffect"),
             "smells",
             R,
@@ -189,7 +235,7 @@ def _get_ts_fixers() -> dict[str, FixerConfig]:
         ),
         "empty-if-chain": FixerConfig(
             "empty if/else chains",
-            _det_smell("empty_if_chain"),
+            partial(_detect_smell, "empty_if_chain"),
             _lazy_fix("fix_empty_if_chain"),
             "smells",
             R,
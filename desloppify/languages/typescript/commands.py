@@ -227,16 +227,15 @@ def cmd_coupling(args: argparse.Namespace) -> None:
     graph = deps_detector_mod.build_dep_graph(Path(args.path))
     shared_prefix = f"{SRC_PATH}/shared/"
     tools_prefix = f"{SRC_PATH}/tools/"
-    violations, _ = coupling_detector_mod.detect_coupling_violations(
-        Path(args.path), graph, shared_prefix=shared_prefix, tools_prefix=tools_prefix
-    )
-    candidates, _ = coupling_detector_mod.detect_boundary_candidates(
+    coupling = coupling_detector_mod.detect_all_coupling(
         Path(args.path),
         graph,
         shared_prefix=shared_prefix,
         tools_prefix=tools_prefix,
         skip_basenames={"index.ts", "index.tsx"},
     )
+    violations, _ = coupling["violations"]
+    candidates, _ = coupling["boundary"]
     if getattr(args, "json", False):
         print(
             json.dumps(
@@ -260,9 +259,7 @@ def cmd_coupling(args: argparse.Namespace) -> None:
         print_table(["Shared File", "Imports From", "Tool"], rows, [50, 50, 20])
     else:
         print(c("\nNo coupling violations (shared → tools).", "green"))
-    cross_tool, _ = coupling_detector_mod.detect_cross_tool_imports(
-        Path(args.path), graph, tools_prefix=tools_prefix
-    )
+    cross_tool, _ = coupling["cross_tool"]
     print()
     if cross_tool:
         print(c(f"Cross-tool imports (tools → tools): {len(cross_tool)}\n", "bold"))
@@ -3,21 +3,33 @@
 import logging
 import re
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 from desloppify.core.fallbacks import log_best_effort_failure
-from desloppify.languages.typescript.detectors._smell_helpers import scan_code
 from desloppify.utils import PROJECT_ROOT, c, rel, safe_write_text
 
 logger = logging.getLogger(__name__)
 
-_CHAR_DEPTH_DELTA: dict[str, tuple[str, int]] = {
-    "(": ("parens", 1),
-    ")": ("parens", -1),
-    "{": ("braces", 1),
-    "}": ("braces", -1),
-    "[": ("brackets", 1),
-    "]": ("brackets", -1),
+# Line boundaries ``str.splitlines()`` honours besides "\n".
+_EXTRA_LINE_BREAKS_RE = re.compile("[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+# Events for _code_brackets: one bracket pair or an opening quote outside
+# strings, and per quote kind, the escape or closing quote that ends a string.
+_PAREN_EVENTS_RE = re.compile(r"""[()'"`]""")
+_BRACE_EVENTS_RE = re.compile(r"""[{}'"`]""")
+_STRING_STOP_RE = {
+    "'": re.compile(r"[\\']"),
+    '"': re.compile(r'[\\"]'),
+    "`": re.compile(r"[\\`]"),
+}
+
+# find_balanced_end track -> (event pattern, opening bracket). Only the pair
+# whose depth ends the scan is tracked; other brackets never affect the result.
+_TRACK_EVENTS: dict[str, tuple[re.Pattern[str], str]] = {
+    "parens": (_PAREN_EVENTS_RE, "("),
+    "braces": (_BRACE_EVENTS_RE, "{"),
+    "all": (_PAREN_EVENTS_RE, "("),
 }
 
 
@@ -31,6 +43,42 @@ def _group_entries(entries: list[dict], file_key: str) -> dict[str, list[dict]]:
     return grouped
 
 
+def _code_brackets(
+    text: str, events: re.Pattern[str], start: int = 0
+) -> Iterator[tuple[int, str]]:
+    """Yield ``(index, char)`` for *events* brackets outside string literals.
+
+    Same string/escape rules as ``_smell_helpers.scan_code``, but the regex
+    engine skips straight to the next event instead of visiting every character.
+    """
+    search = events.search
+    pos = start
+    while (match := search(text, pos)) is not None:
+        i = match.start()
+        ch = text[i]
+        stop = _STRING_STOP_RE.get(ch)
+        if stop is None:
+            yield i, ch
+            pos = i + 1
+            continue
+        pos = i + 1
+        while (end := stop.search(text, pos)) is not None:
+            if text[end.start()] == "\\":
+                pos = end.start() + 2
+                continue
+            pos = end.start() + 1
+            break
+        else:
+            return  # unterminated string runs to the end of the text
+
+
+def line_count(text: str) -> int:
+    """``len(text.splitlines())`` without building the list for "\n"-only text."""
+    if _EXTRA_LINE_BREAKS_RE.search(text):
+        return len(text.splitlines())
+    return text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+
+
 def find_balanced_end(
     lines: list[str], start: int, *, track: str = "parens", max_lines: int = 80
 ) -> int | None:
@@ -48,23 +96,17 @@ def find_balanced_end(
     Returns:
         0-indexed line number where depth returns to zero, or ``None``.
     """
-    depths = {"parens": 0, "braces": 0, "brackets": 0}
+    if track not in _TRACK_EVENTS:
+        return None
+    events, opener = _TRACK_EVENTS[track]
+    depth = 0
     for idx in range(start, min(start + max_lines, len(lines))):
-        for _, ch, in_s in scan_code(lines[idx]):
-            if in_s:
-                continue
-            delta_spec = _CHAR_DEPTH_DELTA.get(ch)
-            if delta_spec is None:
-                continue
-            key, delta = delta_spec
-            depths[key] += delta
-            if delta > 0:
+        for _, ch in _code_brackets(lines[idx], events):
+            if ch == opener:
+                depth += 1
                 continue
-            if track == "parens" and key == "parens" and depths["parens"] <= 0:
-                return idx
-            if track == "braces" and key == "braces" and depths["braces"] <= 0:
-                return idx
-            if track == "all" and key == "parens" and depths["parens"] <= 0:
+            depth -= 1
+            if depth <= 0:
                 return idx
     return None
 
@@ -89,9 +131,7 @@ def extract_body_between_braces(text: str, search_after: str = "") -> str | None
         return None
 
     depth = 0
-    for i, ch, in_s in scan_code(text, brace_pos):
-        if in_s:
-            continue
+    for i, ch in _code_brackets(text, _BRACE_EVENTS_RE, brace_pos):
         if ch == "{":
             depth += 1
         elif ch == "}":
@@ -151,6 +191,7 @@ def _process_fixer_file(
     p = Path(filepath) if Path(filepath).is_absolute() else PROJECT_ROOT / filepath
     original = p.read_text()
     lines = original.splitlines(keepends=True)
+    original_line_count = len(lines)
 
     new_lines, removed_names = transform_fn(lines, file_entries)
     new_content = "".join(new_lines)
@@ -160,7 +201,7 @@ def _process_fixer_file(
     if not dry_run:
         _write_fixer_content(p, new_content)
 
-    lines_removed = len(original.splitlines()) - len(new_content.splitlines())
+    lines_removed = original_line_count - line_count(new_content)
     return {
         "file": filepath,
         "removed": removed_names,
@@ -180,12 +221,13 @@ def collapse_blank_lines(
     lines: list[str], removed_indices: set[int] | None = None
 ) -> list[str]:
     """Filter out removed lines and collapse double blank lines."""
+    if removed_indices:
+        lines = [line for idx, line in enumerate(lines) if idx not in removed_indices]
     result = []
     prev_blank = False
-    for idx, line in enumerate(lines):
-        if removed_indices and idx in removed_indices:
-            continue
-        is_blank = line.strip() == ""
+    for line in lines:
+        # Same test as ``line.strip() == ""`` without allocating the stripped copy.
+        is_blank = not line or line.isspace()
         if is_blank and prev_blank:
             continue
         result.append(line)
@@ -193,6 +235,32 @@ def collapse_blank_lines(
     return result
 
 
+def collapse_blank_lines_spans(
+    lines: list[str], removed_spans: list[tuple[int, int]]
+) -> list[str]:
+    """Like ``collapse_blank_lines``, with removals given as inclusive index spans.
+
+    Spans may overlap or arrive unordered; kept runs are copied as slices.
+    """
+    kept: list[str] = []
+    pos = 0
+    for start, end in sorted(removed_spans):
+        if end < start:
+            continue
+        if start > pos:
+            kept.extend(lines[pos:start])
+        pos = max(pos, end + 1)
+    kept.extend(lines[pos:])
+    return collapse_blank_lines(kept)
+
+
+_IMPORT_FROM_CLAUSE_RE = re.compile(
+    r"""from\s+(?P<module>['"][^'"]+['"])(?P<attrs>\s+(?:assert|with)\s*\{.*?\})?\s*;?(?P<trailing>\s*(?://.*|/\*.*?\*/\s*)?)$""",
+    re.DOTALL,
+)
+_BINDING_ALIAS_RE = re.compile(r"\s+as\s+")
+
+
 def _normalize_binding_name(token: str) -> str:
     normalized = token.strip().rstrip(",")
     if normalized.startswith("type "):
@@ -204,7 +272,10 @@ def _binding_symbol_names(binding: str) -> set[str]:
     binding = binding.strip().rstrip(",")
     if not binding:
         return set()
-    parts = re.split(r"\s+as\s+", binding, maxsplit=1)
+    # Only bindings containing "as" can carry an alias.
+    parts = (
+        _BINDING_ALIAS_RE.split(binding, maxsplit=1) if "as" in binding else [binding]
+    )
     names = {_normalize_binding_name(parts[0])}
     if len(parts) == 2:
         names.add(_normalize_binding_name(parts[1]))
@@ -215,13 +286,12 @@ def remove_symbols_from_import_stmt(
     import_stmt: str,
     symbols_to_remove: set[str],
 ) -> tuple[str | None, set[str]]:
-    """Remove specific symbols from an import statement."""
+    """Remove specific symbols from an import statement.
+
+    Returns ``(cleaned import or None, removed symbols)``.
+    """
     stmt = import_stmt.strip()
-    from_match = re.search(
-        r"""from\s+(?P<module>['"][^'"]+['"])(?P<attrs>\s+(?:assert|with)\s*\{.*?\})?\s*;?(?P<trailing>\s*(?://.*|/\*.*?\*/\s*)?)$""",
-        stmt,
-        re.DOTALL,
-    )
+    from_match = _IMPORT_FROM_CLAUSE_RE.search(stmt)
     if not from_match:
         return import_stmt, set()
 
@@ -245,11 +315,13 @@ def remove_symbols_from_import_stmt(
     default_import = None
     namespace_import = None
     named_imports = []
-    brace_match = re.search(r"\{([^}]*)\}", before_from, re.DOTALL)
-    if brace_match:
-        named_str = brace_match.group(1)
-        named_imports = [n.strip() for n in named_str.split(",") if n.strip()]
-        before_brace = before_from[:brace_match.start()].strip().rstrip(",").strip()
+    # First "{" and the next "}" after it: what r"\{([^}]*)\}" would match.
+    brace_open = before_from.find("{")
+    brace_close = before_from.find("}", brace_open + 1) if brace_open >= 0 else -1
+    if brace_close >= 0:
+        named_str = before_from[brace_open + 1 : brace_close]
+        named_imports = [n for n in map(str.strip, named_str.split(",")) if n]
+        before_brace = before_from[:brace_open].strip().rstrip(",").strip()
         if before_brace:
             default_import = before_brace
     else:
@@ -304,12 +376,7 @@ def remove_symbols_from_import_stmt(
             inner = ",\n  ".join(remaining_named)
             parts.append("{\n  " + inner + "\n}")
 
-    indent = ""
-    for ch in import_stmt:
-        if ch in " \t":
-            indent += ch
-        else:
-            break
+    indent = import_stmt[: len(import_stmt) - len(import_stmt.lstrip(" \t"))]
     return f"{indent}import {type_prefix}{', '.join(parts)} {from_clause}\n", removed_symbols
 
 
@@ -388,13 +455,43 @@ def _process_import_statement(
 
 
 def _collect_import_statement(lines: list[str], start: int) -> tuple[list[str], int]:
-    import_lines = [lines[start]]
+    """Gather the lines of the import starting at *start*; return them and the last index.
+
+    The statement is complete once the text so far ends with ``;`` or the first
+    ``from `` is followed by a quoted specifier with both quotes present. Each
+    line is scanned once: only the tail past the first ``from `` is tracked, by
+    its opening character and the number of matching quotes seen.
+    """
+    import_lines: list[str] = []
     idx = start
-    while not _is_import_complete("".join(import_lines)):
+    pending = ""  # unscanned tail that may hold the start of a split "from "
+    opener = None  # first non-blank character after the first "from "
+    quotes = 0
+    while True:
+        line = lines[idx]
+        import_lines.append(line)
+        if line.rstrip().endswith(";"):
+            break
+        if opener is None:
+            if pending is not None:
+                pending += line
+                from_idx = pending.find("from ")
+                if from_idx == -1:
+                    pending = pending[-4:]
+                    line = ""
+                else:
+                    line = pending[from_idx + 5 :]
+                    pending = None
+            line = line.lstrip()
+            if line:
+                opener = line[0]
+        if opener in ("'", '"'):
+            quotes += line.count(opener)
+            if quotes >= 2:
+                break
         idx += 1
         if idx >= len(lines):
             break
-        import_lines.append(lines[idx])
     return import_lines, idx
 
 
@@ -422,17 +519,3 @@ def _advance_after_removed_import(lines: list[str], import_end: int, prior_outpu
     if next_idx < len(lines) and lines[next_idx].strip() == "" and prior_output and prior_output[-1].strip() == "":
         next_idx += 1
     return next_idx
-
-
-def _is_import_complete(text: str) -> bool:
-    stripped = text.strip()
-    if stripped.endswith(";"):
-        return True
-    if "from " not in stripped:
-        return False
-    trailing = stripped.split("from ", 1)[-1].strip()
-    if (trailing.startswith("'") and trailing.count("'") >= 2) or (
-        trailing.startswith('"') and trailing.count('"') >= 2
-    ):
-        return True
-    return False
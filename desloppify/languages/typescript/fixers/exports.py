@@ -10,6 +10,8 @@ _EXPORT_DECL_RE = re.compile(
     r"^(\s*)export\s+(declare\s+)?"
     r"((?:const|let|var|function|async\s+function|class|abstract\s+class|type|interface|enum)\s)"
 )
+_BRACE_LIST_RE = re.compile(r"\{([^}]*)\}")
+_FROM_CLAUSE_RE = re.compile(r"from\s+['\"].*?['\"];?\s*$")
 
 
 def fix_dead_exports(
@@ -31,13 +33,17 @@ def fix_dead_exports(
         lines: list[str],
         file_entries: list[dict[str, Any]],
     ) -> tuple[list[str], list[str]]:
-        target_lines = {e["line"] for e in file_entries}  # 1-indexed
+        entries_by_line: dict[int, list[dict[str, Any]]] = {}  # 1-indexed
+        for e in file_entries:
+            entries_by_line.setdefault(e["line"], []).append(e)
         removed_names = []
 
-        for line_idx in range(len(lines)):
-            lineno = line_idx + 1
-            if lineno not in target_lines:
+        # Visit only target lines, in file order.
+        for lineno in sorted(entries_by_line):
+            line_idx = lineno - 1
+            if not 0 <= line_idx < len(lines):
                 continue
+            line_entries = entries_by_line[lineno]
 
             line = lines[line_idx]
             m = _EXPORT_DECL_RE.match(line)
@@ -47,19 +53,14 @@ def fix_dead_exports(
                 decl_keyword = m.group(3)
                 rest = line[m.end() :]
                 lines[line_idx] = f"{indent}{declare}{decl_keyword}{rest}"
-                name = next(
-                    (e["name"] for e in file_entries if e["line"] == lineno), "?"
-                )
-                removed_names.append(name)
+                removed_names.append(line_entries[0]["name"])
                 continue
 
             # Handle: export { name1, name2 }
             stripped = line.strip()
             if stripped.startswith("export {"):
-                names_in_entry = {
-                    e["name"] for e in file_entries if e["line"] == lineno
-                }
-                brace_content = re.search(r"\{([^}]*)\}", stripped)
+                names_in_entry = {e["name"] for e in line_entries}
+                brace_content = _BRACE_LIST_RE.search(stripped)
                 if brace_content:
                     all_names = [
                         n.strip()
@@ -76,7 +77,7 @@ def fix_dead_exports(
                     else:
                         indent_str = line[: len(line) - len(line.lstrip())]
                         from_clause = ""
-                        from_match = re.search(r"from\s+['\"].*?['\"];?\s*$", stripped)
+                        from_match = _FROM_CLAUSE_RE.search(stripped)
                         if from_match:
                             from_clause = " " + from_match.group(0).rstrip()
                             if not from_clause.rstrip().endswith(";"):
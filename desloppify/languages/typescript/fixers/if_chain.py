@@ -5,7 +5,7 @@ from typing import Any
 from desloppify.languages.typescript.detectors._smell_helpers import scan_code
 from desloppify.languages.typescript.fixers.common import (
     apply_fixer,
-    collapse_blank_lines,
+    collapse_blank_lines_spans,
 )
 
 
@@ -28,7 +28,7 @@ def fix_empty_if_chain(
         lines: list[str],
         file_entries: list[dict[str, Any]],
     ) -> tuple[list[str], list[str]]:
-        lines_to_remove: set[int] = set()
+        removed_spans: list[tuple[int, int]] = []
 
         for e in file_entries:
             line_idx = e["line"] - 1
@@ -36,10 +36,9 @@ def fix_empty_if_chain(
                 continue
 
             end = _find_if_chain_end(lines, line_idx)
-            for idx in range(line_idx, end + 1):
-                lines_to_remove.add(idx)
+            removed_spans.append((line_idx, end))
 
-        new_lines = collapse_blank_lines(lines, lines_to_remove)
+        new_lines = collapse_blank_lines_spans(lines, removed_spans)
         return new_lines, ["empty_if_chain"]
 
     return apply_fixer(entries, transform, dry_run=dry_run)
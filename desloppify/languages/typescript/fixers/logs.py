@@ -266,7 +266,7 @@ def _remove_empty_blocks(lines: list[str]) -> list[str]:
                     body = "".join(lines[i : end + 1])
                     inner = extract_body_between_braces(body, search_after="=>")
                     if inner is not None and inner.strip() == "":
-                        if new_lines and new_lines[-1].strip().startswith("//"):
+                        if new_lines and new_lines[-1].lstrip().startswith("//"):
                             new_lines.pop()
                         changed = True
                         i = end + 1
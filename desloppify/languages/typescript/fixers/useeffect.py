@@ -4,7 +4,7 @@ from typing import Any
 
 from desloppify.languages.typescript.fixers.common import (
     apply_fixer,
-    collapse_blank_lines,
+    collapse_blank_lines_spans,
     find_balanced_end,
 )
 
@@ -28,7 +28,7 @@ def fix_dead_useeffect(
         lines: list[str],
         file_entries: list[dict[str, Any]],
     ) -> tuple[list[str], list[str]]:
-        lines_to_remove: set[int] = set()
+        removed_spans: list[tuple[int, int]] = []
 
         for e in file_entries:
             line_idx = e["line"] - 1
@@ -39,14 +39,12 @@ def fix_dead_useeffect(
             if end is None:
                 continue
 
-            for idx in range(line_idx, end + 1):
-                lines_to_remove.add(idx)
-
             # Remove preceding comment if orphaned
-            if line_idx > 0 and lines[line_idx - 1].strip().startswith("//"):
-                lines_to_remove.add(line_idx - 1)
+            if line_idx > 0 and lines[line_idx - 1].lstrip().startswith("//"):
+                line_idx -= 1
+            removed_spans.append((line_idx, end))
 
-        new_lines = collapse_blank_lines(lines, lines_to_remove)
+        new_lines = collapse_blank_lines_spans(lines, removed_spans)
         return new_lines, ["dead_useeffect"]
 
     return apply_fixer(entries, transform, dry_run=dry_run)
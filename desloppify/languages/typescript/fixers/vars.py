@@ -4,14 +4,23 @@ import logging
 import re
 import sys
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 
 from desloppify.core.fallbacks import log_best_effort_failure
-from desloppify.languages.typescript.fixers.common import collapse_blank_lines
+from desloppify.languages.typescript.fixers.common import (
+    collapse_blank_lines,
+    line_count,
+)
 from desloppify.utils import PROJECT_ROOT, c, rel, safe_write_text
 
 _DESTR_MEMBER_RE = re.compile(r"^\s*(\w+)\s*(?:=\s*[^,]+)?\s*,?\s*$")
 _REST_ELEMENT_RE = re.compile(r"\.\.\.\w+")
+_DIRECT_VAR_DECL_RE = re.compile(r"\s*(?:const|let|var)\s+\w+\s*=")
+_OBJECT_DESTR_RE = re.compile(r"\s*(?:const|let|var)\s*\{")
+_ARRAY_DESTR_RE = re.compile(r"\s*(?:const|let|var)\s*\[")
+_PARAM_LIST_OPEN_RE = re.compile(r"(?:function|=>)\s*\(")
+_BRACE_BLOCK_RE = re.compile(r"\{([^}]*)\}")
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +33,7 @@ def _record_direct_var_removal(
     removed_names: list[str],
     skip_reasons: dict[str, int],
 ) -> bool:
-    if not re.match(r"\s*(?:const|let|var)\s+\w+\s*=", stripped):
+    if not _DIRECT_VAR_DECL_RE.match(stripped):
         return False
     rhs = stripped.split("=", 1)[1] if "=" in stripped else ""
     if stripped.rstrip().endswith(";") and "(" not in rhs:
@@ -66,7 +75,7 @@ def _handle_unused_entry(
             skip_reasons["no_destr_context"] += 1
         return
 
-    if re.match(r"\s*(?:const|let|var)\s*\{", stripped):
+    if _OBJECT_DESTR_RE.match(stripped):
         destr_text = _collect_full_statement(lines, line_idx)
         if _REST_ELEMENT_RE.search(destr_text):
             skip_reasons["rest_element"] += 1
@@ -75,10 +84,10 @@ def _handle_unused_entry(
         removed_names.append(name)
         return
 
-    if re.match(r"\s*(?:const|let|var)\s*\[", stripped):
+    if _ARRAY_DESTR_RE.match(stripped):
         skip_reasons["array_destructuring"] += 1
         return
-    if re.search(r"(?:function|=>)\s*\(", stripped) or re.match(r"\s*\(", stripped):
+    if _PARAM_LIST_OPEN_RE.search(stripped) or stripped.lstrip().startswith("("):
         skip_reasons["function_param"] += 1
         return
     if _record_direct_var_removal(
@@ -133,6 +142,7 @@ def fix_unused_vars(
             )
             original = p.read_text()
             lines = original.splitlines(keepends=True)
+            original_line_count = len(lines)
 
             lines_to_remove: set[int] = set()
             inline_removals: dict[int, set[str]] = defaultdict(set)
@@ -154,9 +164,7 @@ def fix_unused_vars(
 
             new_content = "".join(new_lines)
             if new_content != original:
-                lines_removed = len(original.splitlines()) - len(
-                    new_content.splitlines()
-                )
+                lines_removed = original_line_count - line_count(new_content)
                 results.append(
                     {
                         "file": filepath,
@@ -182,18 +190,19 @@ def fix_unused_vars(
     return results, dict(skip_reasons)
 
 
+@lru_cache(maxsize=1024)
+def _destr_member_re(name: str) -> re.Pattern[str]:
+    """Compile the destructuring-member matcher for `name` once per name."""
+    return re.compile(
+        rf"(?:type\s+)?{re.escape(name)}\s*"
+        r"(?:[,}]|=\s*[^,]+[,}]|:\s*\w+\s*[,}]|$|=\s*[^,]+\s*$|,)"
+    )
+
+
 def _is_destr_member_line(stripped: str, name: str) -> bool:
     """Check if a stripped line is a destructuring member matching `name`."""
-    patterns = [
-        rf"^(?:type\s+)?{re.escape(name)}\s*[,}}]",
-        rf"^(?:type\s+)?{re.escape(name)}\s*=\s*[^,]+[,}}]",
-        rf"^(?:type\s+)?{re.escape(name)}\s*:\s*\w+\s*[,}}]",
-        rf"^(?:type\s+)?{re.escape(name)}\s*$",
-        rf"^(?:type\s+)?{re.escape(name)}\s*=\s*[^,]+\s*$",
-        rf"^(?:type\s+)?{re.escape(name)}\s*,",
-    ]
     clean = stripped.split("//")[0].strip()
-    return any(re.match(p, clean) for p in patterns)
+    return _destr_member_re(name).match(clean) is not None
 
 
 def _find_destr_open_brace(lines: list[str], member_idx: int) -> int | None:
@@ -243,7 +252,7 @@ def _remove_names_from_destr(
     Returns None if we can't safely parse/modify.
     """
     line = lines[line_idx]
-    brace_match = re.search(r"\{([^}]*)\}", line)
+    brace_match = _BRACE_BLOCK_RE.search(line)
     if not brace_match:
         return None
 
@@ -351,12 +351,9 @@ def _phase_structural(
 
 def _make_boundary_findings(
     single_entries: list[dict],
-    path: Path,
-    graph: dict,
+    boundary_entries: list[dict],
     lang: LangConfig,
-    shared_prefix: str,
-    tools_prefix: str,
-) -> tuple[list[dict], int]:
+) -> list[dict]:
     """Create boundary-candidate findings, deduplicated against single-use."""
     single_use_emitted = set()
     for e in single_entries:
@@ -369,13 +366,6 @@ def _make_boundary_findings(
 
     results = []
     deduped = 0
-    boundary_entries, total_shared = coupling_detector_mod.detect_boundary_candidates(
-        path,
-        graph,
-        shared_prefix=shared_prefix,
-        tools_prefix=tools_prefix,
-        skip_basenames={"index.ts", "index.tsx"},
-    )
     for e in boundary_entries:
         if rel(e["file"]) in single_use_emitted:
             deduped += 1
@@ -398,7 +388,7 @@ def _make_boundary_findings(
         )
     if deduped:
         log(f"         ({deduped} boundary candidates skipped — covered by single_use)")
-    return results, total_shared
+    return results
 
 
 def _phase_coupling(path: Path, lang: LangConfig) -> tuple[list[dict], dict[str, int]]:
@@ -421,9 +411,14 @@ def _phase_coupling(path: Path, lang: LangConfig) -> tuple[list[dict], dict[str,
     )
     shared_prefix = f"{SRC_PATH}/shared/"
     tools_prefix = f"{SRC_PATH}/tools/"
-    coupling_entries, coupling_edges = coupling_detector_mod.detect_coupling_violations(
-        path, graph, shared_prefix=shared_prefix, tools_prefix=tools_prefix
+    coupling = coupling_detector_mod.detect_all_coupling(
+        path,
+        graph,
+        shared_prefix=shared_prefix,
+        tools_prefix=tools_prefix,
+        skip_basenames={"index.ts", "index.tsx"},
     )
+    coupling_entries, coupling_edges = coupling["violations"]
     coupling_entries = filter_entries(zm, coupling_entries, "coupling")
     for e in coupling_entries:
         results.append(
@@ -443,15 +438,12 @@ def _phase_coupling(path: Path, lang: LangConfig) -> tuple[list[dict], dict[str,
         )
 
     # TS-specific: boundary candidates (deduplicated against single-use)
-    boundary_findings, _ = _make_boundary_findings(
-        single_entries, path, graph, lang, shared_prefix, tools_prefix
+    results.extend(
+        _make_boundary_findings(single_entries, coupling["boundary"][0], lang)
     )
-    results.extend(boundary_findings)
 
     # TS-specific: cross-tool imports
-    cross_tool, cross_edges = coupling_detector_mod.detect_cross_tool_imports(
-        path, graph, tools_prefix=tools_prefix
-    )
+    cross_tool, cross_edges = coupling["cross_tool"]
     cross_tool = filter_entries(zm, cross_tool, "coupling")
     for e in cross_tool:
         results.append(
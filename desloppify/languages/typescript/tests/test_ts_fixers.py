@@ -5,19 +5,28 @@ Covers: __init__, common, imports, vars, logs, params, exports, if_chain, useeff
 
 import textwrap
 
+import pytest
+
 from desloppify.languages.typescript.fixers import __all__
 from desloppify.languages.typescript.fixers.common import (
+    _collect_import_statement,
     apply_fixer,
     collapse_blank_lines,
+    collapse_blank_lines_spans,
     extract_body_between_braces,
     find_balanced_end,
+    line_count,
+    remove_symbols_from_import_stmt,
 )
 from desloppify.languages.typescript.fixers.exports import fix_dead_exports
 from desloppify.languages.typescript.fixers.if_chain import (
     _find_if_chain_end,
     fix_empty_if_chain,
 )
-from desloppify.languages.typescript.fixers.imports import fix_unused_imports
+from desloppify.languages.typescript.fixers.imports import (
+    _process_file_lines,
+    fix_unused_imports,
+)
 from desloppify.languages.typescript.fixers.logs import fix_debug_logs
 from desloppify.languages.typescript.fixers.params import (
     _is_param_context,
@@ -100,6 +109,14 @@ class TestCommonFindBalancedEnd:
         lines = ["foo(\n", "  bar\n"]
         assert find_balanced_end(lines, 0, track="parens") is None
 
+    def test_only_tracked_pair_ends_scan(self):
+        """Other bracket kinds never close the tracked depth."""
+        lines = ["if (x) {\n", "  a) ] [b\n", "}\n", ")\n"]
+        assert find_balanced_end(lines, 0, track="braces") == 2
+        assert find_balanced_end(lines, 0, track="all") == 0
+        assert find_balanced_end(["{ ( [\n", "] } )\n"], 0, track="parens") == 1
+        assert find_balanced_end(lines, 0, track="brackets") is None
+
 
 class TestCommonExtractBody:
     """Tests for extract_body_between_braces()."""
@@ -131,6 +148,17 @@ class TestCommonExtractBody:
         """Returns None if search_after marker not found."""
         assert extract_body_between_braces("no marker", search_after="=>") is None
 
+    def test_escaped_quotes_and_templates_are_skipped(self):
+        """Braces in strings (including escaped quotes) don't affect depth."""
+        text = "f() { a('\\'}'); b(\"\\\\\"); c(`${x}}`); { } } tail }"
+        assert extract_body_between_braces(text) == (
+            " a('\\'}'); b(\"\\\\\"); c(`${x}}`); { } "
+        )
+
+    def test_unterminated_string_hides_remaining_braces(self):
+        """An unclosed string literal runs to the end of the text."""
+        assert extract_body_between_braces("f() { 'open } }") is None
+
 
 class TestCommonCollapseBlankLines:
     """Tests for collapse_blank_lines()."""
@@ -153,6 +181,26 @@ class TestCommonCollapseBlankLines:
         result = collapse_blank_lines(lines)
         assert result == ["x\n", "\n", "y\n"]
 
+    def test_keeps_first_blank_verbatim_across_removed_lines(self):
+        """Whitespace-only lines count as blank; the first of a run is kept as-is."""
+        lines = ["a\n", "  \n", "drop\n", "\t\n", "\x0c\n", "b\n"]
+        result = collapse_blank_lines(lines, removed_indices={2})
+        assert result == ["a\n", "  \n", "b\n"]
+
+    def test_spans_match_index_removal(self):
+        """Unordered, overlapping and empty spans remove the same lines as a set."""
+        lines = ["a\n", "b\n", "\n", "c\n", "\n", "\n", "d\n", "e\n"]
+        spans = [(5, 6), (1, 1), (4, 5), (3, 2)]
+        assert collapse_blank_lines_spans(lines, spans) == collapse_blank_lines(
+            lines, {1, 4, 5, 6}
+        )
+        assert collapse_blank_lines_spans(lines, spans) == [
+            "a\n",
+            "\n",
+            "c\n",
+            "e\n",
+        ]
+
 
 class TestCommonApplyFixer:
     """Tests for apply_fixer() template."""
@@ -217,6 +265,44 @@ class TestCommonApplyFixer:
         tmp_files = list(tmp_path.glob("*.tmp"))
         assert tmp_files == []
 
+    def test_unexpected_error_stops_before_later_files(self, tmp_path):
+        """Non-I/O errors propagate at once; later files are left untouched."""
+        entries = []
+        for idx in range(3):
+            ts_file = tmp_path / f"f{idx}.ts"
+            ts_file.write_text("keep\ndrop\n")
+            entries.append({"file": str(ts_file)})
+
+        def transform(lines, file_entries):
+            if file_entries[0]["file"].endswith("f1.ts"):
+                raise ValueError("boom")
+            return [line for line in lines if "drop" not in line], ["drop"]
+
+        with pytest.raises(ValueError, match="boom"):
+            apply_fixer(entries, transform, dry_run=False)
+        assert (tmp_path / "f0.ts").read_text() == "keep\n"
+        assert (tmp_path / "f1.ts").read_text() == "keep\ndrop\n"
+        assert (tmp_path / "f2.ts").read_text() == "keep\ndrop\n"
+
+    def test_lines_removed_counts_in_place_transform_and_trailing_newline(
+        self, tmp_path
+    ):
+        """lines_removed uses the pre-transform count even if lines are mutated."""
+        ts_file = tmp_path / "test.ts"
+        ts_file.write_text("a\nb\nc")
+
+        def transform(lines, file_entries):
+            del lines[1:]
+            lines[0] = "a"
+            return lines, ["b", "c"]
+
+        results = apply_fixer([{"file": str(ts_file)}], transform, dry_run=True)
+        assert results[0]["lines_removed"] == 2
+
+    def test_line_count_matches_splitlines(self):
+        for text in ("", "a", "a\n", "a\nb", "\n\n", "a\x0cb\n", "a\u2028b"):
+            assert line_count(text) == len(text.splitlines())
+
 
 # =====================================================================
 # imports.py — fix_unused_imports
@@ -364,6 +450,59 @@ class TestFixUnusedImports:
         assert results[0]["removed"] == ["utils"]
         assert "import * as utils" not in content
 
+    def test_remove_symbols_keeps_from_clause_attrs_and_comment(self):
+        """Aliases, import attributes and a trailing comment survive removal."""
+        stmt = "import D, { a, b as c, d } from './m' assert { type: 'json' }; // from 'z'\n"
+        cleaned, removed = remove_symbols_from_import_stmt(stmt, {"c", "D"})
+        assert removed == {"c", "D"}
+        assert cleaned == (
+            "import { a, d } from './m' assert { type: 'json' }; // from 'z'\n"
+        )
+        assert remove_symbols_from_import_stmt(
+            "\t  import { a, b } from 'm';\n", {"a"}
+        ) == ("\t  import { b } from 'm';\n", {"a"})
+        assert remove_symbols_from_import_stmt("import { a } from 'm';", {"a"}) == (
+            None,
+            {"a"},
+        )
+
+    def test_process_file_lines_keeps_passthrough_spans_in_order(self):
+        """Lines around imports are copied verbatim, continuations are not re-parsed."""
+        lines = [
+            "// header\n",
+            "import {\n",
+            "import a,\n",
+            "  b } from './m';\n",
+            "const x = 1;\n",
+            "import c from 'c';\n",
+            "tail",
+        ]
+        result, removed = _process_file_lines(lines, {"a", "c"}, {3: ["a"], 6: ["c"]})
+        assert result == lines[:5] + ["tail"]
+        assert removed == {"c"}
+
+    def test_collect_import_statement_spans_until_specifier_closes(self):
+        """Multi-line imports end at the quoted specifier or a semicolon."""
+        lines = [
+            "import {\n",
+            "  from as f,\n",
+            "  b,\n",
+            '} from "./m"\n',
+            "const x = 1;\n",
+        ]
+        # The first "from " is a member name, so only the ";" can end it.
+        assert _collect_import_statement(lines, 0) == (lines, 4)
+        lines[1] = "  a,\n"
+        assert _collect_import_statement(lines, 0) == (lines[:4], 3)
+        assert _collect_import_statement(["import a from \n", "'./m'\n"], 0) == (
+            ["import a from \n", "'./m'\n"],
+            1,
+        )
+        assert _collect_import_statement(["import {\n", "  a,\n"], 0) == (
+            ["import {\n", "  a,\n"],
+            2,
+        )
+
 
 # =====================================================================
 # vars.py — fix_unused_vars
@@ -732,6 +871,19 @@ class TestFixDeadExports:
         assert len(results) == 1
         assert ts_file.read_text() == original
 
+    def test_partial_named_export_and_out_of_range_targets(self, tmp_path):
+        """Several dead names on one line are dropped together; stale lines are ignored."""
+        ts_file = tmp_path / "index.ts"
+        ts_file.write_text("const x = 1;\nexport { a, b as c, d } from './m';\n")
+        entries = [
+            {"file": str(ts_file), "line": 2, "name": "a"},
+            {"file": str(ts_file), "line": 9, "name": "gone"},
+            {"file": str(ts_file), "line": 2, "name": "d"},
+        ]
+        results = fix_dead_exports(entries, dry_run=False)
+        assert sorted(results[0]["removed"]) == ["a", "d"]
+        assert ts_file.read_text().splitlines()[1] == "export { b as c } from './m';"
+
 
 # =====================================================================
 # if_chain.py — fix_empty_if_chain, _find_if_chain_end
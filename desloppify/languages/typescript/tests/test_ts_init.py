@@ -88,3 +88,35 @@ def test_config_build_dep_graph_callable():
     """TypeScriptConfig.build_dep_graph is a callable."""
     cfg = TypeScriptConfig()
     assert callable(cfg.build_dep_graph)
+
+
+def test_smell_fixers_share_one_detection_pass(tmp_path, monkeypatch):
+    """Smell fixers reuse detection until a source file changes."""
+    import desloppify.languages.typescript as ts_mod
+
+    src = tmp_path / "a.ts"
+    src.write_text("const a = 1;\n")
+    calls = []
+
+    def _fake_detect(path):
+        calls.append(path)
+        return [{"id": "dead_useeffect", "matches": [{"file": str(src)}]}], 1
+
+    monkeypatch.setattr(ts_mod, "find_ts_files", lambda _path: [str(src)])
+    monkeypatch.setattr(ts_mod.smells_detector_mod, "detect_smells", _fake_detect)
+    monkeypatch.setattr(ts_mod, "_SMELL_INDEX_CACHE", {})
+
+    fixers = TypeScriptConfig().fixers
+    assert fixers["dead-useeffect"].detect(tmp_path) == [{"file": str(src)}]
+    assert fixers["empty-if-chain"].detect(tmp_path) == []
+    assert len(calls) == 1
+
+    src.write_text("const a = 1;\nconst b = 2;\n")
+    fixers["dead-useeffect"].detect(tmp_path)
+    assert len(calls) == 2
+
+    other = tmp_path / "other"
+    other.mkdir()
+    fixers["dead-useeffect"].detect(other)
+    fixers["dead-useeffect"].detect(tmp_path)
+    assert len(calls) == 3
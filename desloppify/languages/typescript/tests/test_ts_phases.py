@@ -91,16 +91,16 @@ def test_phase_coupling_passes_orphaned_options(monkeypatch, tmp_path: Path):
         lambda _path, _graph, barrel_names: ([], 0),
     )
     monkeypatch.setattr(
-        "desloppify.engine.detectors.coupling.detect_coupling_violations",
-        lambda _path, _graph, shared_prefix, tools_prefix: ([], 0),
-    )
-    monkeypatch.setattr(
-        "desloppify.engine.detectors.coupling.detect_cross_tool_imports",
-        lambda _path, _graph, tools_prefix: ([], 0),
+        "desloppify.engine.detectors.coupling.detect_all_coupling",
+        lambda _path, _graph, shared_prefix, tools_prefix, skip_basenames: {
+            "violations": ([], 0),
+            "boundary": ([], 0),
+            "cross_tool": ([], 0),
+        },
     )
     monkeypatch.setattr(
         "desloppify.languages.typescript.phases._make_boundary_findings",
-        lambda single_entries, path, graph, lang, shared_prefix, tools_prefix: ([], 0),
+        lambda single_entries, boundary_entries, lang: [],
     )
     monkeypatch.setattr(
         "desloppify.engine.detectors.graph.detect_cycles",
@@ -7,6 +7,7 @@ stable, non-private API used by commands, review flows, and language phases.
 from desloppify.engine.state_internal.filtering import (
     add_ignore,
     is_ignored,
+    iter_path_scoped_findings,
     make_finding,
     path_scoped_findings,
     remove_ignored_findings,
@@ -51,6 +52,7 @@ __all__ = [
     "get_strict_score",
     "get_verified_strict_score",
     "is_ignored",
+    "iter_path_scoped_findings",
     "json_default",
     "load_state",
     "make_finding",
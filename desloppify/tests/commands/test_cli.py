@@ -476,6 +476,23 @@ class TestResolveLang:
         assert lang is not None
         assert lang.name == "python"
 
+    def test_memoises_resolution_per_args(self, monkeypatch):
+        calls: list[str] = []
+
+        def _fake_get_lang(name):
+            calls.append(name)
+            return SimpleNamespace(name=name)
+
+        monkeypatch.setattr(lang_helpers_mod.lang_api, "get_lang", _fake_get_lang)
+        args = SimpleNamespace(lang="python", path="/tmp/somewhere")
+        first = resolve_lang(args)
+        assert resolve_lang(args) is first
+        assert calls == ["python"]
+
+        args.path = "/tmp/elsewhere"
+        assert resolve_lang(args) is not first
+        assert calls == ["python", "python"]
+
     def test_auto_detect_uses_path_when_it_looks_like_project_root(
         self, tmp_path, monkeypatch
     ):
@@ -105,3 +105,19 @@ def test_scaffold_lang_wires_pyproject_once(tmp_path, monkeypatch):
     second = pyproject.read_text()
     assert second.count("desloppify.languages.ruby.tests*") == 0
     assert second.count("desloppify/languages/ruby/tests") == 1
+
+
+def test_parse_toml_string_list_handles_plain_strings():
+    assert dev_mod._parse_toml_string_list("") == []
+    assert dev_mod._parse_toml_string_list('\n  "a",\n  \'b\',\n') == ["a", "b"]
+
+
+def test_parse_toml_string_list_rejects_non_string_items():
+    assert dev_mod._parse_toml_string_list("1, 2") is None
+    assert dev_mod._parse_toml_string_list('"a" "b"') is None
+    assert dev_mod._parse_toml_string_list('"a\\"b"') is None
+
+
+def test_class_name_camel_cases_segments():
+    assert dev_mod._class_name("ruby") == "RubyConfig"
+    assert dev_mod._class_name("objective_c") == "ObjectiveCConfig"
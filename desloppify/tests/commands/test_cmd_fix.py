@@ -1,5 +1,8 @@
 """Tests for fix command helpers."""
 
+import os
+import time
+
 import pytest
 
 import desloppify.app.commands.fix.apply_flow as fix_apply_mod
@@ -81,6 +84,12 @@ class TestFixResult:
         r1.skip_reasons["test"] = 5
         assert r2.skip_reasons == {}
 
+    def test_slotted_without_instance_dict(self):
+        r = FixResult(entries=[])
+        assert not hasattr(r, "__dict__")
+        with pytest.raises(AttributeError):
+            r.extra = 1
+
     def test_entries_behave_as_list(self):
         r = FixResult(entries=[{"file": "a.ts", "removed": ["x"]}])
         r.entries.append({"file": "b.ts", "removed": ["y"]})
@@ -157,6 +166,26 @@ class TestResolveFixerResults:
         assert "auto-fixed" in note
         assert "unused-imports" in note
 
+    def test_ignores_other_detectors(self, monkeypatch):
+        monkeypatch.setattr(fix_apply_mod, "rel", lambda p: p)
+
+        state = self._make_state_with_findings(("unused::a.ts::foo", "open"))
+        state["findings"]["exports::a.ts::foo"] = {"status": "open", "note": None}
+        results = [{"file": "a.ts", "removed": ["foo"]}]
+        resolved = _resolve_fixer_results(state, results, "exports", "dead-exports")
+        assert resolved == ["exports::a.ts::foo"]
+        assert state["findings"]["unused::a.ts::foo"]["status"] == "open"
+
+    def test_duplicate_removed_symbols_resolve_once(self, monkeypatch):
+        monkeypatch.setattr(fix_apply_mod, "rel", lambda p: p)
+
+        state = self._make_state_with_findings(
+            ("unused::a.ts::foo", "open"), ("unused::a.ts::bar", "open")
+        )
+        results = [{"file": "a.ts", "removed": ["foo", "foo", "bar", "bar"]}]
+        resolved = _resolve_fixer_results(state, results, "unused", "unused-imports")
+        assert resolved == ["unused::a.ts::foo", "unused::a.ts::bar"]
+
     def test_multiple_files(self, monkeypatch):
         monkeypatch.setattr(fix_apply_mod, "rel", lambda p: p)
 
@@ -263,7 +292,6 @@ class TestFixNarrativeReminders:
         captured_kwargs = {}
 
         monkeypatch.setattr(fix_mod, "write_query", lambda _payload: None)
-        monkeypatch.setattr(fix_mod, "resolve_lang", lambda _args: None)
 
         def _fake_narrative(_state, **kwargs):
             captured_kwargs.update(kwargs)
@@ -290,3 +318,82 @@ class TestFixNarrativeReminders:
         _ = capsys.readouterr().out
         context = captured_kwargs["context"]
         assert context.command == "fix"
+
+
+class TestDryRunSamples:
+    def test_sample_prints_context_window(self, tmp_path, capsys):
+        from desloppify.app.commands._show_terminal import show_fix_dry_run_samples
+
+        target = tmp_path / "a.ts"
+        target.write_text("line one\nline two\nline three\nline four\n")
+        entries = [{"file": str(target), "name": "foo", "line": 2}]
+        results = [{"file": str(target), "removed": ["foo"]}]
+        show_fix_dry_run_samples(entries, results)
+        out = capsys.readouterr().out
+        assert "foo (line 2):" in out
+        assert "line one" in out
+        assert "line three" in out
+        assert "line four" not in out
+
+    def test_sample_skips_out_of_range_lines(self, tmp_path, capsys):
+        from desloppify.app.commands._show_terminal import show_fix_dry_run_samples
+
+        target = tmp_path / "a.ts"
+        target.write_text("only line\n")
+        entries = [{"file": str(target), "name": "foo", "line": 5}]
+        results = [{"file": str(target), "removed": ["foo"]}]
+        show_fix_dry_run_samples(entries, results)
+        assert "foo (line 5)" not in capsys.readouterr().out
+
+
+class TestWarnUncommittedChanges:
+    def test_env_gate_skips_git_subprocess(self, monkeypatch):
+        monkeypatch.setenv("DESLOPPIFY_SKIP_GIT_CHECK", "1")
+        monkeypatch.setattr(
+            fix_apply_mod.subprocess,
+            "Popen",
+            lambda *_a, **_k: pytest.fail("git status should not run"),
+        )
+        fix_apply_mod._warn_uncommitted_changes()
+
+    def test_warns_when_porcelain_has_output(self, monkeypatch, capsys):
+        monkeypatch.delenv("DESLOPPIFY_SKIP_GIT_CHECK", raising=False)
+        monkeypatch.setattr(fix_apply_mod, "_has_uncommitted_changes", lambda: True)
+        fix_apply_mod._warn_uncommitted_changes()
+        assert "uncommitted changes" in capsys.readouterr().out
+
+    @staticmethod
+    def _fake_git(tmp_path, monkeypatch, script: str) -> None:
+        if os.name == "nt":
+            pytest.skip("fake git executable is a POSIX shell script")
+        fake_git = tmp_path / "bin" / "git"
+        fake_git.parent.mkdir()
+        fake_git.write_text(f"#!/bin/sh\n{script}\n")
+        fake_git.chmod(0o755)
+        monkeypatch.setenv("PATH", str(fake_git.parent))
+        monkeypatch.delenv("DESLOPPIFY_SKIP_GIT_CHECK", raising=False)
+        monkeypatch.setattr(fix_apply_mod, "_GIT_STATUS_TIMEOUT", 0.2)
+
+    def test_hanging_git_times_out_as_clean(self, tmp_path, monkeypatch):
+        self._fake_git(tmp_path, monkeypatch, "exec sleep 30")
+        started = time.monotonic()
+        assert fix_apply_mod._check_uncommitted_changes() is False
+        assert time.monotonic() - started < 5
+
+    def test_stops_reading_after_first_byte(self, tmp_path, monkeypatch):
+        self._fake_git(tmp_path, monkeypatch, "printf '?? a.txt\\n'; exec sleep 30")
+        started = time.monotonic()
+        assert fix_apply_mod._check_uncommitted_changes() is True
+        assert time.monotonic() - started < 5
+
+    def test_detects_untracked_file(self, tmp_path, monkeypatch):
+        import subprocess
+
+        monkeypatch.chdir(tmp_path)
+        try:
+            subprocess.run(["git", "init", "-q"], check=True)
+        except (OSError, subprocess.CalledProcessError):
+            pytest.skip("git unavailable")
+        assert fix_apply_mod._has_uncommitted_changes() is False
+        (tmp_path / "new.txt").write_text("x\n")
+        assert fix_apply_mod._has_uncommitted_changes() is True
@@ -4,8 +4,8 @@ import inspect
 
 import pytest
 
+import desloppify.app.commands.helpers.runtime as runtime_mod
 import desloppify.app.commands.resolve.apply as resolve_apply_mod
-import desloppify.app.commands.resolve.cmd as resolve_mod
 import desloppify.app.commands.resolve.selection as resolve_selection_mod
 import desloppify.cli as cli_mod
 import desloppify.intelligence.narrative as narrative_mod
@@ -48,7 +48,7 @@ class TestCmdResolve:
 
     def test_wontfix_without_note_exits(self, monkeypatch):
         """Wontfix without --note should exit with error."""
-        monkeypatch.setattr(resolve_mod, "state_path", lambda a: "/tmp/fake.json")
+        monkeypatch.setattr(runtime_mod, "state_path", lambda a: "/tmp/fake.json")
 
         class FakeArgs:
             status = "wontfix"
@@ -62,7 +62,7 @@ class TestCmdResolve:
         assert exc_info.value.code == 1
 
     def test_fixed_without_attestation_exits(self, monkeypatch, capsys):
-        monkeypatch.setattr(resolve_mod, "state_path", lambda a: "/tmp/fake.json")
+        monkeypatch.setattr(runtime_mod, "state_path", lambda a: "/tmp/fake.json")
 
         class FakeArgs:
             status = "fixed"
@@ -81,7 +81,7 @@ class TestCmdResolve:
         assert f'--attest "{ATTEST_EXAMPLE}"' in out
 
     def test_fixed_with_incomplete_attestation_exits(self, monkeypatch, capsys):
-        monkeypatch.setattr(resolve_mod, "state_path", lambda a: "/tmp/fake.json")
+        monkeypatch.setattr(runtime_mod, "state_path", lambda a: "/tmp/fake.json")
 
         class FakeArgs:
             status = "fixed"
@@ -101,7 +101,7 @@ class TestCmdResolve:
 
     def test_resolve_no_matches(self, monkeypatch, capsys):
         """When no findings match, should print a warning."""
-        monkeypatch.setattr(resolve_mod, "state_path", lambda a: "/tmp/fake.json")
+        monkeypatch.setattr(runtime_mod, "state_path", lambda a: "/tmp/fake.json")
 
         fake_state = {
             "findings": {},
@@ -133,7 +133,7 @@ class TestCmdResolve:
 
     def test_resolve_successful(self, monkeypatch, capsys):
         """Resolving findings should print a success message."""
-        monkeypatch.setattr(resolve_mod, "state_path", lambda a: "/tmp/fake.json")
+        monkeypatch.setattr(runtime_mod, "state_path", lambda a: "/tmp/fake.json")
         monkeypatch.setattr(resolve_apply_mod, "write_query", lambda payload: None)
 
         fake_state = {
@@ -175,8 +175,59 @@ class TestCmdResolve:
         assert "Resolved 1" in out
         assert "Scores:" in out
 
+    def test_resolve_reuses_preloaded_runtime_state(self, monkeypatch, capsys):
+        """State loaded by the CLI dispatcher is reused, not re-read from disk."""
+        from desloppify.app.commands.helpers.runtime import CommandRuntime
+
+        monkeypatch.setattr(resolve_apply_mod, "write_query", lambda payload: None)
+
+        def _no_load(sp):
+            raise AssertionError("state should not be reloaded")
+
+        fake_state = {
+            "findings": {"f1": {"status": "fixed"}},
+            "overall_score": 60,
+            "objective_score": 58,
+            "strict_score": 50,
+            "verified_strict_score": 49,
+            "stats": {},
+            "scan_count": 1,
+            "last_scan": "2025-01-01",
+        }
+        saved = []
+        monkeypatch.setattr(state_mod, "load_state", _no_load)
+        monkeypatch.setattr(
+            state_mod, "save_state", lambda state, sp: saved.append((state, sp))
+        )
+        monkeypatch.setattr(
+            state_mod,
+            "resolve_findings",
+            lambda state, pattern, status, note, **kwargs: ["f1"],
+        )
+        monkeypatch.setattr(
+            narrative_mod,
+            "compute_narrative",
+            lambda state, **kw: {"headline": "test", "milestone": None},
+        )
+        monkeypatch.setattr(cli_mod, "resolve_lang", lambda args: None)
+
+        class FakeArgs:
+            status = "fixed"
+            note = "done"
+            attest = "I have actually fixed this and I am not gaming the score."
+            patterns = ["f1"]
+            lang = None
+            path = "."
+            runtime = CommandRuntime(
+                config={}, state=fake_state, state_path="/tmp/preloaded.json"
+            )
+
+        cmd_resolve(FakeArgs())
+        assert saved == [(fake_state, "/tmp/preloaded.json")]
+        assert "Resolved 1" in capsys.readouterr().out
+
     def test_large_wontfix_batch_requires_confirmation(self, monkeypatch, capsys):
-        monkeypatch.setattr(resolve_mod, "state_path", lambda a: "/tmp/fake.json")
+        monkeypatch.setattr(runtime_mod, "state_path", lambda a: "/tmp/fake.json")
 
         fake_state = {
             "findings": {},
@@ -217,7 +268,7 @@ class TestCmdResolve:
 
 class TestCmdIgnore:
     def test_ignore_without_attestation_exits(self, monkeypatch, capsys):
-        monkeypatch.setattr(resolve_mod, "state_path", lambda a: "/tmp/fake.json")
+        monkeypatch.setattr(runtime_mod, "state_path", lambda a: "/tmp/fake.json")
 
         class FakeArgs:
             pattern = "unused::*"
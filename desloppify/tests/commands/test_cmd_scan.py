@@ -5,6 +5,7 @@ from types import SimpleNamespace
 import pytest
 
 import desloppify.app.commands.scan.scan as scan_cmd_mod
+import desloppify.app.commands.scan.scan_helpers as scan_helpers_mod
 import desloppify.intelligence.narrative as narrative_mod
 import desloppify.languages as lang_mod
 from desloppify.app.commands.scan.scan import (
@@ -21,6 +22,10 @@ from desloppify.app.commands.scan.scan import (
     _warn_explicit_lang_with_no_files,
     cmd_scan,
 )
+from desloppify.app.commands.scan.scan_helpers import _load_loc_cache, _loc_cache_file
+from desloppify.app.commands.scan.scan_workflow import (
+    _collect_codebase_metrics_with_loc_cache,
+)
 from desloppify.scoring import DIMENSIONS
 
 # ---------------------------------------------------------------------------
@@ -402,6 +407,135 @@ class TestCollectCodebaseMetrics:
         assert result["total_loc"] == 6  # 2 + 1 + 3
         assert result["total_directories"] == 2  # tmp_path and sub
 
+    def test_loc_matches_text_mode_and_skips_undecodable(self, tmp_path):
+        breaks = tmp_path / "breaks.py"
+        breaks.write_bytes(b"a\x0cb\rc\n")
+        binary = tmp_path / "blob.py"
+        binary.write_bytes(b"\xff\xfe\x00\n")
+
+        class FakeLang:
+            def file_finder(self, path):
+                return [str(breaks), str(binary)]
+
+        result = _collect_codebase_metrics(FakeLang(), tmp_path, loc_cache={})
+        assert result == {
+            "total_files": 2,
+            "total_loc": 3,
+            "total_directories": 1,
+        }
+
+    def test_loc_cache_skips_unchanged_files(self, tmp_path, monkeypatch):
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_text("line1\nline2\n")
+        b.write_text("line1\n")
+        files = [str(a), str(b)]
+
+        class FakeLang:
+            def file_finder(self, path):
+                return list(files)
+
+        outside = str(tmp_path.parent / "elsewhere" / "kept.py")
+        cache: dict = {str(tmp_path / "gone.py"): [1, 2, 3], outside: [1, 2, 3]}
+        first = _collect_codebase_metrics(FakeLang(), tmp_path, loc_cache=cache)
+        assert first["total_loc"] == 3
+        assert set(cache) == {str(a), str(b), outside}
+
+        reads = []
+        real_count = scan_helpers_mod.count_files_lines
+
+        def _tracking_count(paths):
+            reads.extend(str(p) for p in paths)
+            return real_count(paths)
+
+        monkeypatch.setattr(scan_helpers_mod, "count_files_lines", _tracking_count)
+        b.write_text("line1\nline2\nline3\n")
+        files.remove(str(a))
+        second = _collect_codebase_metrics(FakeLang(), tmp_path, loc_cache=cache)
+        assert second["total_loc"] == 3
+        assert reads == [str(b)]
+        assert set(cache) == {str(b), outside}
+
+    def test_many_files_skip_missing(self, tmp_path):
+        files = []
+        for idx in range(40):
+            f = tmp_path / f"d{idx % 3}" / f"m{idx}.py"
+            f.parent.mkdir(exist_ok=True)
+            f.write_text("x\n" * (idx + 1))
+            files.append(str(f))
+        files.append(str(tmp_path / "missing.py"))
+
+        class FakeLang:
+            def file_finder(self, path):
+                return files
+
+        result = _collect_codebase_metrics(FakeLang(), tmp_path)
+        assert result == {
+            "total_files": 41,
+            "total_loc": sum(range(1, 41)),
+            "total_directories": 3,
+        }
+
+    def test_warm_cache_only_stats_files(self, tmp_path, monkeypatch):
+        files = []
+        for idx in range(40):
+            f = tmp_path / f"m{idx}.py"
+            f.write_text("x\n" * 2)
+            files.append(str(f))
+
+        class FakeLang:
+            def file_finder(self, path):
+                return files
+
+        cache: dict = {}
+        first = _collect_codebase_metrics(FakeLang(), tmp_path, loc_cache=cache)
+        snapshot = dict(cache)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("warm scan should not read files")
+
+        monkeypatch.setattr(scan_helpers_mod, "count_files_lines", _fail)
+        second = _collect_codebase_metrics(FakeLang(), tmp_path, loc_cache=cache)
+        assert second == first == {
+            "total_files": 40,
+            "total_loc": 80,
+            "total_directories": 1,
+        }
+        assert cache == snapshot
+
+    def test_loc_cache_kept_out_of_state(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text("x\ny\n")
+
+        class FakeLang:
+            name = "python"
+
+            def file_finder(self, path):
+                return [str(src / "a.py")]
+
+        state_file = tmp_path / "state-python.json"
+        runtime = SimpleNamespace(
+            lang=FakeLang(),
+            path=src,
+            state_path=state_file,
+            state={"loc_cache": {"stale.py": [1, 2, 3]}},
+        )
+        result = _collect_codebase_metrics_with_loc_cache(runtime)
+        assert result["total_loc"] == 2
+        assert "loc_cache" not in runtime.state
+        cache_file = _loc_cache_file(state_file, "python")
+        assert cache_file == tmp_path / "loc_cache-python.json"
+        assert set(_load_loc_cache(cache_file)) == {str(src / "a.py")}
+
+    def test_load_loc_cache_ignores_corrupt_file(self, tmp_path):
+        cache_file = tmp_path / "loc_cache-python.json"
+        assert _load_loc_cache(cache_file) == {}
+        cache_file.write_text("{not json")
+        assert _load_loc_cache(cache_file) == {}
+        cache_file.write_text("[]")
+        assert _load_loc_cache(cache_file) == {}
+
 
 # ---------------------------------------------------------------------------
 # _warn_explicit_lang_with_no_files
@@ -739,3 +873,35 @@ class TestShowDimensionDeltas:
         out = capsys.readouterr().out
         assert "Moved:" in out
         assert dim_name in out
+
+
+# ---------------------------------------------------------------------------
+# show_detector_progress
+# ---------------------------------------------------------------------------
+
+
+class TestShowDetectorProgress:
+    """show_detector_progress aggregates open/total findings per detector."""
+
+    def test_counts_and_structural_merge(self, capsys):
+        from desloppify.app.commands.scan import scan_reporting_progress
+
+        findings = {
+            "a": {"detector": "unused", "status": "open"},
+            "b": {"detector": "unused", "status": "fixed"},
+            "c": {"detector": "large", "status": "open"},
+            "d": {"detector": "gods", "status": "wontfix"},
+            "e": {"status": "open"},
+        }
+        scan_reporting_progress.show_detector_progress(
+            {"findings": findings},
+            state_mod=SimpleNamespace(path_scoped_findings=lambda f, _p: f),
+            narrative_mod=SimpleNamespace(STRUCTURAL_MERGE={"large", "gods"}),
+            registry_mod=SimpleNamespace(DETECTORS={}, display_order=lambda: []),
+            colorize_fn=lambda text, _style: text,
+        )
+        lines = capsys.readouterr().out.splitlines()
+        rows = {line.split()[0]: line for line in lines[2:] if line.strip()}
+        assert rows["unused"].endswith("1 open  / 2")
+        assert rows["structural"].endswith("1 open  / 2")
+        assert rows["unknown"].endswith("1 open  / 1")
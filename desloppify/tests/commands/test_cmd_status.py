@@ -123,6 +123,47 @@ class TestShowStructuralAreas:
         out = capsys.readouterr().out
         assert "Structural Debt" in out
 
+    def test_area_rows_count_tiers_statuses_and_weight(self, capsys):
+        """Per-area rows report item, tier, open/debt counts and weight."""
+        findings = {
+            "a0": self._make_finding("a0", file="src/alpha/a.ts", tier=3),
+            "a1": self._make_finding(
+                "a1", file="src/alpha/b.ts", tier=4, status="wontfix"
+            ),
+            "a2": self._make_finding("a2", file="src/alpha/c.ts", tier=3),
+            "b0": self._make_finding("b0", file="src/beta/a.ts", tier=3),
+            "b1": self._make_finding("b1", file="src/beta/b.ts", tier=3),
+            "c0": self._make_finding("c0", file="src/beta/c.ts", tier=4, status="fixed"),
+        }
+        show_structural_areas({"findings": findings})
+        rows = {
+            line.split()[0]: line.split()
+            for line in capsys.readouterr().out.splitlines()
+            if line.strip().startswith("src/")
+        }
+        assert rows["src/alpha"][1:] == ["3", "T3:2", "T4:1", "2", "1", "10"]
+        assert rows["src/beta"][1:] == ["2", "T3:2", "T4:0", "2", "0", "6"]
+        assert list(rows) == ["src/alpha", "src/beta"]
+
+    def test_caps_table_at_fifteen_heaviest_areas(self, capsys):
+        """Only the 15 heaviest areas are listed; the rest are summarised."""
+        findings = {}
+        for i in range(18):
+            for j in range(i + 1):
+                fid = f"f{i}_{j}"
+                findings[fid] = self._make_finding(
+                    fid, file=f"src/area{i:02d}/{j}.ts", tier=3
+                )
+        show_structural_areas({"findings": findings})
+        out = capsys.readouterr().out
+        listed = [
+            line.split()[0]
+            for line in out.splitlines()
+            if line.strip().startswith("src/")
+        ]
+        assert listed == [f"src/area{i:02d}" for i in range(17, 2, -1)]
+        assert "... and 3 more areas" in out
+
     def test_handles_empty_file_path_without_crashing(self, capsys):
         """Empty file paths should bucket into unknown area instead of crashing."""
         findings = {
@@ -26,6 +26,16 @@ def test_write_query_injects_config_payload(tmp_path, monkeypatch):
     assert saved["config"]["target_strict_score"] == 97
 
 
+def test_write_query_returns_rendered_text(tmp_path, monkeypatch):
+    monkeypatch.setattr(query_mod, "load_config", lambda: {})
+    monkeypatch.setattr(query_mod, "config_for_query", lambda cfg: {})
+    query_path = tmp_path / "query.json"
+
+    rendered = query_mod.write_query({"command": "next"}, query_file=query_path)
+
+    assert rendered == query_path.read_text()
+
+
 def test_write_query_records_config_error(tmp_path, monkeypatch):
     def _raise_config_error():
         raise ValueError("invalid config")
@@ -45,6 +45,21 @@ def test_rel_path_outside_project_root(tmp_path, monkeypatch):
     assert result == expected
 
 
+def test_rel_cache_follows_project_root_and_cwd(tmp_path, monkeypatch):
+    """Memoised rel() still honours a changed PROJECT_ROOT and cwd."""
+    (tmp_path / "a").mkdir()
+    target = str(tmp_path / "a" / "x.py")
+    monkeypatch.setattr(utils_mod, "PROJECT_ROOT", tmp_path)
+    assert rel(target) == "a/x.py"
+    monkeypatch.setattr(utils_mod, "PROJECT_ROOT", tmp_path / "a")
+    assert rel(target) == "x.py"
+
+    monkeypatch.chdir(tmp_path)
+    assert rel("a/x.py") == "x.py"
+    monkeypatch.chdir(tmp_path / "a")
+    assert rel("a/x.py") == "a/x.py"
+
+
 # ── resolve_path() ───────────────────────────────────────────
 
 
@@ -416,3 +431,58 @@ def test_utils_text_read_code_snippet_absolute_path(tmp_path):
     )
     assert result is not None
     assert "alpha" in result
+
+
+# ── colorize() ───────────────────────────────────────────────
+
+
+class _FakeTTY:
+    def __init__(self, tty: bool):
+        self.tty = tty
+        self.calls = 0
+
+    def isatty(self) -> bool:
+        self.calls += 1
+        return self.tty
+
+    def write(self, _text: str) -> int:
+        return 0
+
+
+def test_colorize_caches_tty_check_per_stream(monkeypatch):
+    """isatty() is queried once per stdout object, and re-queried on swap."""
+    monkeypatch.setattr(utils_mod, "NO_COLOR", False)
+    tty = _FakeTTY(True)
+    monkeypatch.setattr("sys.stdout", tty)
+    assert utils_mod.colorize("x", "red") == "\033[31mx\033[0m"
+    assert utils_mod.colorize("y", "dim") == "\033[2my\033[0m"
+    assert tty.calls == 1
+
+    monkeypatch.setattr("sys.stdout", _FakeTTY(False))
+    assert utils_mod.colorize("x", "red") == "x"
+
+
+def test_count_lines_matches_splitlines_for_lf_and_crlf():
+    for text in ("", "a", "a\n", "a\nb", "a\r\nb\r\n", "\n\n"):
+        assert utils_mod.count_lines(text.encode()) == len(text.splitlines())
+
+
+def test_count_file_lines_matches_read_text_splitlines(tmp_path):
+    samples = ("", "a\nb", "a\r\nb\r\n", "a\rb\rc", "a\x0cb\n", "é x\n")
+    for i, text in enumerate(samples):
+        f = tmp_path / f"f{i}.txt"
+        f.write_bytes(text.encode())
+        assert utils_mod.count_file_lines(f) == len(f.read_text().splitlines())
+
+
+def test_print_table_writes_formatted_lines_once(monkeypatch, capsys):
+    """print_table emits format_table's lines in a single write."""
+    monkeypatch.setattr(utils_mod, "NO_COLOR", True)
+    lines = utils_mod.format_table(["A", "Bee"], [["x", "1"], ["yy", "22"]])
+    assert lines == ["A   Bee", "───────", "x   1  ", "yy  22 "]
+    assert utils_mod.format_table(["A"], []) == []
+
+    calls = []
+    monkeypatch.setattr("builtins.print", lambda *a, **k: calls.append(a))
+    utils_mod.print_table(["A", "Bee"], [["x", "1"], ["yy", "22"]])
+    assert calls == [("\n".join(lines),)]
@@ -237,3 +237,47 @@ def test_entry_contains_loc(tmp_path):
 
     entries, _ = detect_complexity(tmp_path, signals, finder, threshold=1, min_loc=10)
     assert entries[0]["loc"] == 60
+
+
+def test_crlf_file_loc_and_content_match_text_mode(tmp_path):
+    """CRLF files are decoded with universal newlines, as read_text() did."""
+    p = tmp_path / "crlf.py"
+    p.write_bytes(b"if True:\r\n" * 20 + b"x = 1\r\n" * 40)
+    seen = []
+
+    def _compute(content, lines):
+        seen.append("\r" in content)
+        return (len(lines), f"{len(lines)} lines")
+
+    signals = [ComplexitySignal(name="lines", compute=_compute, weight=1, threshold=0)]
+    entries, _ = detect_complexity(
+        tmp_path, signals, _file_finder_for(str(p)), threshold=1, min_loc=60
+    )
+    assert seen == [False]
+    assert entries[0]["loc"] == 60
+
+
+def test_extra_line_breaks_bypass_byte_prefilter(tmp_path):
+    """Form feeds and U+2028 split lines in text mode, so LOC must match that."""
+    p = tmp_path / "breaks.py"
+    p.write_text("if True:\x0c" * 30 + "x = 1\u2028" * 30, encoding="utf-8")
+    signals = [ComplexitySignal(name="ifs", pattern="if", weight=1, threshold=0)]
+    entries, _ = detect_complexity(
+        tmp_path, signals, _file_finder_for(str(p)), threshold=1, min_loc=60
+    )
+    assert entries[0]["loc"] == 60
+
+
+def test_literal_and_regex_patterns_count_alike(tmp_path):
+    """Literal patterns take the str.count path but score like the regex path."""
+    fp = _write_file(tmp_path, "mix.py", "x = foo()  # TODO\n" * 12 + "y = 1\n" * 40)
+    signals = [
+        ComplexitySignal(name="literal", pattern="TODO", weight=1, threshold=2),
+        ComplexitySignal(name="regex", pattern=r"#\s*TODO", weight=1, threshold=2),
+        ComplexitySignal(name="anchored", pattern=r"^y =", weight=1, threshold=30),
+    ]
+    entries, _ = detect_complexity(
+        tmp_path, signals, _file_finder_for(fp), threshold=1, min_loc=10
+    )
+    assert entries[0]["signals"] == ["12 literal", "12 regex", "40 anchored"]
+    assert entries[0]["score"] == 10 + 10 + 10
@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 from desloppify.engine.detectors.coupling import (
+    detect_all_coupling,
     detect_boundary_candidates,
     detect_coupling_violations,
     detect_cross_tool_imports,
@@ -673,3 +674,51 @@ class TestDetectCrossToolImports:
         assert total_edges == 2
         source_tools = {e["source_tool"] for e in entries}
         assert source_tools == {"editor", "viewer"}
+
+
+# ===================================================================
+# detect_all_coupling
+# ===================================================================
+
+
+class TestDetectAllCoupling:
+    """The fused single-pass detector must match the individual detectors."""
+
+    def test_matches_individual_detectors(self, tmp_path):
+        sp = str(tmp_path / "src" / "shared") + "/"
+        tp = str(tmp_path / "src" / "tools") + "/"
+        shared_file = _write_file(tmp_path / "src" / "shared" / "widget.ts", lines=30)
+        index_file = _write_file(tmp_path / "src" / "shared" / "index.ts", lines=5)
+        graph = {
+            str(shared_file): _graph_entry(
+                imports={f"{tp}editor/a.ts", f"{sp}index.ts"},
+                importer_count=1,
+                importers=[f"{tp}editor/a.ts"],
+            ),
+            str(index_file): _graph_entry(
+                importer_count=1, importers=[f"{tp}editor/a.ts"]
+            ),
+            f"{tp}editor/a.ts": _graph_entry(
+                imports={f"{tp}viewer/b.ts", f"{tp}editor/c.ts"},
+            ),
+            f"{tp}viewer/b.ts": _graph_entry(imports={f"{tp}editor/a.ts"}),
+        }
+        skip = {"index.ts"}
+
+        with patch(
+            "desloppify.engine.detectors.coupling.rel",
+            side_effect=lambda p: p,
+        ):
+            fused = detect_all_coupling(tmp_path, graph, sp, tp, skip_basenames=skip)
+            violations = detect_coupling_violations(tmp_path, graph, sp, tp)
+            boundary = detect_boundary_candidates(
+                tmp_path, graph, sp, tp, skip_basenames=skip
+            )
+            cross_tool = detect_cross_tool_imports(tmp_path, graph, tp)
+
+        assert fused["violations"] == violations
+        assert fused["boundary"] == boundary
+        assert fused["cross_tool"] == cross_tool
+        assert violations[1] == 2
+        assert [e["loc"] for e in boundary[0]] == [30]
+        assert cross_tool[1] == 3
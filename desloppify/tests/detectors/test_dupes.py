@@ -2,6 +2,7 @@
 
 import hashlib
 
+import desloppify.engine.detectors.dupes as dupes_mod
 from desloppify.engine.detectors.base import FunctionInfo
 from desloppify.engine.detectors.dupes import detect_duplicates
 
@@ -215,3 +216,119 @@ class TestDetectDuplicates:
         assert entries[0]["kind"] == "near-duplicate"
         assert entries[0]["similarity"] >= 0.9
         assert total == 2
+
+    def test_pairs_without_shared_lines_skip_matcher(self, monkeypatch):
+        """Same-length functions with no line in common never reach difflib."""
+        fns = [
+            _make_fn(f"fn{k}", f"{k}.py", "\n".join(f"{k}_{i}" for i in range(20)))
+            for k in "abcd"
+        ]
+
+        class _ShouldNotInstantiate:
+            def __init__(self, *_args, **_kwargs):
+                raise AssertionError("SequenceMatcher should not be created")
+
+        monkeypatch.setattr(
+            "desloppify.engine.detectors.dupes.difflib.SequenceMatcher",
+            _ShouldNotInstantiate,
+        )
+
+        entries, total = detect_duplicates(fns, threshold=0.5)
+        assert entries == []
+        assert total == 4
+
+    def test_bound_rejects_before_building_pair_keys(self, monkeypatch):
+        """Pairs the line-intersection bound rules out never build pair keys."""
+        shared = [f"common_{i}" for i in range(4)]
+        fns = [
+            _make_fn(
+                f"fn{k}",
+                f"{k}.py",
+                "\n".join(shared + [f"{k}_{i}" for i in range(16)]),
+            )
+            for k in "abc"
+        ]
+
+        calls = []
+        real_pair_key = dupes_mod._pair_key
+        monkeypatch.setattr(
+            dupes_mod,
+            "_pair_key",
+            lambda a, b: calls.append((a.name, b.name)) or real_pair_key(a, b),
+        )
+
+        entries, _ = detect_duplicates(fns, threshold=0.9)
+        assert entries == []
+        assert calls == []
+
+    def test_matcher_index_built_once_per_right_operand(self, monkeypatch):
+        """Survivors sharing a right operand reuse one b2j index."""
+        base = [f"line_{i}" for i in range(20)]
+        fns = []
+        for k in range(3):
+            body = base.copy()
+            body[k] = f"changed_{k}"
+            fns.append(_make_fn(f"fn{k}", f"{k}.py", "\n".join(body)))
+
+        seq2_calls = []
+        real_matcher = dupes_mod.difflib.SequenceMatcher
+
+        class _CountingMatcher(real_matcher):
+            def set_seq2(self, b):
+                seq2_calls.append(b)
+                super().set_seq2(b)
+
+        monkeypatch.setattr(dupes_mod.difflib, "SequenceMatcher", _CountingMatcher)
+
+        entries, _ = detect_duplicates(fns, threshold=0.8)
+        assert entries[0]["cluster_size"] == 3
+        # Three scored pairs, but only two distinct right operands (+1 for
+        # the empty initial sequence set by the constructor).
+        assert len(seq2_calls) == 3
+
+    def test_ubiquitous_lines_do_not_create_candidates(self, monkeypatch):
+        """Prefix filtering keeps lines every function shares out of the index."""
+        fns = [
+            _make_fn(
+                f"fn{k}",
+                f"{k}.py",
+                "\n".join(["}", "return x"] + [f"{k}_{i}" for i in range(18)]),
+            )
+            for k in "abcd"
+        ]
+        calls = []
+        real_overlap = dupes_mod._multiset_overlap
+        monkeypatch.setattr(
+            dupes_mod,
+            "_multiset_overlap",
+            lambda a, b: calls.append(1) or real_overlap(a, b),
+        )
+
+        entries, _ = detect_duplicates(fns, threshold=0.9)
+        assert entries == []
+        assert calls == []
+
+    def test_identical_bodies_share_one_ratio(self, monkeypatch):
+        """Copies of the same body are scored against a neighbour only once."""
+        base = [f"line_{i}" for i in range(20)]
+        variant = base.copy()
+        variant[0] = "changed"
+        fns = [
+            _make_fn("copy1", "a.py", "\n".join(base)),
+            _make_fn("copy2", "b.py", "\n".join(base)),
+            _make_fn("variant", "c.py", "\n".join(variant)),
+        ]
+
+        ratio_calls = []
+        real_matcher = dupes_mod.difflib.SequenceMatcher
+
+        class _CountingMatcher(real_matcher):
+            def ratio(self):
+                ratio_calls.append(1)
+                return super().ratio()
+
+        monkeypatch.setattr(dupes_mod.difflib, "SequenceMatcher", _CountingMatcher)
+
+        entries, _ = detect_duplicates(fns, threshold=0.8)
+        assert entries[0]["cluster_size"] == 3
+        assert len(ratio_calls) == 1
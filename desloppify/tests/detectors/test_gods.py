@@ -113,6 +113,40 @@ class TestDetectGods:
         entries, total = detect_gods([cls], _make_rules(), min_reasons=3)
         assert entries == []
 
+    def test_stops_extracting_once_min_reasons_unreachable(self):
+        """Rules left unevaluated could not have flagged the class anyway."""
+        calls = []
+        rules = [
+            GodRule(
+                name=rule.name,
+                description=rule.description,
+                extract=lambda cls, rule=rule: (
+                    calls.append(rule.name) or rule.extract(cls)
+                ),
+                threshold=rule.threshold,
+            )
+            for rule in _make_rules()
+        ]
+        cls = _make_class("Small", "a.py", loc=50)
+        entries, _ = detect_gods([cls], rules)
+        assert entries == []
+        assert calls == ["methods", "loc"]
+
+    def test_top_n_limits_to_largest(self):
+        methods = [
+            FunctionInfo(
+                name=f"m_{i}", file="a.py", line=i, end_line=i + 5, loc=5, body="pass"
+            )
+            for i in range(12)
+        ]
+        classes = [
+            _make_class(f"God{loc}", "a.py", loc=loc, methods=methods)
+            for loc in (400, 900, 600)
+        ]
+        entries, total = detect_gods(classes, _make_rules(), top_n=2)
+        assert [e["name"] for e in entries] == ["God900", "God600"]
+        assert total == 3
+
     def test_multiple_classes_mixed(self):
         methods = [
             FunctionInfo(
@@ -182,6 +182,18 @@ class TestDetectCycles:
         assert entries[0]["length"] == 10
         assert total == 10
 
+    def test_deep_chain_with_back_edge(self):
+        """Very deep DFS paths are handled without recursion limits."""
+        nodes = [f"mod_{i:05d}.py" for i in range(5000)]
+        edges = {nodes[i]: {nodes[i + 1]} for i in range(4999)}
+        edges[nodes[-1]] = {nodes[2500]}
+        graph = _make_graph(edges)
+
+        entries, total = detect_cycles(graph)
+        assert len(entries) == 1
+        assert entries[0]["files"] == nodes[2500:]
+        assert total == 5000
+
     def test_return_format(self):
         graph = _make_graph(
             {
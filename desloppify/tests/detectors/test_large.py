@@ -1,5 +1,6 @@
 """Tests for desloppify.engine.detectors.large — large file detection."""
 
+import desloppify.engine.detectors.large as large_mod
 from desloppify.engine.detectors.large import detect_large_files
 
 
@@ -115,3 +116,60 @@ class TestDetectLargeFiles:
         assert "file" in entry
         assert "loc" in entry
         assert isinstance(entry["loc"], int)
+
+    def test_many_files_counted_in_parallel(self, tmp_path):
+        """Batches large enough for the thread pool keep order and skip unreadable files."""
+        files = []
+        for i in range(40):
+            f = tmp_path / f"f{i}.py"
+            f.write_text("\n".join("x" for _ in range(i + 1)))
+            files.append(str(f))
+        files.append(str(tmp_path / "ghost.py"))
+
+        entries, total = detect_large_files(
+            tmp_path,
+            file_finder=lambda p: files,
+            threshold=35,
+        )
+        assert [e["loc"] for e in entries] == [40, 39, 38, 37, 36]
+        assert total == 41
+
+    def test_files_with_fewer_bytes_than_threshold_are_not_read(
+        self, tmp_path, monkeypatch
+    ):
+        """Line count can't exceed byte size, so tiny files skip the read."""
+        tiny = tmp_path / "tiny.py"
+        tiny.write_text("\n" * 30)
+        big = tmp_path / "big.py"
+        big.write_text("\n" * 40)
+        counted = []
+
+        def fake_count(paths):
+            counted.extend(paths)
+            return [40 for _ in paths]
+
+        monkeypatch.setattr(large_mod, "count_files_lines", fake_count)
+        entries, total = detect_large_files(
+            tmp_path,
+            file_finder=lambda p: [str(tiny), str(big)],
+            threshold=30,
+        )
+        assert counted == [big]
+        assert entries == [{"file": str(big), "loc": 40}]
+        assert total == 2
+
+    def test_top_n_matches_head_of_full_sort(self, tmp_path):
+        """top_n keeps the largest entries in the same order as the full sort."""
+        files = []
+        for i, size in enumerate([600, 900, 600, 700, 900]):
+            f = tmp_path / f"f{i}.py"
+            f.write_text("x\n" * size)
+            files.append(str(f))
+
+        full, total = detect_large_files(tmp_path, file_finder=lambda p: files)
+        top, top_total = detect_large_files(
+            tmp_path, file_finder=lambda p: files, top_n=3
+        )
+        assert top == full[:3]
+        assert [e["loc"] for e in top] == [900, 900, 700]
+        assert top_total == total == 5
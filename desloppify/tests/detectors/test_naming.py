@@ -197,6 +197,25 @@ class TestDetectNamingInconsistencies:
         assert len(entries) == 1
         assert len(entries[0]["outliers"]) <= 10
 
+    def test_outliers_are_first_ten_seen_sorted_with_full_counts(
+        self, tmp_path, monkeypatch
+    ):
+        """Counts cover every file; outliers are the first 10 encountered, sorted."""
+        kebab_files = [f"comp-{i}.tsx" for i in range(30)]
+        pascal_files = [f"Comp{i:02d}.tsx" for i in reversed(range(15))]
+        files = self._build_files(tmp_path, "src", kebab_files + pascal_files)
+
+        monkeypatch.setattr(naming_mod, "rel", lambda p: os.path.relpath(p, tmp_path))
+
+        entries, _ = detect_naming_inconsistencies(
+            tmp_path,
+            file_finder=lambda p: files,
+        )
+        entry = entries[0]
+        assert (entry["majority_count"], entry["minority_count"]) == (30, 15)
+        assert entry["total_files"] == 45
+        assert entry["outliers"] == sorted(pascal_files[:10])
+
     def test_sorted_by_minority_count_descending(self, tmp_path, monkeypatch):
         """Entries should be sorted by minority count descending."""
         # Dir 1: 15 kebab + 6 pascal
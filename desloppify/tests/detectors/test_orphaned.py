@@ -366,6 +366,41 @@ class TestDetectOrphanedFiles:
         assert total == 1
         assert entries == []  # excluded by dynamic import with alias resolution
 
+    def test_alias_resolver_runs_once_per_target(self, tmp_path):
+        """Dynamic targets are resolved once per scan, not once per file."""
+        graph = {
+            str(_write_file(tmp_path / "src" / f"mod{i}.py", lines=30)): _graph_entry(
+                importer_count=0
+            )
+            for i in range(5)
+        }
+        calls = []
+
+        def mock_alias_resolver(target):
+            calls.append(target)
+            return target.replace("@/", "src/")
+
+        with patch(
+            "desloppify.engine.detectors.orphaned.rel",
+            side_effect=lambda p: str(Path(p).relative_to(tmp_path)),
+        ):
+            entries, _ = detect_orphaned_files(
+                tmp_path,
+                graph,
+                [".py"],
+                options=OrphanedDetectionOptions(
+                    dynamic_import_finder=lambda path, exts: {"@/mod1", "@/mod3"},
+                    alias_resolver=mock_alias_resolver,
+                ),
+            )
+
+        assert sorted(calls) == ["@/mod1", "@/mod3"]
+        assert sorted(Path(e["file"]).name for e in entries) == [
+            "mod0.py",
+            "mod2.py",
+            "mod4.py",
+        ]
+
     def test_no_dynamic_finder_skips_check(self, tmp_path):
         """When dynamic_import_finder is None, dynamic check is skipped entirely."""
         f1 = _write_file(tmp_path / "orphan.py", lines=30)
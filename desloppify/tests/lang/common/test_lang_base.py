@@ -225,6 +225,22 @@ class TestStructuralSignals:
         )
         assert len(results) == 1
 
+    def test_merge_fills_missing_loc_from_files(self, tmp_path):
+        """Missing loc is counted from disk; unreadable files count as 0."""
+        (tmp_path / "a.py").write_text("x = 1\r\ny = 2\nz = 3")
+        (tmp_path / "b.py").write_text("café = 1\n\x0cpass\n", encoding="utf-8")
+        structural = {
+            str(tmp_path / name): {"signals": ["large"], "detail": {}}
+            for name in ("a.py", "b.py", "gone.py")
+        }
+        structural[str(tmp_path / "kept.py")] = {
+            "signals": ["large"],
+            "detail": {"loc": 7},
+        }
+        merge_structural_signals(structural, _noop_log)
+        locs = [data["detail"]["loc"] for data in structural.values()]
+        assert locs == [3, 3, 0, 7]
+
     def test_merge_empty_structural(self):
         """Empty structural dict produces empty results."""
         results = merge_structural_signals({}, _noop_log)
@@ -49,6 +49,49 @@ def test_load_all_uses_plugin_file_naming_convention(monkeypatch, tmp_path):
     assert len(imported) == 1
 
 
+def test_load_all_imports_plugin_files_then_packages(monkeypatch, tmp_path):
+    (tmp_path / "plugin_zig.py").write_text("# plugin placeholder\n")
+    for name in ("go", "_private", "framework", "assets", "csharp"):
+        (tmp_path / name).mkdir()
+        if name != "assets":
+            (tmp_path / name / "__init__.py").write_text("")
+
+    imported: list[str] = []
+
+    def fake_import_module(name, package=None):
+        imported.append(name)
+        return object()
+
+    monkeypatch.setattr(importlib, "import_module", fake_import_module)
+    monkeypatch.setattr(discovery_mod, "__file__", str(tmp_path / "discovery.py"))
+    monkeypatch.setattr(registry_state, "_load_attempted", False)
+    monkeypatch.setattr(registry_state, "_load_errors", {})
+
+    load_all()
+    assert imported == [".plugin_zig", ".csharp", ".go"]
+
+
+def test_load_all_scans_plugins_only_once(monkeypatch, tmp_path):
+    (tmp_path / "plugin_rust.py").write_text("# plugin placeholder\n")
+
+    imported: list[str] = []
+
+    def fake_import_module(name, package=None):
+        imported.append(name)
+        return object()
+
+    monkeypatch.setattr(importlib, "import_module", fake_import_module)
+    monkeypatch.setattr(discovery_mod, "__file__", str(tmp_path / "discovery.py"))
+    monkeypatch.setattr(registry_state, "_load_attempted", False)
+    monkeypatch.setattr(registry_state, "_load_errors", {})
+
+    load_all()
+    (tmp_path / "plugin_go.py").write_text("# added after the first scan\n")
+    load_all()
+    load_all()
+    assert imported == [".plugin_rust"]
+
+
 def test_discovery_module_exports_expected_callables():
     assert callable(discovery_mod.load_all)
     assert callable(discovery_mod.raise_load_errors)
@@ -243,6 +243,22 @@ class TestMakeFinding:
         assert f["summary"] == "sum"
 
 
+class TestIterPathScopedFindings:
+    def test_matches_path_scoped_findings(self):
+        findings = {
+            "a": {"file": "src/a.py"},
+            "b": {"file": "srcx/b.py"},
+            "c": {"file": "."},
+            "d": {"file": "src"},
+            "e": {},
+        }
+        for scan_path in (None, ".", "src", "src/"):
+            expected = state_query_mod.path_scoped_findings(findings, scan_path)
+            assert list(
+                state_query_mod.iter_path_scoped_findings(findings, scan_path)
+            ) == list(expected.values())
+
+
 # ---------------------------------------------------------------------------
 # _empty_state
 # ---------------------------------------------------------------------------
@@ -383,6 +399,16 @@ class TestSaveState:
         loaded = json.loads(p.read_text())
         assert loaded["findings"]["x"]["status"] == "open"
 
+    def test_loaded_detector_and_status_strings_are_interned(self, tmp_path):
+        p = tmp_path / "state.json"
+        st = empty_state()
+        st["findings"]["x"] = _make_raw_finding("x", detector="unused", status="fixed")
+        st["findings"]["y"] = _make_raw_finding("y", detector="unused", status="fixed")
+        save_state(st, p)
+        findings = load_state(p)["findings"]
+        assert findings["x"]["detector"] is findings["y"]["detector"]
+        assert findings["x"]["status"] is findings["y"]["status"]
+
 
 # ---------------------------------------------------------------------------
 # _upsert_findings
@@ -7,12 +7,17 @@ import re
 import sys
 import tempfile
 from collections.abc import Callable, Sequence
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from desloppify.core.internal import text_utils as _text_utils
 from desloppify.core.runtime_state import current_runtime_context
 
+count_lines = _text_utils.count_lines
+count_lines_is_exact = _text_utils.count_lines_is_exact
+count_file_lines = _text_utils.count_file_lines
+count_files_lines = _text_utils.count_files_lines
 get_area = _text_utils.get_area
 strip_c_style_comments = _text_utils.strip_c_style_comments
 
@@ -197,10 +202,27 @@ COLORS = {
 NO_COLOR = os.environ.get("NO_COLOR") is not None
 
 
+_RESET = COLORS["reset"]
+# (stream, is_tty) for the last stdout object seen; avoids an isatty() syscall
+# per colorize() call while still noticing when stdout is swapped out.
+_stdout_tty: tuple[object, bool] = (None, False)
+
+
+def _stdout_is_tty() -> bool:
+    global _stdout_tty
+    stream = sys.stdout
+    cached_stream, cached_tty = _stdout_tty
+    if stream is cached_stream:
+        return cached_tty
+    is_tty = bool(getattr(stream, "isatty", None) and stream.isatty())
+    _stdout_tty = (stream, is_tty)
+    return is_tty
+
+
 def colorize(text: str, color: str) -> str:
-    if NO_COLOR or not sys.stdout.isatty():
+    if NO_COLOR or not _stdout_is_tty():
         return str(text)
-    return f"{COLORS.get(color, '')}{text}{COLORS['reset']}"
+    return f"{COLORS.get(color, '')}{text}{_RESET}"
 
 
 c = colorize
@@ -211,21 +233,35 @@ def log(msg: str):
     print(colorize(msg, "dim"), file=sys.stderr)
 
 
-def print_table(
+def format_table(
     headers: list[str], rows: list[list[str]], widths: list[int] | None = None
-) -> None:
+) -> list[str]:
+    """Render a table as lines: bold header, dim rule, then one line per row."""
     if not rows:
-        return
+        return []
     if not widths:
         widths = [
             max(len(str(h)), *(len(str(r[i])) for r in rows))
             for i, h in enumerate(headers)
         ]
     header_line = "  ".join(h.ljust(w) for h, w in zip(headers, widths, strict=False))
-    print(colorize(header_line, "bold"))
-    print(colorize("─" * (sum(widths) + 2 * (len(widths) - 1)), "dim"))
+    lines = [
+        colorize(header_line, "bold"),
+        colorize("─" * (sum(widths) + 2 * (len(widths) - 1)), "dim"),
+    ]
     for row in rows:
-        print("  ".join(str(v).ljust(w) for v, w in zip(row, widths, strict=False)))
+        lines.append(
+            "  ".join(str(v).ljust(w) for v, w in zip(row, widths, strict=False))
+        )
+    return lines
+
+
+def print_table(
+    headers: list[str], rows: list[list[str]], widths: list[int] | None = None
+) -> None:
+    lines = format_table(headers, rows, widths)
+    if lines:
+        print("\n".join(lines))
 
 
 def display_entries(
@@ -280,12 +316,20 @@ def _safe_relpath(path: str | Path, start: str | Path) -> str:
 
 
 def rel(path: str) -> str:
+    # Relative inputs resolve against the cwd, so it is part of the cache key.
+    cwd = "" if os.path.isabs(path) else os.getcwd()
+    return _rel_cached(path, PROJECT_ROOT, cwd)
+
+
+@lru_cache(maxsize=8192)
+def _rel_cached(path: str, project_root: Path, _cwd: str) -> str:
+    """Memoised body of ``rel``; keyed on the root so reconfiguration is honoured."""
     resolved = Path(path).resolve()
     try:
-        return _normalize_path_separators(str(resolved.relative_to(PROJECT_ROOT)))
+        return _normalize_path_separators(str(resolved.relative_to(project_root)))
     except ValueError:
         # Path outside PROJECT_ROOT: prefer relative form when possible, else absolute.
-        return _normalize_path_separators(_safe_relpath(resolved, PROJECT_ROOT))
+        return _normalize_path_separators(_safe_relpath(resolved, project_root))
 
 
 def resolve_path(filepath: str) -> str: